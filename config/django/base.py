@@ -25,6 +25,7 @@ LOCAL_APPS = [
     "mung_manager.tickets.apps.TicketsConfig",
     "mung_manager.customers.apps.CustomersConfig",
     "mung_manager.reservations.apps.ReservationsConfig",
+    "mung_manager.tasks.apps.TasksConfig",
 ]
 
 THIRD_PARTY_APPS = [
@@ -42,6 +43,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.gis",
+    "django.contrib.postgres",
     *THIRD_PARTY_APPS,
     *LOCAL_APPS,
 ]
@@ -136,8 +138,12 @@ REST_FRAMEWORK = {
 }
 
 
+from config.settings.cache import *  # noqa
+from config.settings.celery import *  # noqa
 from config.settings.cors import *  # noqa
 from config.settings.files_and_storages import *  # noqa
+from config.settings.geocoding import *  # noqa
+from config.settings.http_client import *  # noqa
 from config.settings.sentry import *  # noqa
 from config.settings.jwt import *  # noqa
 from config.settings.logging import *  # noqa
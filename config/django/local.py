@@ -1,3 +1,5 @@
+import platform
+
 from config.env import env
 from config.django.base import *  # noqa
 
@@ -13,5 +15,7 @@ DATABASES = {
     },
 }
 
-GEOS_LIBRARY_PATH = env.str("GEOS_LIBRARY_PATH")
-GDAL_LIBRARY_PATH = env.str("GDAL_LIBRARY_PATH")
+# 도커 컨테이너(Linux)는 GDAL, GEOS를 시스템 경로에 설치하므로 macOS에서만 경로를 지정
+if platform.system() == "Darwin":
+    GEOS_LIBRARY_PATH = env.str("GEOS_LIBRARY_PATH")
+    GDAL_LIBRARY_PATH = env.str("GDAL_LIBRARY_PATH")
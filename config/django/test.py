@@ -15,6 +15,25 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "partner-test",
+    }
+}
+
+# 브로커 없이 테스트할 수 있도록 작업을 호출한 프로세스에서 바로 실행하며 결과는 결과 백엔드에 저장
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_EAGER_PROPAGATES = True
+CELERY_TASK_STORE_EAGER_RESULT = True
+
+# AWS S3 없이 테스트할 수 있도록 업로드 파일과 스풀 파일을 메모리에 저장
+DEFAULT_FILE_STORAGE = "django.core.files.storage.InMemoryStorage"
+FILE_UPLOAD_SPOOL_STORAGE = "django.core.files.storage.InMemoryStorage"
+
+# 카카오 주소 검색 API 없이 테스트할 수 있도록 주소로 좌표를 계산
+GEOCODING_PROVIDER = "mung_manager.pet_kindergardens.geocoders.FakeGeocodingProvider"
+
 
 if platform.system() == "Darwin":
     GEOS_LIBRARY_PATH = env.str("GEOS_LIBRARY_PATH")
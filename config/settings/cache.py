@@ -0,0 +1,16 @@
+from config.env import env
+
+# ==================================================================== #
+#                            cache config                              #
+# ==================================================================== #
+# 예약 캘린더 무효화 버전, 한국 특별일 버전 등 모든 워커가 공유해야 하는 값을 저장하므로 Redis를 사용
+# 프로세스 메모리(locmem) 캐시는 단일 프로세스로 실행하는 테스트 설정(config.django.test)에서만 사용
+CACHE_REDIS_URL = env.str("CACHE_REDIS_URL", default="redis://localhost:6379/1")
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": CACHE_REDIS_URL,
+        "KEY_PREFIX": "partner",
+    }
+}
@@ -3,7 +3,7 @@ from config.env import env, BASE_DIR
 
 FILE_MAX_SIZE = env.int("FILE_MAX_SIZE", default=10485760)  # 10 MiB
 
-DEFAULT_FILE_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
+DEFAULT_FILE_STORAGE = "mung_manager.files.storages.ContentAddressedS3Storage"
 
 AWS_S3_ACCESS_KEY_ID = env("AWS_S3_ACCESS_KEY_ID")
 AWS_S3_SECRET_ACCESS_KEY = env("AWS_S3_SECRET_ACCESS_KEY")
@@ -12,6 +12,23 @@ AWS_S3_REGION_NAME = env.str("AWS_S3_REGION_NAME")
 AWS_STORAGE_BUCKET_NAME = env.str("AWS_STORAGE_BUCKET_NAME")
 AWS_S3_URL = env("AWS_S3_URL")
 AWS_S3_OBJECT_PARAMETERS = {"CacheControl": "max-age=86400"}
+# 파일 내용의 해시를 경로로 사용하는 파일은 내용이 바뀌지 않으므로 1년 동안 재검증 없이 캐시
+# 경로가 아래 접두사로 시작하는 파일만 AWS_S3_OBJECT_PARAMETERS의 CacheControl을 대체
+AWS_S3_IMMUTABLE_PATH_PREFIXES = ["images/"]
+AWS_S3_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# 업로드 파일을 AWS S3로 옮기기 전에 임시로 저장하는 스풀 저장소
+# 웹 서버와 Celery 워커가 함께 접근할 수 있는 경로(공유 볼륨)여야 함
+FILE_UPLOAD_SPOOL_STORAGE = env.str(
+    "FILE_UPLOAD_SPOOL_STORAGE", default="django.core.files.storage.FileSystemStorage"
+)
+FILE_UPLOAD_SPOOL_ROOT = env.str("FILE_UPLOAD_SPOOL_ROOT", default=os.path.join(BASE_DIR, "spool"))
+
+# 업로드 이미지로 생성하는 파생 이미지(썸네일)의 너비와 형식
+# 원본보다 큰 너비는 원본 크기로 생성하며, WEBP를 지원하지 않는 클라이언트를 위해 JPEG도 함께 생성
+FILE_IMAGE_VARIANT_WIDTHS = env.list("FILE_IMAGE_VARIANT_WIDTHS", cast=int, default=[160, 480, 960])
+FILE_IMAGE_VARIANT_FORMATS = env.list("FILE_IMAGE_VARIANT_FORMATS", default=["WEBP", "JPEG"])
+FILE_IMAGE_VARIANT_QUALITY = env.int("FILE_IMAGE_VARIANT_QUALITY", default=80)
 
 # ==================================================================== #
 #                  file system (static) config                         #
@@ -0,0 +1,6 @@
+from config.env import env
+
+# 도로명 주소로 위도, 경도를 조회하는 제공자 (테스트에서는 네트워크 없이 FakeGeocodingProvider 사용)
+GEOCODING_PROVIDER = env.str(
+    "GEOCODING_PROVIDER", default="mung_manager.pet_kindergardens.geocoders.KakaoGeocodingProvider"
+)
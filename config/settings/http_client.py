@@ -0,0 +1,16 @@
+from config.env import env
+
+# 외부 API 호출에 사용하는 공유 HTTP 클라이언트 설정
+# 타임아웃은 (연결, 읽기) 초이며 호스트별 타임아웃이 없으면 기본 타임아웃을 사용
+HTTP_CLIENT_DEFAULT_TIMEOUT = (3, 5)
+HTTP_CLIENT_TIMEOUTS = {
+    "dapi.kakao.com": (1, 3),
+    "kauth.kakao.com": (1, 3),
+    "kapi.kakao.com": (1, 3),
+}
+HTTP_CLIENT_POOL_MAXSIZE = env.int("HTTP_CLIENT_POOL_MAXSIZE", default=10)
+HTTP_CLIENT_MAX_RETRIES = env.int("HTTP_CLIENT_MAX_RETRIES", default=2)
+
+# 호스트별 연속 실패가 임계값 이상이면 차단 시간 동안 요청하지 않고 바로 실패
+HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD = env.int("HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD", default=5)
+HTTP_CLIENT_CIRCUIT_RESET_TIMEOUT = env.int("HTTP_CLIENT_CIRCUIT_RESET_TIMEOUT", default=30)
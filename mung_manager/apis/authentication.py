@@ -1,3 +1,5 @@
+from typing import Optional
+
 from rest_framework_simplejwt.authentication import AuthUser
 from rest_framework_simplejwt.authentication import (
     JWTAuthentication as _JWTAuthentication,
@@ -5,13 +7,14 @@ from rest_framework_simplejwt.authentication import (
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import Token
-from rest_framework_simplejwt.utils import get_md5_hash_password
 
 from mung_manager.common.constants import SYSTEM_CODE
 from mung_manager.errors.exceptions import (
     AuthenticationFailedException,
     InvalidTokenException,
 )
+from mung_manager.users.caches import UserPrincipal
+from mung_manager.users.containers import UserContainer
 
 
 class JWTAuthentication(_JWTAuthentication):
@@ -19,9 +22,16 @@ class JWTAuthentication(_JWTAuthentication):
     로그인 후의 모든 인증 관련 로직은 이 클래스에서 처리됩니다.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._user_selector = UserContainer.user_selector()
+        self._user_principal_cache = UserContainer.user_principal_cache()
+
     def get_user(self, validated_token: Token) -> AuthUser:
         """유효한 토큰을 검증하고 유저 객체를 반환합니다.
 
+        유저 인증 정보는 캐시에서 조회하며, 반환되는 유저 객체의 group_ids 는 권한 검사에 사용됩니다.
+
         Args:
             validated_token (Token): JWT Token 객체
 
@@ -36,14 +46,18 @@ class JWTAuthentication(_JWTAuthentication):
                 code=SYSTEM_CODE.code("INVALID_TOKEN_AUTH_USER_IDENTIFICATION"),
             )
 
-        try:
-            user = self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
-        except self.user_model.DoesNotExist:
+        principal = self._user_principal_cache.get_or_set(
+            user_id=user_id,
+            default=lambda: self._get_user_principal(user_id),
+        )
+        if principal is None:
             raise AuthenticationFailedException(
                 detail=SYSTEM_CODE.message("NOT_FOUND_AUTH_USER"),
                 code=SYSTEM_CODE.code("NOT_FOUND_AUTH_USER"),
             )
 
+        user = principal.to_user()
+
         if user.is_active is False:
             raise AuthenticationFailedException(
                 detail=SYSTEM_CODE.message("INACTIVE_AUTH_USER"),
@@ -51,7 +65,7 @@ class JWTAuthentication(_JWTAuthentication):
             )
 
         if api_settings.CHECK_REVOKE_TOKEN:
-            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != principal.password_digest:
                 raise AuthenticationFailedException(
                     detail=SYSTEM_CODE.message("REVOKE_TOKEN_AUTH_USER"),
                     code=SYSTEM_CODE.code("REVOKE_TOKEN_AUTH_USER"),
@@ -65,6 +79,12 @@ class JWTAuthentication(_JWTAuthentication):
 
         return user
 
+    def _get_user_principal(self, user_id: int) -> Optional[UserPrincipal]:
+        user = self._user_selector.get_by_id_with_group_ids(user_id)
+        if user is None:
+            return None
+        return UserPrincipal.from_user(user=user, group_ids=user.group_ids)
+
     def get_validated_token(self, raw_token: bytes) -> Token:
         """이 함수는 토큰을 검증합니다.
 
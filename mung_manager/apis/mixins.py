@@ -4,7 +4,11 @@ from rest_framework.authentication import BaseAuthentication
 from rest_framework.permissions import BasePermission
 
 from mung_manager.apis.authentication import JWTAuthentication
-from mung_manager.apis.permissions import IsPartnerPermission
+from mung_manager.apis.permissions import (
+    IsPartnerPermission,
+    IsPetKindergardenOwnerPermission,
+)
+from mung_manager.pet_kindergardens.tenants import PetKindergardenTenant
 
 if TYPE_CHECKING:
     from rest_framework.permissions import _PermissionClass
@@ -20,4 +24,15 @@ class APIAuthMixin:
     authentication_classes: Sequence[Type[BaseAuthentication]] = [
         JWTAuthentication,
     ]
-    permission_classes: PermissionClassesType = (IsPartnerPermission,)
+    permission_classes: PermissionClassesType = (
+        IsPartnerPermission,
+        IsPetKindergardenOwnerPermission,
+    )
+
+    def get_tenant(self) -> PetKindergardenTenant:
+        """이 함수는 권한 검사에서 소유 여부가 확인된 반려동물 유치원 테넌트를 반환합니다.
+
+        Returns:
+            PetKindergardenTenant: 반려동물 유치원 테넌트
+        """
+        return self.request.tenant  # type: ignore
@@ -1,15 +1,29 @@
+import base64
+import binascii
+import json
 from collections import OrderedDict
-from typing import Any
+from typing import Any, Optional
 
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+from rest_framework.pagination import BasePagination
 from rest_framework.pagination import CursorPagination as _CursorPagination
 from rest_framework.pagination import LimitOffsetPagination as _LimitOffsetPagination
 from rest_framework.pagination import PageNumberPagination as _PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from mung_manager.common.constants import SYSTEM_CODE
+from mung_manager.errors.exceptions import InvalidParameterFormatException
 
 
 def get_paginated_data(*, pagination_class, serializer_class, queryset, request, view):
     """이 함수는 API 응답에 필요한 페이징된 데이터를 생성합니다.
 
+    API 마다 pagination_class 로 LimitOffsetPagination, CursorPagination, KeysetPagination 등을 선택할 수 있습니다.
+
     Args:
         pagination_class (class): 페이징 클래스입니다.
         serializer_class (class): 시리얼라이저 클래스입니다.
@@ -164,3 +178,187 @@ class PageNumberPagination(_PageNumberPagination):
                 "results": {"type": "array", "items": schema, "description": "검색 결과 리스트"},
             },
         }
+
+
+class KeysetPagination(BasePagination):
+    """이 클래스는 정렬 필드 값을 커서로 사용하는 키셋(seek) 페이징입니다.
+
+    OFFSET 없이 마지막으로 조회한 행의 정렬 값 이후만 조회하므로 뒤 페이지로 갈수록 느려지지 않습니다.
+    ordering 은 ("-id",) 또는 ("-created_at", "-id") 와 같이 유일한 필드로 끝나야 하며,
+    ("-rank", "-id") 와 같이 쿼리셋의 어노테이션으로 정렬할 수도 있습니다.
+    실수 어노테이션은 커서의 float 값과 정확히 비교되도록 double precision(FloatField로 Cast)이어야 합니다.
+    커서는 정렬 값을 인코딩한 불투명한 문자열입니다.
+
+    전체 개수는 count_mode 에 따라 조회합니다.
+        - None: 조회하지 않음
+        - "approximate": PostgreSQL 통계(pg_class.reltuples) 또는 실행 계획의 예상 행 수
+        - "exact": COUNT(*)
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 10
+    max_page_size = 100
+    ordering: tuple[str, ...] = ("-id",)
+    count_mode: Optional[str] = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.count = self._get_count(queryset)
+
+        page_size = self._get_page_size(request)
+        position, is_reversed = self._decode_cursor(request)
+
+        ordering = self._get_ordering(is_reversed)
+        if position is not None:
+            queryset = queryset.filter(self._get_seek_filter(queryset.model, position, is_reversed))
+
+        # 다음 페이지 존재 여부를 확인하기 위해 한 개를 더 조회
+        results = list(queryset.order_by(*ordering)[: page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+
+        if is_reversed:
+            results.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_data(self, data):
+        return OrderedDict(
+            [
+                ("count", self.count),
+                ("next", self.get_next_link()),
+                ("previous", self.get_previous_link()),
+                ("results", data),
+            ]
+        )
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "count": {"type": "integer", "name": "전체 데이터 개수 (count_mode 에 따라 정확한 값, 추정치 또는 null)"},
+                "next": {"type": "string", "name": "다음 페이지의 cursor URL"},
+                "previous": {"type": "string", "name": "이전 페이지의 cursor URL"},
+                "results": {"type": "array", "items": schema, "description": "검색 결과 리스트"},
+            },
+        }
+
+    def get_next_link(self) -> Optional[str]:
+        if self.has_next is False or len(self.page) == 0:
+            return None
+        return self._get_link(self.page[-1], is_reversed=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if self.has_previous is False:
+            return None
+        if len(self.page) == 0:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self._get_link(self.page[0], is_reversed=True)
+
+    def _get_link(self, instance, is_reversed: bool) -> str:
+        position = [getattr(instance, field.lstrip("-")) for field in self.ordering]
+        cursor = json.dumps({"p": position, "r": is_reversed}, cls=DjangoJSONEncoder)
+        encoded = base64.urlsafe_b64encode(cursor.encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _decode_cursor(self, request) -> tuple[Optional[list], bool]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")).decode("utf-8"))
+            position, is_reversed = cursor["p"], bool(cursor["r"])
+        except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+            raise InvalidParameterFormatException(
+                detail=SYSTEM_CODE.message("INVALID_CURSOR"),
+                code=SYSTEM_CODE.code("INVALID_CURSOR"),
+            )
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise InvalidParameterFormatException(
+                detail=SYSTEM_CODE.message("INVALID_CURSOR"),
+                code=SYSTEM_CODE.code("INVALID_CURSOR"),
+            )
+        return position, is_reversed
+
+    def _get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def _get_ordering(self, is_reversed: bool) -> list[str]:
+        if is_reversed is False:
+            return list(self.ordering)
+        return [field[1:] if field.startswith("-") else f"-{field}" for field in self.ordering]
+
+    def _get_seek_filter(self, model, position: list, is_reversed: bool) -> Q:
+        # (a, b) < (x, y) 를 a < x OR (a = x AND b < y) 로 풀어서 정렬 방향이 섞인 경우도 처리
+        values = []
+        for field, value in zip(self.ordering, position):
+            try:
+                values.append(model._meta.get_field(field.lstrip("-")).to_python(value))
+            except FieldDoesNotExist:
+                # 어노테이션은 모델 필드가 아니므로 JSON으로 복원된 값을 그대로 비교
+                if not isinstance(value, (int, float, str)):
+                    raise InvalidParameterFormatException(
+                        detail=SYSTEM_CODE.message("INVALID_CURSOR"),
+                        code=SYSTEM_CODE.code("INVALID_CURSOR"),
+                    )
+                values.append(value)
+            except ValidationError:
+                raise InvalidParameterFormatException(
+                    detail=SYSTEM_CODE.message("INVALID_CURSOR"),
+                    code=SYSTEM_CODE.code("INVALID_CURSOR"),
+                )
+
+        seek_filter = Q()
+        for index, field in enumerate(self.ordering):
+            is_descending = field.startswith("-") is not is_reversed
+            lookup = "lt" if is_descending else "gt"
+            equals = {self.ordering[i].lstrip("-"): values[i] for i in range(index)}
+            seek_filter |= Q(**equals, **{f"{field.lstrip('-')}__{lookup}": values[index]})
+        return seek_filter
+
+    def _get_count(self, queryset) -> Optional[int]:
+        if self.count_mode == "exact":
+            return queryset.count()
+        if self.count_mode == "approximate":
+            return self._get_approximate_count(queryset)
+        return None
+
+    def _get_approximate_count(self, queryset) -> int:
+        # 조건이 없으면 테이블 통계를, 조건이 있으면 실행 계획의 예상 행 수를 사용하여 COUNT(*)를 실행하지 않음
+        with connections[queryset.db].cursor() as cursor:
+            if not queryset.query.where:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+                # 통계가 수집되지 않은 테이블은 -1을 반환
+                if row is not None and row[0] >= 0:
+                    return row[0]
+
+            sql, params = queryset.order_by().query.sql_with_params()
+            cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+            plan = cursor.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
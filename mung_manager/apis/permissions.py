@@ -2,6 +2,7 @@ from rest_framework import permissions
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
+from mung_manager.pet_kindergardens.containers import PetKindergardenContainer
 from mung_manager.users.containers import UserContainer
 from mung_manager.users.enums import AuthGroup
 
@@ -23,6 +24,11 @@ class IsPartnerPermission(permissions.BasePermission):
             bool: 유저의 권한이 사장님이면 True, 아니면 False를 반환
         """
         try:
+            # 인증 시 캐시된 그룹 아이디가 있으면 DB를 조회하지 않음
+            group_ids = getattr(request.user, "group_ids", None)
+            if group_ids is not None:
+                return AuthGroup.PARTNER.value in group_ids
+
             if self._group_selector.exists_by_id_and_user(AuthGroup.PARTNER.value, request.user):
                 return True
 
@@ -30,3 +36,33 @@ class IsPartnerPermission(permissions.BasePermission):
 
         except Exception:
             return False
+
+
+class IsPetKindergardenOwnerPermission(permissions.BasePermission):
+
+    def __init__(self):
+        super().__init__()
+        self._pet_kindergarden_tenant_resolver = PetKindergardenContainer.pet_kindergarden_tenant_resolver()
+
+    def has_permission(self, request: Request, view: APIView):
+        """이 함수는 반려동물 유치원 하위 API에 적용되며, 유저가 반려동물 유치원을 소유하고 있는지 확인합니다.
+
+        확인된 반려동물 유치원은 request.tenant 에 저장되며 API와 서비스는 소유 여부를 다시 조회하지 않습니다.
+        소유하지 않은 반려동물 유치원인 경우 NOT_FOUND_PET_KINDERGARDEN 예외를 발생시킵니다.
+
+        Args:
+            request (Request): Request 객체
+            view (APIView): APIView 객체
+
+        Returns:
+            bool: 반려동물 유치원 하위 API가 아니거나 유저가 반려동물 유치원을 소유하고 있으면 True를 반환
+        """
+        pet_kindergarden_id = view.kwargs.get("pet_kindergarden_id")
+        if pet_kindergarden_id is None:
+            return True
+
+        request.tenant = self._pet_kindergarden_tenant_resolver.resolve(
+            pet_kindergarden_id=pet_kindergarden_id,
+            user=request.user,
+        )
+        return True
@@ -2,15 +2,27 @@ from dependency_injector import containers, providers
 
 from mung_manager.authentication.services.auth import AuthService
 from mung_manager.authentication.services.kakao_oauth import KakaoLoginFlowService
+from mung_manager.common.http import get_http_client
+from mung_manager.users.caches import UserPrincipalCache
 
 
 class AuthenticationContainer(containers.DeclarativeContainer):
     """이 클래스는 DI(Dependency Injection) 인증 컨테이너 입니다.
 
     Attributes:
+        http_client: 외부 API 호출에 사용하는 공유 HTTP 클라이언트
         auth_service: 인증 서비스
         kakao_login_flow_service: 카카오 로그인 플로우 서비스
+        user_principal_cache: 유저 인증 정보 캐시
     """
 
-    auth_service = providers.Factory(AuthService)
-    kakao_login_flow_service = providers.Factory(KakaoLoginFlowService)
+    user_principal_cache = providers.Factory(UserPrincipalCache)
+    auth_service = providers.Factory(
+        AuthService,
+        user_principal_cache=user_principal_cache,
+    )
+    http_client = providers.Factory(get_http_client)
+    kakao_login_flow_service = providers.Factory(
+        KakaoLoginFlowService,
+        http_client=http_client,
+    )
@@ -5,12 +5,16 @@ from rest_framework_simplejwt.tokens import RefreshToken
 
 from mung_manager.authentication.services.abstracts import AbstractAuthService
 from mung_manager.errors.exceptions import AuthenticationFailedException
+from mung_manager.users.caches import UserPrincipalCache
 from mung_manager.users.models import User
 
 
 class AuthService(AbstractAuthService):
     """이 클래스는 인증과 관련된 비즈니스 로직을 담당합니다."""
 
+    def __init__(self, user_principal_cache: UserPrincipalCache):
+        self._user_principal_cache = user_principal_cache
+
     def generate_token(self, user: User) -> Tuple[str, str]:
         """이 함수는 유저로 refresh_token과 access_token을 생성합니다.
 
@@ -43,4 +47,7 @@ class AuthService(AbstractAuthService):
         user.last_login = timezone.now()
         user.save(update_fields=["last_login", "is_deleted", "deleted_at"])
 
+        # 탈퇴 후 재로그인한 경우 캐시된 삭제 여부가 남아있지 않도록 무효화
+        self._user_principal_cache.delete(user.id)
+
         return user
@@ -11,6 +11,7 @@ from mung_manager.authentication.services.abstracts import (
     KakaoAccessToken,
     KakaoLoginCredentials,
 )
+from mung_manager.common.http import HttpClient
 from mung_manager.errors.exceptions import AuthenticationFailedException
 
 
@@ -28,8 +29,9 @@ class KakaoLoginFlowService(AbstractKakaoLoginFlowService):
     KAKAO_ACCESS_TOKEN_OBTAIN_URL = "https://kauth.kakao.com/oauth/token"
     KAKAO_USER_INFO_URL = "https://kapi.kakao.com/v2/user/me"
 
-    def __init__(self):
+    def __init__(self, http_client: HttpClient):
         self._credentials = kakao_login_get_credentials()
+        self._http_client = http_client
 
     def get_token(self, code: str, redirect_uri: str) -> KakaoAccessToken:
         """이 함수는 클라이언트로부터 받은 code와 redirect_uri 이용하여 카카오 토큰 서버로부터 토큰을 얻습니다.
@@ -48,7 +50,10 @@ class KakaoLoginFlowService(AbstractKakaoLoginFlowService):
             "client_secret": self._credentials.client_secret,
             "code": code,
         }
-        response = requests.post(self.KAKAO_ACCESS_TOKEN_OBTAIN_URL, data=data)
+        try:
+            response = self._http_client.post(self.KAKAO_ACCESS_TOKEN_OBTAIN_URL, data=data)
+        except requests.RequestException:
+            raise AuthenticationFailedException("Failed to get access token from Kakao.")
 
         if response.status_code != 200:
             raise AuthenticationFailedException("Failed to get access token from Kakao.")
@@ -66,10 +71,13 @@ class KakaoLoginFlowService(AbstractKakaoLoginFlowService):
             Dict[str, Any]: 카카오 유저 정보
         """
         access_token = kakao_token.access_token
-        response = requests.get(
-            self.KAKAO_USER_INFO_URL,
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
+        try:
+            response = self._http_client.get(
+                self.KAKAO_USER_INFO_URL,
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+        except requests.RequestException:
+            raise AuthenticationFailedException("Failed to get user info from Kakao.")
 
         if response.status_code != 200:
             raise AuthenticationFailedException("Failed to get user info from Kakao.")
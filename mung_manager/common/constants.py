@@ -26,12 +26,21 @@ class SYSTEM_CODE:
         "not_implemented",
         "This feature is not implemented yet.",
     )
+    SERVICE_UNAVAILABLE = (
+        "service_unavailable",
+        "The service is temporarily unavailable, please try again later.",
+    )
 
     # Common code
     INVALID_PHONE_NUMBER = (
         "validation_failed",
         "Enter a valid phone number (e.g. 010-0000-0000)",
     )
+    INVALID_CURSOR = ("invalid_parameter_format", "Invalid cursor.")
+    TASK_ENQUEUE_FAILED = (
+        "service_unavailable",
+        "Failed to start the background task, please try again later.",
+    )
 
     # Auth code
     NOT_FOUND_AUTH_USER = ("authentication_failed", "User not found")
@@ -117,10 +126,26 @@ class SYSTEM_CODE:
         "validation_failed",
         "Csv file phone number is duplicated.",
     )
+    INVALID_CSV_FILE_FORMAT = (
+        "validation_failed",
+        "Csv file must be a UTF-8 encoded csv file.",
+    )
+    REQUIRED_CSV_ROW_VALUE = (
+        "validation_failed",
+        "Csv row must have a name, phone number and pet names.",
+    )
+    TOO_LONG_CSV_ROW_VALUE = (
+        "validation_failed",
+        "Csv row name and pet names must be 32 characters or fewer.",
+    )
 
     # Customer code
     UNIQUE_PET_NAME = ("unique_pet_name", "Customer pet names must be unique.")
     NOT_FOUND_CUSTOMER = ("not_found_customer", "Customer does not exist.")
+    NOT_FOUND_CUSTOMER_IMPORT_JOB = (
+        "not_found_customer_import_job",
+        "Customer import job does not exist.",
+    )
     INACTIVE_CUSTOMER = ("inactive_customer", "Customer is inactive.")
     NOT_FOUND_CUSTOMER_PET = (
         "not_found_customer_pet",
@@ -0,0 +1,156 @@
+import functools
+import threading
+import time
+from typing import Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+Timeout = Union[float, tuple[float, float]]
+
+
+class CircuitBreakerOpenError(requests.ConnectionError):
+    """차단된 호스트로 요청하여 요청을 보내지 않고 실패한 경우 발생하는 예외입니다."""
+
+
+class CircuitBreaker:
+    """이 클래스는 한 호스트의 연속 실패 횟수로 요청 차단 여부를 결정합니다.
+
+    연속 실패가 failure_threshold 이상이면 reset_timeout 동안 요청을 차단하며,
+    차단 시간이 지나면 요청을 다시 허용하여 성공하면 해제하고 실패하면 다시 차단합니다.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failure_count = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def before_request(self, host: str) -> None:
+        with self._lock:
+            if self._opened_at is not None and time.monotonic() - self._opened_at < self._reset_timeout:
+                raise CircuitBreakerOpenError(f"Circuit breaker is open: {host}")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failure_count = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failure_count += 1
+            if self._failure_count >= self._failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class HttpClient:
+    """이 클래스는 외부 API 호출에 사용하는 공유 HTTP 클라이언트입니다.
+
+    호스트별 연결을 풀에 유지하여 재사용하며, 요청마다 호스트별 타임아웃을 적용합니다.
+    연결 실패와 일시적인 서버 오류(502, 503, 504)는 지터를 포함한 지수 백오프로 최대 max_retries번 재시도하고,
+    POST 등 멱등하지 않은 요청은 요청을 보내기 전의 연결 실패만 재시도합니다.
+    재시도 후에도 실패하면 호스트의 서킷 브레이커에 기록하여 장애가 난 호스트로의 요청을 바로 실패시킵니다.
+    """
+
+    RETRY_STATUS_CODES = (502, 503, 504)
+
+    def __init__(
+        self,
+        default_timeout: Timeout,
+        timeouts: dict[str, Timeout],
+        pool_maxsize: int,
+        max_retries: int,
+        circuit_failure_threshold: int,
+        circuit_reset_timeout: float,
+    ):
+        self._default_timeout = default_timeout
+        self._timeouts = timeouts
+        self._circuit_failure_threshold = circuit_failure_threshold
+        self._circuit_reset_timeout = circuit_reset_timeout
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.2,
+            backoff_max=2,
+            backoff_jitter=0.2,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            # Retry-After 만큼 기다리면 요청 시간이 타임아웃보다 길어질 수 있으므로 무시
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """이 함수는 HTTP 요청을 보내고 응답을 반환합니다.
+
+        Args:
+            method (str): HTTP 메서드
+            url (str): 요청 URL
+            **kwargs: requests.Session.request 인자이며 timeout이 없으면 호스트별 타임아웃을 사용
+
+        Returns:
+            requests.Response: 응답
+
+        Raises:
+            CircuitBreakerOpenError: 호스트가 차단된 경우
+            requests.RequestException: 연결 실패, 타임아웃 등 요청에 실패한 경우
+        """
+        host = urlsplit(url).hostname or ""
+        circuit_breaker = self._get_circuit_breaker(host)
+        circuit_breaker.before_request(host)
+
+        kwargs.setdefault("timeout", self._timeouts.get(host, self._default_timeout))
+        try:
+            response = self._session.request(method, url, **kwargs)
+        except requests.RequestException:
+            circuit_breaker.record_failure()
+            raise
+
+        if response.status_code >= 500:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def _get_circuit_breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            if host not in self._circuit_breakers:
+                self._circuit_breakers[host] = CircuitBreaker(
+                    failure_threshold=self._circuit_failure_threshold,
+                    reset_timeout=self._circuit_reset_timeout,
+                )
+            return self._circuit_breakers[host]
+
+
+@functools.cache
+def get_http_client() -> HttpClient:
+    """이 함수는 프로세스에서 공유하는 HTTP 클라이언트를 반환합니다.
+
+    연결 풀과 서킷 브레이커 상태를 공유해야 하므로 프로세스마다 같은 인스턴스를 사용합니다.
+
+    Returns:
+        HttpClient: HTTP 클라이언트
+    """
+    return HttpClient(
+        default_timeout=settings.HTTP_CLIENT_DEFAULT_TIMEOUT,
+        timeouts=settings.HTTP_CLIENT_TIMEOUTS,
+        pool_maxsize=settings.HTTP_CLIENT_POOL_MAXSIZE,
+        max_retries=settings.HTTP_CLIENT_MAX_RETRIES,
+        circuit_failure_threshold=settings.HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD,
+        circuit_reset_timeout=settings.HTTP_CLIENT_CIRCUIT_RESET_TIMEOUT,
+    )
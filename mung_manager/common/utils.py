@@ -1,3 +1,4 @@
+import datetime as dt
 import uuid
 from typing import Type
 
@@ -40,6 +41,44 @@ def inline_serializer(*, fields: dict, data: dict | None = None, **kwargs) -> se
     return serializer_class(**kwargs)
 
 
+######################################################
+# Date window utils
+######################################################
+def day_window(date: dt.date) -> tuple[dt.datetime, dt.datetime]:
+    """이 함수는 날짜를 [해당일 00:00, 다음날 00:00) 반열린 구간으로 변환합니다.
+
+    컬럼에 __date 같은 함수를 적용하면 인덱스를 사용할 수 없으므로
+    `column__gte=start, column__lt=end` 형태의 범위 조건을 만들 때 사용합니다.
+
+    Args:
+        date (date): 날짜
+
+    Returns:
+        tuple[datetime, datetime]: (시작 일시, 종료 일시) 이며 종료 일시는 포함하지 않음
+    """
+    start_at = dt.datetime.combine(date, dt.time.min)
+    return start_at, start_at + dt.timedelta(days=1)
+
+
+def month_window(year: int, month: int) -> tuple[dt.datetime, dt.datetime]:
+    """이 함수는 년도와 월을 [해당월 1일 00:00, 다음달 1일 00:00) 반열린 구간으로 변환합니다.
+
+    __year, __month 조건 대신 인덱스를 사용할 수 있는 범위 조건을 만들 때 사용하며,
+    DateField 컬럼에 사용하면 날짜로 변환되어 비교됩니다.
+
+    Args:
+        year (int): 년도
+        month (int): 월
+
+    Returns:
+        tuple[datetime, datetime]: (시작 일시, 종료 일시) 이며 종료 일시는 포함하지 않음
+    """
+    start_at = dt.datetime(year, month, 1)
+    if month == 12:
+        return start_at, dt.datetime(year + 1, 1, 1)
+    return start_at, dt.datetime(year, month + 1, 1)
+
+
 ######################################################
 # Common utils
 ######################################################
@@ -1,6 +1,11 @@
 import django_filters
+from django.db.models import Exists, OuterRef, QuerySet
 
-from mung_manager.customers.models import Customer
+from mung_manager.customers.models import Customer, CustomerPet
+from mung_manager.customers.search import (
+    get_phone_number_digits,
+    get_phone_number_keyword_digits,
+)
 
 
 class CustomerFilter(django_filters.FilterSet):
@@ -8,14 +13,14 @@ class CustomerFilter(django_filters.FilterSet):
 
     Attributes:
         customer_name (django_filters.CharFilter): 고객 이름 필터
-        customer_phone_number (django_filters.CharFilter): 고객 전화번호 필터
-        customer_pet_name (django_filters.CharFilter): 고객 반려동물 이름 필터
+        customer_phone_number (django_filters.CharFilter): 고객 전화번호 필터 ('-' 위치와 관계없이 숫자 조각으로 검색)
+        customer_pet_name (django_filters.CharFilter): 삭제되지 않은 고객 반려동물 이름 필터
         is_active (django_filters.BooleanFilter): 고객 활성화 여부 필터
     """
 
     customer_name = django_filters.CharFilter(field_name="name", lookup_expr="icontains")
-    customer_phone_number = django_filters.CharFilter(field_name="phone_number", lookup_expr="icontains")
-    customer_pet_name = django_filters.CharFilter(field_name="customer_pets__name", lookup_expr="icontains")
+    customer_phone_number = django_filters.CharFilter(method="filter_customer_phone_number")
+    customer_pet_name = django_filters.CharFilter(method="filter_customer_pet_name")
     is_active = django_filters.BooleanFilter(field_name="is_active")
 
     class Meta:
@@ -26,3 +31,23 @@ class CustomerFilter(django_filters.FilterSet):
             "customer_pet_name",
             "is_active",
         ]
+
+    def filter_customer_phone_number(self, queryset: QuerySet[Customer], name: str, value: str) -> QuerySet[Customer]:
+        digits = get_phone_number_keyword_digits(value)
+        if digits is None:
+            return queryset.none()
+        return queryset.alias(phone_number_digits=get_phone_number_digits()).filter(
+            phone_number_digits__contains=digits
+        )
+
+    def filter_customer_pet_name(self, queryset: QuerySet[Customer], name: str, value: str) -> QuerySet[Customer]:
+        # 반려동물을 조인하면 반려동물 수만큼 고객이 중복되므로 EXISTS로 검색
+        return queryset.filter(
+            Exists(
+                CustomerPet.objects.filter(
+                    customer_id=OuterRef("id"),
+                    name__icontains=value,
+                    is_deleted=False,
+                )
+            )
+        )
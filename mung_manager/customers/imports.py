@@ -0,0 +1,180 @@
+import csv
+import io
+from typing import Any, Iterator, NamedTuple, Optional, Union
+
+from django.core.exceptions import ValidationError
+from django.core.files import File
+
+from mung_manager.common.constants import SYSTEM_CODE
+from mung_manager.common.validators import (
+    InvalidPhoneNumberValidator,
+    UniquePetNameValidator,
+)
+from mung_manager.customers.models import Customer, CustomerPet
+
+
+class CustomerCsvRow(NamedTuple):
+    """이 클래스는 검증을 통과한 CSV 고객 행입니다.
+
+    Attributes:
+        row_number (int): CSV 파일의 행 번호 (1부터 시작)
+        name (str): 고객 이름
+        phone_number (str): 고객 전화번호
+        pet_names (list[str]): 고객 반려동물 이름 리스트
+    """
+
+    row_number: int
+    name: str
+    phone_number: str
+    pet_names: list[str]
+
+
+class CustomerCsvImportError(NamedTuple):
+    """이 클래스는 등록하지 못한 CSV 행의 오류입니다.
+
+    Attributes:
+        row_number (int): CSV 파일의 행 번호 (1부터 시작)
+        code (str): 오류 코드
+        message (str): 오류 메시지
+    """
+
+    row_number: int
+    code: str
+    message: str
+
+    @classmethod
+    def from_system_code(cls, row_number: int, system_code: str) -> "CustomerCsvImportError":
+        return cls(
+            row_number=row_number,
+            code=SYSTEM_CODE.code(system_code),
+            message=SYSTEM_CODE.message(system_code),
+        )
+
+
+class CustomerCsvImportResult(NamedTuple):
+    """이 클래스는 CSV 고객 일괄 등록 결과입니다.
+
+    Attributes:
+        created_count (int): 등록된 고객 수
+        error_count (int): 등록하지 못한 행 수
+        errors (list[CustomerCsvImportError]): 행 번호순 오류 리스트이며 최대 개수까지만 포함
+    """
+
+    created_count: int
+    error_count: int
+    errors: list[CustomerCsvImportError]
+
+    def to_progress(self) -> dict[str, int]:
+        return {
+            "processed_row_count": self.created_count + self.error_count,
+            "created_count": self.created_count,
+            "error_count": self.error_count,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "created_count": self.created_count,
+            "error_count": self.error_count,
+            "errors": [error._asdict() for error in self.errors],
+        }
+
+
+class CustomerImportJobState(NamedTuple):
+    """이 클래스는 고객 일괄 등록 작업의 진행 상태입니다.
+
+    Attributes:
+        status (str): Celery 작업 상태 (PENDING, PROGRESS, SUCCESS, FAILURE 등)
+        progress (Optional[dict]): 처리 중인 경우 처리한 행 수, 등록된 고객 수, 오류 수
+        result (Optional[dict]): 완료된 경우 등록 결과 (CustomerCsvImportResult.to_dict)
+    """
+
+    status: str
+    progress: Optional[dict]
+    result: Optional[dict]
+
+
+class CustomerCsvReader:
+    """이 클래스는 업로드된 CSV 파일을 한 줄씩 읽어 고객 행을 청크 단위로 반환합니다.
+
+    파일 전체를 메모리에 올리지 않고 업로드 파일(메모리 또는 임시 파일)을 스트리밍으로 디코딩하며,
+    행 단위로 검증할 수 있는 값(빈 값, 길이, 전화번호 형식, 반려동물 이름 중복)만 검증합니다.
+    파일 내 전화번호 중복과 기존 고객 여부는 여러 행을 함께 보아야 하므로 호출한 쪽에서 검증합니다.
+
+    CSV 파일은 UTF-8로 인코딩되어야 하며 앞의 HEADER_ROW_COUNT개 행은 양식의 안내 문구로 간주합니다.
+    """
+
+    HEADER_ROW_COUNT = 3
+
+    def __init__(self, csv_file: File, chunk_size: int):
+        self._csv_file = csv_file
+        self._chunk_size = chunk_size
+        self._phone_number_validator = InvalidPhoneNumberValidator()
+        self._unique_pet_name_validator = UniquePetNameValidator()
+        self._name_max_length = Customer._meta.get_field("name").max_length
+        self._pet_name_max_length = CustomerPet._meta.get_field("name").max_length
+
+    def read_chunks(self) -> Iterator[list[Union[CustomerCsvRow, CustomerCsvImportError]]]:
+        """이 함수는 CSV 파일을 읽어 최대 chunk_size개의 행 또는 행 오류를 묶어서 반환합니다.
+
+        디코딩할 수 없는 행을 만나면 해당 행의 오류를 반환하고 읽기를 중단합니다.
+
+        Yields:
+            list[Union[CustomerCsvRow, CustomerCsvImportError]]: 행 또는 행 오류 리스트
+        """
+        chunk: list[Union[CustomerCsvRow, CustomerCsvImportError]] = []
+        # BOM이 포함된 UTF-8(엑셀에서 저장한 CSV)도 읽을 수 있도록 utf-8-sig 사용
+        with io.TextIOWrapper(self._csv_file.file, encoding="utf-8-sig", newline="") as text_file:
+            reader = csv.reader(text_file)
+            try:
+                for index, row in enumerate(reader):
+                    if index < self.HEADER_ROW_COUNT:
+                        continue
+
+                    parsed_row = self._parse_row(reader.line_num, row)
+                    if parsed_row is None:
+                        continue
+
+                    chunk.append(parsed_row)
+                    if len(chunk) >= self._chunk_size:
+                        yield chunk
+                        chunk = []
+            except (UnicodeDecodeError, csv.Error):
+                chunk.append(
+                    CustomerCsvImportError.from_system_code(reader.line_num + 1, "INVALID_CSV_FILE_FORMAT")
+                )
+
+        if chunk:
+            yield chunk
+
+    def _parse_row(self, row_number: int, row: list[str]) -> Union[CustomerCsvRow, CustomerCsvImportError, None]:
+        name, phone_number, pet_data = (list(map(str.strip, row[:3])) + ["", "", ""])[:3]
+
+        # 양식의 빈 행은 오류 없이 건너뜀
+        if not any([name, phone_number, pet_data]):
+            return None
+
+        pet_names = [pet_name.strip() for pet_name in pet_data.split(",")]
+        if not all([name, phone_number, *pet_names]):
+            return CustomerCsvImportError.from_system_code(row_number, "REQUIRED_CSV_ROW_VALUE")
+
+        if len(name) > self._name_max_length or any(
+            len(pet_name) > self._pet_name_max_length for pet_name in pet_names
+        ):
+            return CustomerCsvImportError.from_system_code(row_number, "TOO_LONG_CSV_ROW_VALUE")
+
+        try:
+            self._phone_number_validator(phone_number)
+        except ValidationError:
+            return CustomerCsvImportError.from_system_code(row_number, "INVALID_PHONE_NUMBER")
+
+        try:
+            self._unique_pet_name_validator(pet_names)
+        except ValidationError:
+            return CustomerCsvImportError.from_system_code(row_number, "UNIQUE_PET_NAME")
+
+        return CustomerCsvRow(
+            row_number=row_number,
+            name=name,
+            phone_number=phone_number,
+            pet_names=pet_names,
+        )
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from mung_manager.customers.containers import CustomerContainer
+from mung_manager.customers.models import Customer
+
+
+class Command(BaseCommand):
+    help = "취소되지 않은 예약으로 모든 고객의 최근 예약 일시와 예약 횟수를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 갱신할 고객 수")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        customer_service = CustomerContainer.customer_service()
+
+        # 고객 아이디 순으로 나누어 갱신하여 한 번에 잠그는 행 수를 제한
+        last_customer_id = 0
+        updated_count = 0
+        while True:
+            customer_ids = list(
+                Customer.objects.filter(id__gt=last_customer_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not customer_ids:
+                break
+
+            updated_count += customer_service.refresh_reservation_summaries(customer_ids=customer_ids)
+            last_customer_id = customer_ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"고객 {updated_count}명의 예약 정보를 갱신했습니다."))
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.6 on 2024-06-27 21:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0002_customerticketregistrationlog_customerticketusagelog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customer',
+            name='last_reserved_at',
+            field=models.DateTimeField(blank=True, db_comment='최근 예약 일시', null=True),
+        ),
+        migrations.AddField(
+            model_name='customer',
+            name='reservation_count',
+            field=models.IntegerField(db_comment='예약 횟수', default=0),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.0.6 on 2024-06-28 10:12
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('customers', '0003_customer_last_reserved_at_reservation_count'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='customer',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'
+                ),
+                name='customer_name_trgm_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='customer',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Replace(
+                        'phone_number', models.Value('-'), models.Value('')
+                    ),
+                    name='gin_trgm_ops',
+                ),
+                name='customer_phone_digits_trgm_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='customerpet',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'
+                ),
+                condition=models.Q(('is_deleted', False)),
+                name='customer_pet_name_trgm_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.6 on 2024-06-28 14:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0004_customer_search_trgm_indexes'),
+        ('pet_kindergardens', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CustomerImportJob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, db_column='customer_import_job_id', db_comment='고객 일괄 등록 작업 아이디', primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_comment='생성 일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_comment='수정 일시')),
+                ('csv_file', models.FileField(db_comment='CSV 파일', max_length=255, upload_to='customers/imports/%Y/%m/%d/')),
+                ('task_id', models.CharField(db_comment='Celery 작업 아이디', max_length=255, unique=True)),
+                ('pet_kindergarden', models.ForeignKey(db_comment='펫 유치원 아이디', on_delete=django.db.models.deletion.CASCADE, related_name='customer_import_jobs', to='pet_kindergardens.petkindergarden')),
+            ],
+            options={
+                'db_table': 'customer_import_job',
+            },
+        ),
+    ]
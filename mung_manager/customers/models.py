@@ -1,7 +1,10 @@
 from concurrency.fields import IntegerVersionField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 from mung_manager.common.base.models import TimeStampedModel
+from mung_manager.customers.search import get_phone_number_digits
 from mung_manager.pet_kindergardens.models import PetKindergarden
 from mung_manager.reservations.models import Reservation
 from mung_manager.tickets.models import Ticket
@@ -20,6 +23,8 @@ class Customer(TimeStampedModel):
     phone_number = models.CharField(max_length=16, db_comment="전화번호")
     memo = models.TextField(db_comment="메모", blank=True)
     is_active = models.BooleanField(db_comment="활성 여부", default=True)
+    last_reserved_at = models.DateTimeField(db_comment="최근 예약 일시", blank=True, null=True)
+    reservation_count = models.IntegerField(db_comment="예약 횟수", default=0)
     pet_kindergarden = models.ForeignKey(
         PetKindergarden,
         on_delete=models.CASCADE,
@@ -37,6 +42,12 @@ class Customer(TimeStampedModel):
 
     class Meta:
         db_table = "customer"
+        indexes = [
+            # 고객 이름 부분 검색 (icontains는 UPPER(name) LIKE 로 변환되므로 같은 식으로 인덱싱)
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="customer_name_trgm_idx"),
+            # 전화번호 숫자 조각 검색 ('-' 위치와 관계없이 검색)
+            GinIndex(OpClass(get_phone_number_digits(), name="gin_trgm_ops"), name="customer_phone_digits_trgm_idx"),
+        ]
 
 
 class CustomerPet(TimeStampedModel):
@@ -59,6 +70,14 @@ class CustomerPet(TimeStampedModel):
 
     class Meta:
         db_table = "customer_pet"
+        indexes = [
+            # 삭제되지 않은 반려동물 이름 부분 검색
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="customer_pet_name_trgm_idx",
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
 
 
 class CustomerTicket(TimeStampedModel):
@@ -134,3 +153,24 @@ class CustomerTicketRegistrationLog(TimeStampedModel):
 
     class Meta:
         db_table = "customer_ticket_registration_log"
+
+
+class CustomerImportJob(TimeStampedModel):
+    id = models.AutoField(
+        auto_created=True,
+        primary_key=True,
+        db_column="customer_import_job_id",
+        serialize=False,
+        db_comment="고객 일괄 등록 작업 아이디",
+    )
+    csv_file = models.FileField(upload_to="customers/imports/%Y/%m/%d/", max_length=255, db_comment="CSV 파일")
+    task_id = models.CharField(max_length=255, unique=True, db_comment="Celery 작업 아이디")
+    pet_kindergarden = models.ForeignKey(
+        PetKindergarden,
+        on_delete=models.CASCADE,
+        related_name="customer_import_jobs",
+        db_comment="펫 유치원 아이디",
+    )
+
+    class Meta:
+        db_table = "customer_import_job"
@@ -0,0 +1,38 @@
+import re
+from typing import Optional
+
+from django.db.models import Value
+from django.db.models.functions import Replace
+
+# 숫자, '-', 공백으로만 이루어진 검색어는 전화번호 조각으로 검색
+PHONE_NUMBER_KEYWORD_REGEX = re.compile(r"[\d\-\s]+")
+
+
+def get_phone_number_digits(field_name: str = "phone_number") -> Replace:
+    """이 함수는 전화번호에서 '-'를 제거한 식을 생성합니다.
+
+    고객 전화번호 트라이그램 인덱스(customer_phone_digits_trgm_idx)와 같은 식이므로
+    검색 조건에 이 식을 사용해야 인덱스를 사용할 수 있습니다.
+
+    Args:
+        field_name (str): 전화번호 필드 이름 (예: "phone_number", "customer__phone_number")
+
+    Returns:
+        Replace: '-'를 제거한 전화번호 식
+    """
+    return Replace(field_name, Value("-"), Value(""))
+
+
+def get_phone_number_keyword_digits(keyword: str) -> Optional[str]:
+    """이 함수는 검색어가 전화번호 조각인 경우 숫자만 추출합니다.
+
+    Args:
+        keyword (str): 검색어
+
+    Returns:
+        Optional[str]: 숫자만 남긴 검색어이며 전화번호 조각이 아니면 None을 반환
+    """
+    if PHONE_NUMBER_KEYWORD_REGEX.fullmatch(keyword) is None:
+        return None
+    digits = re.sub(r"\D", "", keyword)
+    return digits or None
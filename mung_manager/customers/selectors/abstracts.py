@@ -3,8 +3,10 @@ from typing import List, Optional
 
 from django.db.models.query import QuerySet
 
+from mung_manager.customers.imports import CustomerImportJobState
 from mung_manager.customers.models import (
     Customer,
+    CustomerImportJob,
     CustomerPet,
     CustomerTicket,
     CustomerTicketRegistrationLog,
@@ -15,7 +17,7 @@ from mung_manager.errors.exceptions import NotImplementedException
 
 class AbstractCustomerSelector(ABC):
     @abstractmethod
-    def get_by_filter_for_search(self, filters: Optional[dict] = None) -> QuerySet[Customer]:
+    def get_by_filter_for_search(self, pet_kindergarden_id: int, filters: Optional[dict] = None) -> QuerySet[Customer]:
         raise NotImplementedException()
 
     @abstractmethod
@@ -35,15 +37,9 @@ class AbstractCustomerSelector(ABC):
         raise NotImplementedException()
 
     @abstractmethod
-    def get_queryset_by_pet_kindergarden_id(self, pet_kindergarden_id: int) -> QuerySet[Customer]:
-        raise NotImplementedException()
-
-    @abstractmethod
-    def get_by_id_and_customer_pet_id_for_undeleted_customer_pets(
-        self,
-        customer_id: int,
-        customer_pet_id: int,
-    ) -> Optional[Customer]:
+    def get_phone_numbers_by_pet_kindergarden_id_and_phone_numbers(
+        self, pet_kindergarden_id: int, phone_numbers: List[str]
+    ) -> set[str]:
         raise NotImplementedException()
 
 
@@ -62,6 +58,10 @@ class AbstractCustomerTicketSelector(ABC):
     def get_queryset_for_hotel(self, customer_ticket_ids: list[int], customer_id: int) -> QuerySet[CustomerTicket]:
         raise NotImplementedException()
 
+    @abstractmethod
+    def get_queryset_by_ids(self, customer_ticket_ids: list[int]) -> QuerySet[CustomerTicket]:
+        raise NotImplementedException()
+
 
 class AbstractCustomerPetSelector(ABC):
     @abstractmethod
@@ -75,7 +75,7 @@ class AbstractCustomerPetSelector(ABC):
         raise NotImplementedException()
 
     @abstractmethod
-    def get_by_keyword_for_search(self, keyword: str) -> QuerySet[CustomerPet]:
+    def get_queryset_by_keyword_for_search(self, pet_kindergarden_id: int, keyword: str) -> QuerySet[CustomerPet]:
         raise NotImplementedException()
 
 
@@ -88,10 +88,6 @@ class AbstractCustomerTicketUsageLogSelector(ABC):
     def get_queryset_by_reservation_ids(self, reservation_ids: list[int]) -> QuerySet[CustomerTicketUsageLog]:
         raise NotImplementedException()
 
-    @abstractmethod
-    def get_by_reservation_id(self, reservation_id: int) -> Optional[CustomerTicketUsageLog]:
-        raise NotImplementedException()
-
 
 class AbstractCustomerTicketRegistrationLogSelector(ABC):
     @abstractmethod
@@ -99,3 +95,19 @@ class AbstractCustomerTicketRegistrationLogSelector(ABC):
         self, customer_id: int
     ) -> QuerySet[CustomerTicketRegistrationLog]:
         raise NotImplementedException()
+
+
+class AbstractCustomerImportJobSelector(ABC):
+    @abstractmethod
+    def get_with_pet_kindergarden_by_id(self, customer_import_job_id: int) -> Optional[CustomerImportJob]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_by_id_and_pet_kindergarden_id(
+        self, customer_import_job_id: int, pet_kindergarden_id: int
+    ) -> Optional[CustomerImportJob]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_state_by_task_id(self, task_id: str) -> CustomerImportJobState:
+        raise NotImplementedException()
@@ -0,0 +1,74 @@
+from typing import Optional
+
+from celery import states
+from celery.result import AsyncResult
+
+from mung_manager.customers.imports import CustomerImportJobState
+from mung_manager.customers.models import CustomerImportJob
+from mung_manager.customers.selectors.abstracts import (
+    AbstractCustomerImportJobSelector,
+)
+
+
+class CustomerImportJobSelector(AbstractCustomerImportJobSelector):
+    """이 클래스는 고객 일괄 등록 작업을 DB에서 PULL하는 비즈니스 로직을 담당합니다."""
+
+    # 작업을 처리하는 동안 진행 상황을 저장하는 사용자 정의 Celery 작업 상태
+    PROGRESS_STATE = "PROGRESS"
+
+    def get_with_pet_kindergarden_by_id(self, customer_import_job_id: int) -> Optional[CustomerImportJob]:
+        """이 함수는 고객 일괄 등록 작업 아이디로 반려동물 유치원과 유저를 포함한 작업을 조회합니다.
+
+        Args:
+            customer_import_job_id (int): 고객 일괄 등록 작업 아이디
+
+        Returns:
+            Optional[CustomerImportJob]: 고객 일괄 등록 작업 객체이며 존재하지 않으면 None을 반환
+        """
+        try:
+            return (
+                CustomerImportJob.objects.filter(id=customer_import_job_id)
+                .select_related("pet_kindergarden", "pet_kindergarden__user")
+                .get()
+            )
+        except CustomerImportJob.DoesNotExist:
+            return None
+
+    def get_by_id_and_pet_kindergarden_id(
+        self, customer_import_job_id: int, pet_kindergarden_id: int
+    ) -> Optional[CustomerImportJob]:
+        """이 함수는 고객 일괄 등록 작업 아이디와 반려동물 유치원 아이디로 작업을 조회합니다.
+
+        Args:
+            customer_import_job_id (int): 고객 일괄 등록 작업 아이디
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+
+        Returns:
+            Optional[CustomerImportJob]: 고객 일괄 등록 작업 객체이며 존재하지 않으면 None을 반환
+        """
+        try:
+            return CustomerImportJob.objects.filter(
+                id=customer_import_job_id,
+                pet_kindergarden_id=pet_kindergarden_id,
+            ).get()
+        except CustomerImportJob.DoesNotExist:
+            return None
+
+    def get_state_by_task_id(self, task_id: str) -> CustomerImportJobState:
+        """이 함수는 Celery 결과 백엔드(django_celery_results)에서 작업의 진행 상태를 조회합니다.
+
+        작업이 아직 시작되지 않았으면 PENDING 이며, 실패한 경우 예외 정보는 반환하지 않습니다.
+
+        Args:
+            task_id (str): Celery 작업 아이디
+
+        Returns:
+            CustomerImportJobState: 작업 진행 상태
+        """
+        async_result = AsyncResult(task_id)
+        status = async_result.state
+        return CustomerImportJobState(
+            status=status,
+            progress=async_result.info if status == self.PROGRESS_STATE else None,
+            result=async_result.info if status == states.SUCCESS else None,
+        )
@@ -1,9 +1,15 @@
 from typing import List
 
-from django.db.models import Q
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import Case, FloatField, Q, Value, When
+from django.db.models.functions import Cast, Greatest
 from django.db.models.query import QuerySet
 
 from mung_manager.customers.models import CustomerPet
+from mung_manager.customers.search import (
+    get_phone_number_digits,
+    get_phone_number_keyword_digits,
+)
 from mung_manager.customers.selectors.abstracts import AbstractCustomerPetSelector
 
 
@@ -45,23 +51,41 @@ class CustomerPetSelector(AbstractCustomerPetSelector):
             deleted_at__isnull=True,
         ).exists()
 
-    def get_by_keyword_for_search(self, keyword: str) -> QuerySet[CustomerPet]:
-        """이 함수는 키워드로 고객을 포함한 삭제되지 않은 고객 반려동물 조회합니다.
-        키워드는 고객 이름, 고객 전화번호, 고객 반려동물 이름을 검색합니다.
+    def get_queryset_by_keyword_for_search(self, pet_kindergarden_id: int, keyword: str) -> QuerySet[CustomerPet]:
+        """이 함수는 키워드로 활성화된 고객을 포함한 삭제되지 않은 고객 반려동물을 유사도순으로 조회합니다.
+        키워드는 고객 이름, 고객 반려동물 이름을 부분 검색하며 숫자로만 이루어진 경우 전화번호 숫자 조각도 검색합니다.
+
+        유사도(rank)는 반려동물 이름과 고객 이름의 트라이그램 유사도 중 큰 값이며 전화번호가 일치하면 1입니다.
 
         Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
             keyword (str): 검색 키워드
 
         Returns:
-            QuerySet[Customer]: 고객 리스트 쿼리셋이며 존재하지 않으면 빈 쿼리셋을 반환
+            QuerySet[CustomerPet]: 고객 반려동물 리스트 쿼리셋이며 존재하지 않으면 빈 쿼리셋을 반환
         """
+        keyword_filter = Q(customer__name__icontains=keyword) | Q(name__icontains=keyword)
+        rank_expressions = [
+            TrigramSimilarity("name", keyword),
+            TrigramSimilarity("customer__name", keyword),
+        ]
+
+        digits = get_phone_number_keyword_digits(keyword)
+        if digits is not None:
+            phone_number_filter = Q(customer_phone_number_digits__contains=digits)
+            keyword_filter |= phone_number_filter
+            rank_expressions.append(Case(When(phone_number_filter, then=Value(1.0)), default=Value(0.0)))
+
         return (
-            CustomerPet.objects.filter(is_deleted=False, deleted_at__isnull=True)
+            CustomerPet.objects.alias(customer_phone_number_digits=get_phone_number_digits("customer__phone_number"))
             .filter(
-                Q(customer__name__icontains=keyword)
-                | Q(customer__phone_number__icontains=keyword)
-                | Q(name__icontains=keyword)
+                customer__pet_kindergarden_id=pet_kindergarden_id,
+                customer__is_active=True,
+                is_deleted=False,
+                deleted_at__isnull=True,
             )
-            .filter(customer__is_active=True)
+            .filter(keyword_filter)
+            # similarity()는 real을 반환하므로 double precision으로 변환해야 커서의 float 값과 정확히 비교됨
+            .annotate(rank=Cast(Greatest(*rank_expressions, output_field=FloatField()), FloatField()))
             .select_related("customer")
         )
@@ -1,5 +1,3 @@
-from typing import Optional
-
 from django.db.models.query import QuerySet
 
 from mung_manager.customers.models import CustomerTicketUsageLog
@@ -38,18 +36,3 @@ class CustomerTicketUsageLogSelector(AbstractCustomerTicketUsageLogSelector):
 
         """
         return CustomerTicketUsageLog.objects.filter(reservation_id__in=reservation_ids)
-
-    def get_by_reservation_id(self, reservation_id: int) -> Optional[CustomerTicketUsageLog]:
-        """예약 아이디로 고객 티켓 사용 로그를 조회합니다.
-
-        Args:
-            reservation_id (int): 예약 아이디
-
-        Returns:
-            Optional[CustomerTicketUsageLog]: 고객 티켓 사용 로그이며 없을 경우 None을 반환
-
-        """
-        try:
-            return CustomerTicketUsageLog.objects.filter(reservation_id=reservation_id).get()
-        except CustomerTicketUsageLog.DoesNotExist:
-            return None
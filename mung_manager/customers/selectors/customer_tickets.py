@@ -84,3 +84,14 @@ class CustomerTicketSelector(AbstractCustomerTicketSelector):
             .select_related("ticket")
             .order_by("expired_at")
         )
+
+    def get_queryset_by_ids(self, customer_ticket_ids: list[int]) -> QuerySet[CustomerTicket]:
+        """이 함수는 고객 티켓 아이디 리스트로 고객 티켓 리스트를 조회합니다.
+
+        Args:
+            customer_ticket_ids: 고객 티켓 아이디 리스트
+
+        Returns:
+            QuerySet[CustomerTicket]: 고객 티켓 쿼리셋이며 없을 경우 빈 쿼리셋을 반환
+        """
+        return CustomerTicket.objects.filter(id__in=customer_ticket_ids)
@@ -1,21 +1,21 @@
-from typing import Optional
+from typing import List, Optional
 
-from django.db.models import Case, F, Max, Prefetch, Value, When
+from django.db.models import Prefetch
 from django.db.models.query import QuerySet
 
 from mung_manager.customers.filters import CustomerFilter
 from mung_manager.customers.models import Customer, CustomerPet
 from mung_manager.customers.selectors.abstracts import AbstractCustomerSelector
-from mung_manager.reservations.enums import ReservationStatus
 
 
 class CustomerSelector(AbstractCustomerSelector):
     """이 클래스는 고객을 DB에서 PULL하는 비즈니스 로직을 담당합니다."""
 
-    def get_by_filter_for_search(self, filters: Optional[dict] = None) -> QuerySet[Customer]:
-        """이 함수는 필터로 삭제되지 않은 고객 반려동물, 최근 예약, 고객 티켓, 티켓을 포함한 고객 리스트를 최신순으로 조회합니다.
+    def get_by_filter_for_search(self, pet_kindergarden_id: int, filters: Optional[dict] = None) -> QuerySet[Customer]:
+        """이 함수는 필터로 삭제되지 않은 고객 반려동물, 고객 티켓, 티켓을 포함한 고객 리스트를 최신순으로 조회합니다.
 
         Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
             filters (Optional[dict]): 필터
 
         Returns:
@@ -23,7 +23,7 @@ class CustomerSelector(AbstractCustomerSelector):
         """
         filters = filters or {}
         qs = (
-            Customer.objects.all()
+            Customer.objects.filter(pet_kindergarden_id=pet_kindergarden_id)
             .prefetch_related("customer_tickets", "customer_tickets__ticket")
             .prefetch_related(
                 Prefetch(
@@ -32,19 +32,6 @@ class CustomerSelector(AbstractCustomerSelector):
                     to_attr="undeleted_customer_pets",
                 )
             )
-            .annotate(
-                recent_reserved_at=Max(
-                    Case(
-                        When(
-                            reservations__depth=0,
-                            reservations__parent_id=None,
-                            reservations__reservation_status=ReservationStatus.CANCELED.value,
-                            then=F("reservations__reserved_at"),
-                        ),
-                        default=Value(None),
-                    )
-                ),
-            )
             .order_by("-id")
         )
         return CustomerFilter(filters, queryset=qs).qs
@@ -110,40 +97,21 @@ class CustomerSelector(AbstractCustomerSelector):
         """
         return Customer.objects.filter(pet_kindergarden_id=pet_kindergarden_id, phone_number=phone_number).exists()
 
-    def get_queryset_by_pet_kindergarden_id(self, pet_kindergarden_id: int) -> QuerySet[Customer]:
-        """이 함수는 반려동물 유치원 아이디로 고객을 조회합니다.
+    def get_phone_numbers_by_pet_kindergarden_id_and_phone_numbers(
+        self, pet_kindergarden_id: int, phone_numbers: List[str]
+    ) -> set[str]:
+        """이 함수는 반려동물 유치원 고객 중 주어진 전화번호를 가진 고객의 전화번호를 조회합니다.
 
         Args:
             pet_kindergarden_id (int): 반려동물 유치원 아이디
+            phone_numbers (List[str]): 전화번호 리스트
 
         Returns:
-            QuerySet[Customer]: 고객 리스트 쿼리셋이며 존재하지 않으면 빈 쿼리셋을 반환
+            set[str]: 이미 등록된 전화번호 집합
         """
-        return Customer.objects.filter(pet_kindergarden_id=pet_kindergarden_id)
-
-    def get_by_id_and_customer_pet_id_for_undeleted_customer_pets(
-        self,
-        customer_id: int,
-        customer_pet_id: int,
-    ) -> Optional[Customer]:
-        """이 함수는 고객 아이디, 삭제되지 않은 고객 반려동물 아이디로 예약을 위한 고객을 가져옵니다.
-
-        Args:
-            customer_id (int): 고객 아이디
-            customer_pet_id (int): 고객 반려동물 아이디
-
-        Returns:
-            Optional[Customer]: 고객 객체이며 존재하지 않으면 None을 반환
-        """
-        try:
-            return (
-                Customer.objects.filter(
-                    customer_pets__id=customer_pet_id,
-                    customer_pets__is_deleted=False,
-                    customer_pets__deleted_at__isnull=True,
-                )
-                .filter(id=customer_id)
-                .get()
-            )
-        except Customer.DoesNotExist:
-            return None
+        return set(
+            Customer.objects.filter(
+                pet_kindergarden_id=pet_kindergarden_id,
+                phone_number__in=phone_numbers,
+            ).values_list("phone_number", flat=True)
+        )
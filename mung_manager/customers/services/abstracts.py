@@ -1,18 +1,20 @@
+import datetime as dt
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Callable, List, Optional
 
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.files import File
 
-from mung_manager.customers.models import Customer, CustomerTicket
+from mung_manager.customers.imports import CustomerCsvImportResult
+from mung_manager.customers.models import Customer, CustomerImportJob, CustomerTicket
 from mung_manager.errors.exceptions import NotImplementedException
+from mung_manager.pet_kindergardens.tenants import PetKindergardenTenant
 
 
 class AbstractCustomerService(ABC):
     @abstractmethod
     def create_customer(
         self,
-        user,
-        pet_kindergarden_id: int,
+        tenant: PetKindergardenTenant,
         name: str,
         phone_number: str,
         pets: List[str],
@@ -20,18 +22,38 @@ class AbstractCustomerService(ABC):
         raise NotImplementedException()
 
     @abstractmethod
-    def create_customers_by_csv(self, user, pet_kindergarden_id: int, csv_file: InMemoryUploadedFile) -> List[Customer]:
+    def create_customer_import_job(self, tenant: PetKindergardenTenant, csv_file: File) -> CustomerImportJob:
         raise NotImplementedException()
 
     @abstractmethod
-    def toggle_customer_is_active(self, user, customer_id: int, pet_kindergarden_id: int) -> Customer:
+    def delete_customer_import_job(self, customer_import_job: CustomerImportJob) -> None:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def import_customers_by_job(
+        self,
+        customer_import_job_id: int,
+        progress_callback: Optional[Callable[[CustomerCsvImportResult], None]] = None,
+    ) -> CustomerCsvImportResult:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def create_customers_by_csv(
+        self,
+        tenant: PetKindergardenTenant,
+        csv_file: File,
+        progress_callback: Optional[Callable[[CustomerCsvImportResult], None]] = None,
+    ) -> CustomerCsvImportResult:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def toggle_customer_is_active(self, tenant: PetKindergardenTenant, customer_id: int) -> Customer:
         raise NotImplementedException()
 
     @abstractmethod
     def update_customer(
         self,
-        user,
-        pet_kindergarden_id: int,
+        tenant: PetKindergardenTenant,
         customer_id: int,
         name: str,
         phone_number: str,
@@ -41,8 +63,22 @@ class AbstractCustomerService(ABC):
     ) -> Optional[Customer]:
         raise NotImplementedException()
 
+    @abstractmethod
+    def increase_reservation_summary(self, customer_id: int, reserved_at: dt.datetime) -> None:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def refresh_reservation_summaries(self, customer_ids: List[int]) -> int:
+        raise NotImplementedException()
+
 
 class AbstractCustomerTicketService(ABC):
     @abstractmethod
-    def register_ticket(self, user, customer_id: int, pet_kindergarden_id: int, ticket_id: int) -> CustomerTicket:
+    def register_ticket(self, tenant: PetKindergardenTenant, customer_id: int, ticket_id: int) -> CustomerTicket:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def update_customer_ticket_counts(
+        self, customer_ticket_counts: list[tuple[CustomerTicket, int]], max_retry_count: int = 0
+    ) -> None:
         raise NotImplementedException()
@@ -1,20 +1,16 @@
 from datetime import timedelta
 
-from django.db import transaction
+from django.db import connection, transaction
 from django.utils import timezone
 
 from mung_manager.common.constants import SYSTEM_CODE
-from mung_manager.common.selectors import (
-    check_object_or_not_found,
-    get_object_or_not_found,
-)
+from mung_manager.common.selectors import get_object_or_not_found
 from mung_manager.customers.models import CustomerTicket, CustomerTicketRegistrationLog
+from mung_manager.customers.selectors.customer_tickets import CustomerTicketSelector
 from mung_manager.customers.selectors.customers import CustomerSelector
 from mung_manager.customers.services.abstracts import AbstractCustomerTicketService
 from mung_manager.errors.exceptions import ValidationException
-from mung_manager.pet_kindergardens.selectors.pet_kindergardens import (
-    PetKindergardenSelector,
-)
+from mung_manager.pet_kindergardens.tenants import PetKindergardenTenant
 from mung_manager.tickets.selectors.tickets import TicketSelector
 
 
@@ -24,34 +20,25 @@ class CustomerTicketService(AbstractCustomerTicketService):
     def __init__(
         self,
         customer_selector: CustomerSelector,
-        pet_kindergarden_selector: PetKindergardenSelector,
+        customer_ticket_selector: CustomerTicketSelector,
         ticket_selector: TicketSelector,
     ):
         self._customer_selector = customer_selector
-        self._pet_kindergarden_selector = pet_kindergarden_selector
+        self._customer_ticket_selector = customer_ticket_selector
         self._ticket_selector = ticket_selector
 
     @transaction.atomic
-    def register_ticket(self, user, customer_id: int, pet_kindergarden_id: int, ticket_id: int) -> CustomerTicket:
+    def register_ticket(self, tenant: PetKindergardenTenant, customer_id: int, ticket_id: int) -> CustomerTicket:
         """이 함수는 고객의 티켓을 검증 후 등록 후 로그를 남깁니다.
 
         Args:
-            user: 유저 객체
             customer_id (int): 고객 아이디
-            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            tenant (PetKindergardenTenant): 반려동물 유치원 테넌트
             ticket_id (int): 티켓 아이디
 
         Returns:
             CustomerTicket: 고객의 티켓 객체
         """
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
         customer = get_object_or_not_found(
             self._customer_selector.get_by_id(customer_id=customer_id),
             msg=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER"),
@@ -85,3 +72,113 @@ class CustomerTicketService(AbstractCustomerTicketService):
         )
 
         return customer_ticket
+
+    @transaction.atomic
+    def update_customer_ticket_counts(
+        self, customer_ticket_counts: list[tuple[CustomerTicket, int]], max_retry_count: int = 0
+    ) -> None:
+        """이 함수는 여러 고객 티켓의 사용 횟수를 한 번의 쿼리로 증감합니다.
+
+        티켓을 조회한 시점의 버전과 DB의 버전이 같은 티켓만 갱신하며(낙관적 잠금), 갱신하지 못한 티켓은
+        최신 상태로 다시 조회하여 잔여 횟수가 부족하면 바로 실패하고, 버전만 달랐다면 최대 재시도 횟수만큼 재시도합니다.
+        갱신에 성공한 티켓 객체는 사용 횟수와 버전이 갱신된 값으로 변경됩니다.
+
+        Args:
+            customer_ticket_counts (list[tuple[CustomerTicket, int]]): 고객 티켓과 사용할 횟수 리스트
+                (양수는 사용, 음수는 환불이며 고객 티켓은 중복되지 않아야 함)
+            max_retry_count (int): 버전 충돌 시 최대 재시도 횟수
+
+        Returns:
+            None
+        """
+        pending_customer_ticket_counts = list(customer_ticket_counts)
+        retry_count = 0
+
+        while True:
+            conflicted_customer_ticket_ids = self._update_customer_ticket_counts(
+                customer_ticket_counts=pending_customer_ticket_counts,
+            )
+            if len(conflicted_customer_ticket_ids) == 0:
+                return
+
+            # 갱신하지 못한 티켓만 최신 상태로 다시 조회하여 잔여 횟수 부족과 버전 충돌을 구분
+            ticket_counts = {
+                customer_ticket.id: ticket_count
+                for customer_ticket, ticket_count in pending_customer_ticket_counts
+                if customer_ticket.id in conflicted_customer_ticket_ids
+            }
+            pending_customer_ticket_counts = [
+                (customer_ticket, ticket_counts[customer_ticket.id])
+                for customer_ticket in self._customer_ticket_selector.get_queryset_by_ids(
+                    customer_ticket_ids=conflicted_customer_ticket_ids,
+                )
+            ]
+            if len(pending_customer_ticket_counts) != len(conflicted_customer_ticket_ids):
+                raise ValidationException(
+                    detail=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER_TICKET"),
+                    code=SYSTEM_CODE.code("NOT_FOUND_CUSTOMER_TICKET"),
+                )
+            if any(
+                customer_ticket.unused_count < ticket_count
+                for customer_ticket, ticket_count in pending_customer_ticket_counts
+            ):
+                raise ValidationException(
+                    detail=SYSTEM_CODE.message("NO_CUSTOMER_TICKET_COUNT"),
+                    code=SYSTEM_CODE.code("NO_CUSTOMER_TICKET_COUNT"),
+                )
+
+            if retry_count >= max_retry_count:
+                raise ValidationException(
+                    detail=f"{SYSTEM_CODE.message('CONFILCT_CUSTOMER_TICKET')}: {conflicted_customer_ticket_ids}",
+                    code=SYSTEM_CODE.code("CONFILCT_CUSTOMER_TICKET"),
+                )
+            retry_count += 1
+
+    def _update_customer_ticket_counts(self, customer_ticket_counts: list[tuple[CustomerTicket, int]]) -> list[int]:
+        """이 함수는 고객 티켓의 사용 횟수와 버전을 UPDATE ... FROM 한 번으로 갱신합니다.
+
+        Args:
+            customer_ticket_counts (list[tuple[CustomerTicket, int]]): 고객 티켓과 사용할 횟수 리스트
+
+        Returns:
+            list[int]: 버전 충돌 또는 잔여 횟수 부족으로 갱신하지 못한 고객 티켓 아이디 리스트
+        """
+        if len(customer_ticket_counts) == 0:
+            return []
+
+        # 버전은 DB에서 1 증가시키며, 갱신된 버전을 반환받아 티켓 객체에 반영
+        query = """
+        UPDATE customer_ticket AS ct
+        SET
+            used_count = ct.used_count + v.ticket_count,
+            unused_count = ct.unused_count - v.ticket_count,
+            version = ct.version + 1,
+            updated_at = NOW()
+        FROM unnest(%s::integer[], %s::integer[], %s::bigint[])
+            AS v(customer_ticket_id, ticket_count, version)
+        WHERE ct.customer_ticket_id = v.customer_ticket_id
+            AND ct.version = v.version
+            AND ct.unused_count - v.ticket_count >= 0
+        RETURNING ct.customer_ticket_id, ct.version;
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                query,
+                [
+                    [customer_ticket.id for customer_ticket, _ in customer_ticket_counts],
+                    [ticket_count for _, ticket_count in customer_ticket_counts],
+                    [customer_ticket.version for customer_ticket, _ in customer_ticket_counts],
+                ],
+            )
+            updated_versions = dict(cursor.fetchall())
+
+        conflicted_customer_ticket_ids = []
+        for customer_ticket, ticket_count in customer_ticket_counts:
+            if customer_ticket.id not in updated_versions:
+                conflicted_customer_ticket_ids.append(customer_ticket.id)
+                continue
+            customer_ticket.used_count += ticket_count
+            customer_ticket.unused_count -= ticket_count
+            customer_ticket.version = updated_versions[customer_ticket.id]
+
+        return conflicted_customer_ticket_ids
@@ -1,50 +1,59 @@
-import csv
-from itertools import islice
-from typing import List, Optional
+import datetime as dt
+import uuid
+from typing import Callable, List, Optional
 
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.files import File
 from django.db import transaction
+from django.db.models import Count, F, Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
 from django.utils import timezone
 
 from mung_manager.common.constants import SYSTEM_CODE
 from mung_manager.common.selectors import (
     check_object_or_already_exist,
-    check_object_or_not_found,
     get_object_or_not_found,
 )
 from mung_manager.common.services import update_model
-from mung_manager.common.validators import (
-    InvalidPhoneNumberValidator,
-    UniquePetNameValidator,
+from mung_manager.customers.imports import (
+    CustomerCsvImportError,
+    CustomerCsvImportResult,
+    CustomerCsvReader,
+    CustomerCsvRow,
+)
+from mung_manager.customers.models import Customer, CustomerImportJob, CustomerPet
+from mung_manager.customers.selectors.customer_import_jobs import (
+    CustomerImportJobSelector,
 )
-from mung_manager.customers.models import Customer, CustomerPet
 from mung_manager.customers.selectors.customer_pets import CustomerPetSelector
 from mung_manager.customers.selectors.customers import CustomerSelector
 from mung_manager.customers.services.abstracts import AbstractCustomerService
-from mung_manager.errors.exceptions import AlreadyExistsException, ValidationException
-from mung_manager.pet_kindergardens.selectors.pet_kindergardens import (
-    PetKindergardenSelector,
-)
+from mung_manager.errors.exceptions import ValidationException
+from mung_manager.pet_kindergardens.tenants import PetKindergardenTenant
+from mung_manager.reservations.enums import ReservationStatus
+from mung_manager.reservations.models import Reservation
 
 
 class CustomerService(AbstractCustomerService):
     """이 클래스는 고객을 DB에서 PUSH하는 비즈니스 로직을 담당합니다."""
 
+    # CSV 고객 일괄 등록 시 한 번에 검증하고 저장할 행 수와 결과에 담을 최대 오류 수
+    CSV_CHUNK_SIZE = 1000
+    CSV_MAX_ERROR_COUNT = 1000
+
     def __init__(
         self,
         customer_selector: CustomerSelector,
         customer_pet_selector: CustomerPetSelector,
-        pet_kindergarden_selector: PetKindergardenSelector,
+        customer_import_job_selector: CustomerImportJobSelector,
     ):
         self._customer_selector = customer_selector
         self._customer_pet_selector = customer_pet_selector
-        self._pet_kindergarden_selector = pet_kindergarden_selector
+        self._customer_import_job_selector = customer_import_job_selector
 
     @transaction.atomic
     def create_customer(
         self,
-        user,
-        pet_kindergarden_id: int,
+        tenant: PetKindergardenTenant,
         name: str,
         phone_number: str,
         pets: List[str],
@@ -52,8 +61,7 @@ class CustomerService(AbstractCustomerService):
         """이 함수는 고객을 검증 후 생성합니다.
 
         Args:
-            user: 유저 객체
-            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            tenant (PetKindergardenTenant): 반려동물 유치원 테넌트
             name (str): 고객 이름
             phone_number (str): 고객 전화번호
             pets (List[str]): 반려동물 이름
@@ -61,17 +69,9 @@ class CustomerService(AbstractCustomerService):
         Returns:
             Customer: 고객 객체
         """
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
         check_object_or_already_exist(
             self._customer_selector.exists_by_pet_kindergarden_id_and_phone_number(
-                pet_kindergarden_id=pet_kindergarden_id,
+                pet_kindergarden_id=tenant.pet_kindergarden_id,
                 phone_number=phone_number,
             ),
             msg=SYSTEM_CODE.message("ALREADY_EXISTS_CUSTOMER"),
@@ -79,7 +79,7 @@ class CustomerService(AbstractCustomerService):
         )
 
         customer = Customer.objects.create(
-            pet_kindergarden_id=pet_kindergarden_id,
+            pet_kindergarden_id=tenant.pet_kindergarden_id,
             name=name,
             phone_number=phone_number,
         )
@@ -91,111 +91,177 @@ class CustomerService(AbstractCustomerService):
         return customer
 
     @transaction.atomic
-    def create_customers_by_csv(self, user, pet_kindergarden_id: int, csv_file: InMemoryUploadedFile) -> List[Customer]:
+    def create_customer_import_job(self, tenant: PetKindergardenTenant, csv_file: File) -> CustomerImportJob:
         """
-        이 함수는 CSV 파일을 읽어서 고객을 생성합니다.
+        이 함수는 CSV 파일을 저장소에 저장하고 고객 일괄 등록 작업을 생성합니다.
+
+        작업은 커밋 후 호출한 쪽에서 작업 아이디(task_id)로 Celery 작업을 실행해야 처리됩니다.
 
         Args:
-            user: 유저 객체
-            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            tenant (PetKindergardenTenant): 반려동물 유치원 테넌트
             csv_file (File): CSV 파일
 
         Returns:
-            QuerySet[Customer]: 고객 객체
+            CustomerImportJob: 고객 일괄 등록 작업 객체
         """
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
+        return CustomerImportJob.objects.create(
+            pet_kindergarden_id=tenant.pet_kindergarden_id,
+            csv_file=csv_file,
+            task_id=str(uuid.uuid4()),
         )
 
-        # CSV 파일을 읽어서 데이터 추출
-        decoded_file = csv_file.read().decode("utf-8").splitlines()
-        reader = csv.reader(decoded_file)
+    def delete_customer_import_job(self, customer_import_job: CustomerImportJob) -> None:
+        """
+        이 함수는 Celery 작업을 실행하지 못한 고객 일괄 등록 작업과 저장된 CSV 파일을 삭제합니다.
+
+        Args:
+            customer_import_job (CustomerImportJob): 고객 일괄 등록 작업 객체
+        """
+        customer_import_job.csv_file.delete(save=False)
+        customer_import_job.delete()
 
-        customer_instances: List[Customer] = []
-        pet_instances: List[CustomerPet] = []
+    def import_customers_by_job(
+        self,
+        customer_import_job_id: int,
+        progress_callback: Optional[Callable[[CustomerCsvImportResult], None]] = None,
+    ) -> CustomerCsvImportResult:
+        """
+        이 함수는 고객 일괄 등록 작업에 저장된 CSV 파일로 고객을 생성합니다.
 
-        phone_number_validator = InvalidPhoneNumberValidator()
-        unique_pet_name_validator = UniquePetNameValidator()
+        Args:
+            customer_import_job_id (int): 고객 일괄 등록 작업 아이디
+            progress_callback (Optional[Callable[[CustomerCsvImportResult], None]]): 청크마다 호출할 함수
 
-        # CSV 파일을 읽어서 고객 객체를 생성
-        for idx, row in islice(enumerate(reader), 3, None):
-            # row 데이터 추출
-            name, phone_number, pet_data = map(str.strip, row[:3])
+        Returns:
+            CustomerCsvImportResult: 등록된 고객 수와 행별 오류
+        """
+        customer_import_job = get_object_or_not_found(
+            self._customer_import_job_selector.get_with_pet_kindergarden_by_id(
+                customer_import_job_id=customer_import_job_id,
+            ),
+            msg=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER_IMPORT_JOB"),
+            code=SYSTEM_CODE.code("NOT_FOUND_CUSTOMER_IMPORT_JOB"),
+        )
 
-            # 이름, 전화번호, 반려동물 빈 값 검사
-            if all(value for value in [name, phone_number, pet_data]):
-                # 전화번호 유효성 검사
-                phone_number_validator(phone_number)
+        # 작업 생성 시 반려동물 유치원 소유 여부를 확인했으므로 작업의 반려동물 유치원으로 테넌트 생성
+        tenant = PetKindergardenTenant(
+            pet_kindergarden_id=customer_import_job.pet_kindergarden_id,
+            user=customer_import_job.pet_kindergarden.user,
+        )
+        customer_import_job.csv_file.open("rb")
+        return self.create_customers_by_csv(
+            tenant=tenant,
+            csv_file=customer_import_job.csv_file.file,
+            progress_callback=progress_callback,
+        )
 
-                # 반려동물 이름 중복 검사
-                unique_pet_name_validator(pet_data.split(","))
+    def create_customers_by_csv(
+        self,
+        tenant: PetKindergardenTenant,
+        csv_file: File,
+        progress_callback: Optional[Callable[[CustomerCsvImportResult], None]] = None,
+    ) -> CustomerCsvImportResult:
+        """
+        이 함수는 CSV 파일을 스트리밍으로 읽어서 고객을 청크 단위로 생성합니다.
 
-                # csv 파일에 동일한 전화번호가 존재하는지 검증
-                if phone_number in [customer.phone_number for customer in customer_instances]:
-                    raise ValidationException(
-                        detail=SYSTEM_CODE.message("DUPLICATE_PHONE_NUMBER_CSV_FILE"),
-                        code=SYSTEM_CODE.code("DUPLICATE_PHONE_NUMBER_CSV_FILE"),
-                    )
+        검증에 실패한 행은 건너뛰고 행 번호와 오류를 결과에 담으며, 나머지 행은 등록합니다.
+        청크마다 파일 내 전화번호 중복과 기존 고객 여부를 한 번에 검증한 뒤 별도의 트랜잭션으로 저장하므로
+        메모리 사용량은 파일 크기와 관계없이 청크 크기로 제한됩니다.
 
-                # 고객 인스턴스 생성
-                customer = Customer(
-                    pet_kindergarden_id=pet_kindergarden_id,
-                    name=name,
-                    phone_number=phone_number,
-                )
-                customer_instances.append(customer)
+        Args:
+            tenant (PetKindergardenTenant): 반려동물 유치원 테넌트
+            csv_file (File): CSV 파일 (업로드 파일 또는 저장소 파일)
+            progress_callback (Optional[Callable[[CustomerCsvImportResult], None]]): 청크를 저장할 때마다
+                현재까지의 결과로 호출할 함수
 
-                # 고객 반려동물 인스턴스 생성
-                pets = [pet.strip() for pet in pet_data.split(",")]
-                pet_instances.extend(CustomerPet(name=pet, customer=customer) for pet in pets)
+        Returns:
+            CustomerCsvImportResult: 등록된 고객 수와 행별 오류
+        """
+        created_count = 0
+        errors: List[CustomerCsvImportError] = []
+        error_count = 0
+        phone_numbers_in_file: set[str] = set()
+
+        reader = CustomerCsvReader(csv_file=csv_file, chunk_size=self.CSV_CHUNK_SIZE)
+        for chunk in reader.read_chunks():
+            chunk_errors = [row for row in chunk if isinstance(row, CustomerCsvImportError)]
+            rows: List[CustomerCsvRow] = []
+            for row in chunk:
+                if isinstance(row, CustomerCsvImportError):
+                    continue
+
+                # csv 파일에 동일한 전화번호가 존재하는지 검증 (먼저 나온 행만 등록)
+                if row.phone_number in phone_numbers_in_file:
+                    chunk_errors.append(
+                        CustomerCsvImportError.from_system_code(row.row_number, "DUPLICATE_PHONE_NUMBER_CSV_FILE")
+                    )
+                    continue
+                phone_numbers_in_file.add(row.phone_number)
+                rows.append(row)
+
+            # 전화번호로 기존 고객이 존재하는지 청크 단위로 한 번에 검증
+            existing_phone_numbers = self._customer_selector.get_phone_numbers_by_pet_kindergarden_id_and_phone_numbers(
+                pet_kindergarden_id=tenant.pet_kindergarden_id,
+                phone_numbers=[row.phone_number for row in rows],
+            )
+            for row in rows:
+                if row.phone_number in existing_phone_numbers:
+                    chunk_errors.append(
+                        CustomerCsvImportError.from_system_code(row.row_number, "ALREADY_EXISTS_CUSTOMER")
+                    )
 
-        # csv 파일 닫기
-        csv_file.close()
+            created_count += self._bulk_create_customers(
+                tenant=tenant,
+                rows=[row for row in rows if row.phone_number not in existing_phone_numbers],
+            )
 
-        # 전화번호로 기존 고객이 존재하는지 검증
-        original_customer_phone_number_instances = self._customer_selector.get_queryset_by_pet_kindergarden_id(
-            pet_kindergarden_id=pet_kindergarden_id
-        ).values_list("phone_number", flat=True)
+            error_count += len(chunk_errors)
+            chunk_errors.sort(key=lambda error: error.row_number)
+            errors.extend(chunk_errors[: self.CSV_MAX_ERROR_COUNT - len(errors)])
 
-        for customer_instance in customer_instances:
-            if customer_instance.phone_number in original_customer_phone_number_instances:
-                raise AlreadyExistsException(
-                    detail=SYSTEM_CODE.message("ALREADY_EXISTS_CUSTOMER"),
-                    code=SYSTEM_CODE.code("ALREADY_EXISTS_CUSTOMER"),
+            if progress_callback is not None:
+                progress_callback(
+                    CustomerCsvImportResult(created_count=created_count, error_count=error_count, errors=errors)
                 )
 
-        # 최종 고객, 고객 반려동물 인스턴스 저장
-        customers = Customer.objects.bulk_create(customer_instances)
-        CustomerPet.objects.bulk_create(pet_instances)
-        return customers
+        return CustomerCsvImportResult(created_count=created_count, error_count=error_count, errors=errors)
 
     @transaction.atomic
-    def toggle_customer_is_active(self, user, customer_id: int, pet_kindergarden_id: int) -> Customer:
+    def _bulk_create_customers(self, tenant: PetKindergardenTenant, rows: List[CustomerCsvRow]) -> int:
+        if not rows:
+            return 0
+
+        customers = Customer.objects.bulk_create(
+            [
+                Customer(
+                    pet_kindergarden_id=tenant.pet_kindergarden_id,
+                    name=row.name,
+                    phone_number=row.phone_number,
+                )
+                for row in rows
+            ]
+        )
+        CustomerPet.objects.bulk_create(
+            [
+                CustomerPet(name=pet_name, customer=customer)
+                for customer, row in zip(customers, rows)
+                for pet_name in row.pet_names
+            ]
+        )
+        return len(customers)
+
+    @transaction.atomic
+    def toggle_customer_is_active(self, tenant: PetKindergardenTenant, customer_id: int) -> Customer:
         """
         이 함수는 고객의 활성화/비활성화를 변경합니다.
 
         Args:
-            user: 유저 객체
             customer_id (int): 고객 아이디
-            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            tenant (PetKindergardenTenant): 반려동물 유치원 테넌트
 
         Returns:
             Customer: 고객 객체
         """
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
-
         # 고객이 존재하는지 검증
         customer = get_object_or_not_found(
             self._customer_selector.get_by_id(customer_id=customer_id),
@@ -213,8 +279,7 @@ class CustomerService(AbstractCustomerService):
     @transaction.atomic
     def update_customer(
         self,
-        user,
-        pet_kindergarden_id: int,
+        tenant: PetKindergardenTenant,
         customer_id: int,
         name: str,
         phone_number: str,
@@ -226,7 +291,7 @@ class CustomerService(AbstractCustomerService):
         이 함수는 고객 정보를 업데이트합니다.
 
         Args:
-            user: 유저 객체
+            tenant (PetKindergardenTenant): 반려동물 유치원 테넌트
             customer_id (int): 고객 아이디
             name (str): 고객 이름
             phone_number (str): 고객 전화번호
@@ -237,15 +302,6 @@ class CustomerService(AbstractCustomerService):
         Returns:
             Customer: 고객 객체
         """
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
-
         # 고객이 존재하는지 검증
         customer = get_object_or_not_found(
             self._customer_selector.get_by_id(customer_id=customer_id),
@@ -293,3 +349,50 @@ class CustomerService(AbstractCustomerService):
 
         customer = self._customer_selector.get_with_undeleted_customer_pet_by_id(customer_id=customer_id)
         return customer
+
+    def increase_reservation_summary(self, customer_id: int, reserved_at: dt.datetime) -> None:
+        """이 함수는 예약 등록 시 고객의 최근 예약 일시와 예약 횟수를 갱신합니다.
+
+        연박 예약은 여러 예약으로 나뉘어 저장되지만 하나의 예약으로 집계하므로 등록 한 번에 1씩 증가합니다.
+        읽지 않고 UPDATE 한 번으로 처리하므로 같은 고객의 동시 예약에서도 갱신이 유실되지 않습니다.
+
+        Args:
+            customer_id (int): 고객 아이디
+            reserved_at (datetime): 예약 시작 시간
+
+        Returns:
+            None
+        """
+        # GREATEST는 NULL을 무시하므로 첫 예약인 경우 예약 시작 시간으로 갱신
+        Customer.objects.filter(id=customer_id).update(
+            last_reserved_at=Greatest("last_reserved_at", Value(reserved_at)),
+            reservation_count=F("reservation_count") + 1,
+        )
+
+    def refresh_reservation_summaries(self, customer_ids: List[int]) -> int:
+        """이 함수는 취소되지 않은 루트 예약으로 고객의 최근 예약 일시와 예약 횟수를 다시 계산합니다.
+
+        예약 취소 시 최근 예약 일시는 증감으로 계산할 수 없으므로 예약 테이블에서 다시 집계하며,
+        기존 고객의 값을 채우는 백필에서도 사용합니다.
+
+        Args:
+            customer_ids (List[int]): 고객 아이디 리스트
+
+        Returns:
+            int: 갱신된 고객 수
+        """
+        reservations = (
+            Reservation.objects.filter(customer_id=OuterRef("id"), depth=0)
+            .exclude(reservation_status=ReservationStatus.CANCELED.value)
+            .order_by()
+            .values("customer_id")
+        )
+        return Customer.objects.filter(id__in=customer_ids).update(
+            last_reserved_at=Subquery(
+                reservations.annotate(last_reserved_at=Max("reserved_at")).values("last_reserved_at")
+            ),
+            reservation_count=Coalesce(
+                Subquery(reservations.annotate(reservation_count=Count("id")).values("reservation_count")),
+                0,
+            ),
+        )
@@ -54,6 +54,12 @@ class UnknownServerException(BaseAPIException):
     default_code = SYSTEM_CODE.code("UNKNOWN_SERVER_ERROR")
 
 
+class ServiceUnavailableException(BaseAPIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = SYSTEM_CODE.message("SERVICE_UNAVAILABLE")
+    default_code = SYSTEM_CODE.code("SERVICE_UNAVAILABLE")
+
+
 class NotImplementedException(BaseAPIException):
     status_code = status.HTTP_501_NOT_IMPLEMENTED
     default_detail = SYSTEM_CODE.message("NOT_IMPLEMENTED")
@@ -21,6 +21,7 @@ from mung_manager.schemas.errors.commons import (
     ErrorInvalidTokenSchema,
     ErrorNotAuthenticatedSchema,
     ErrorPermissionDeniedSchema,
+    ErrorTaskEnqueueFailedSchema,
     ErrorUnknownServerSchema,
 )
 from mung_manager.schemas.errors.files import (
@@ -43,6 +44,9 @@ class FileUploadAPIManager(BaseAPIManager):
         description="""
         Rogic
             - 유저가 AWS S3에 파일을 업로드합니다. (최대 10MB)
+            - 파일은 검증 후 백그라운드에서 AWS S3에 업로드되며, 응답의 URL은 업로드가 끝난 뒤 접근할 수 있습니다.
+            - 업로드가 끝나면 너비별 WEBP, JPEG 파생 이미지(EXIF 제거)를 생성하며, 파생 이미지 URL은 생성이 끝난 뒤 접근할 수 있습니다.
+            - 백그라운드 업로드 작업을 실행하지 못하면 파일을 업로드하지 않고 503을 반환합니다.
         """,
         request=VIEWS_BY_METHOD["POST"]().cls.InputSerializer,
         responses={
@@ -51,6 +55,7 @@ class FileUploadAPIManager(BaseAPIManager):
             status.HTTP_401_UNAUTHORIZED: OpenApiTypes.OBJECT,
             status.HTTP_403_FORBIDDEN: OpenApiTypes.OBJECT,
             status.HTTP_500_INTERNAL_SERVER_ERROR: OpenApiTypes.OBJECT,
+            status.HTTP_503_SERVICE_UNAVAILABLE: OpenApiTypes.OBJECT,
         },
         examples=[
             # 400
@@ -72,6 +77,8 @@ class FileUploadAPIManager(BaseAPIManager):
             ErrorPermissionDeniedSchema,
             # 500
             ErrorUnknownServerSchema,
+            # 503
+            ErrorTaskEnqueueFailedSchema,
         ],
     )
     def post(self, request: Request, *args, **kwargs) -> Response:
@@ -1,3 +1,5 @@
+from celery import chain
+from kombu.exceptions import OperationalError
 from rest_framework import serializers, status
 from rest_framework.parsers import MultiPartParser
 from rest_framework.request import Request
@@ -6,8 +8,11 @@ from rest_framework.views import APIView
 
 from mung_manager.apis.mixins import APIAuthMixin
 from mung_manager.common.base.serializers import BaseSerializer
+from mung_manager.common.constants import SYSTEM_CODE
+from mung_manager.errors.exceptions import ServiceUnavailableException
 from mung_manager.files.containers import FileContainer
 from mung_manager.files.enums import FileResourceType
+from mung_manager.tasks.tasks import create_image_variants, push_spooled_file
 
 
 class FileUploadAPI(APIAuthMixin, APIView):
@@ -22,6 +27,11 @@ class FileUploadAPI(APIAuthMixin, APIView):
 
     class OutputSerializer(BaseSerializer):
         file_url = serializers.URLField(label="업로드된 파일 URL")
+        variant_urls = serializers.DictField(
+            child=serializers.URLField(),
+            label="파생 이미지 URL",
+            help_text="파생 이미지 이름(w{너비}.{형식})별 URL",
+        )
 
     def post(self, request: Request) -> Response:
         input_serializer = self.InputSerializer(data=request.data)
@@ -32,7 +42,20 @@ class FileUploadAPI(APIAuthMixin, APIView):
             resource_type=input_serializer.validated_data["resource_type"],
             user_id=request.user.id,
         )
-        file_url = file_upload_service.upload_file()
-
-        file_data = self.OutputSerializer({"file_url": file_url}).data
+        spooled_file = file_upload_service.upload_file()
+        # 원본 이미지를 AWS S3에 업로드한 뒤 파생 이미지를 생성
+        try:
+            chain(
+                push_spooled_file.si(spool_name=spooled_file.spool_name, upload_path=spooled_file.upload_path),
+                create_image_variants.si(upload_path=spooled_file.upload_path, content_hash=spooled_file.content_hash),
+            ).delay()
+        except OperationalError:
+            # 브로커에 연결할 수 없으면 업로드되지 않을 URL을 반환하지 않고 스풀 파일을 삭제
+            FileContainer.file_storage_service().delete_spooled_file(spool_name=spooled_file.spool_name)
+            raise ServiceUnavailableException(
+                detail=SYSTEM_CODE.message("TASK_ENQUEUE_FAILED"),
+                code=SYSTEM_CODE.code("TASK_ENQUEUE_FAILED"),
+            )
+
+        file_data = self.OutputSerializer(spooled_file._asdict()).data
         return Response(file_data, status=status.HTTP_200_OK)
@@ -1,13 +1,18 @@
 from dependency_injector import containers, providers
 
-from mung_manager.files.services.files import FileUploadService
+from mung_manager.files.selectors.uploaded_images import UploadedImageSelector
+from mung_manager.files.services.files import FileStorageService, FileUploadService
 
 
 class FileContainer(containers.DeclarativeContainer):
     """이 클래스는 DI(Dependency Injection) 파일 컨테이너 입니다.
 
     Attributes:
+        uploaded_image_selector: 업로드 이미지 셀렉터
         file_upload_service: 파일 업로드 서비스
+        file_storage_service: 파일 저장소 서비스
     """
 
+    uploaded_image_selector = providers.Factory(UploadedImageSelector)
     file_upload_service = providers.Factory(FileUploadService)
+    file_storage_service = providers.Factory(FileStorageService)
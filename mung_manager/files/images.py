@@ -0,0 +1,109 @@
+import hashlib
+import io
+from typing import IO, NamedTuple
+
+from django.conf import settings
+from PIL import Image, ImageOps
+
+
+class ImageVariant(NamedTuple):
+    """이 클래스는 업로드 이미지로 생성하는 파생 이미지(썸네일)입니다.
+
+    Attributes:
+        width (int): 최대 너비 (px)
+        image_format (str): 이미지 형식 (WEBP, JPEG)
+    """
+
+    width: int
+    image_format: str
+
+    @property
+    def name(self) -> str:
+        return f"w{self.width}.{self.image_format.lower()}"
+
+    @property
+    def content_type(self) -> str:
+        return Image.MIME[self.image_format]
+
+
+def get_image_variants() -> list[ImageVariant]:
+    """이 함수는 설정된 너비와 형식으로 생성할 파생 이미지 리스트를 반환합니다.
+
+    Returns:
+        list[ImageVariant]: 파생 이미지 리스트
+    """
+    return [
+        ImageVariant(width=width, image_format=image_format)
+        for width in settings.FILE_IMAGE_VARIANT_WIDTHS
+        for image_format in settings.FILE_IMAGE_VARIANT_FORMATS
+    ]
+
+
+def get_image_variant_path(content_hash: str, image_variant: ImageVariant) -> str:
+    """이 함수는 원본 이미지의 해시로 파생 이미지를 업로드할 경로를 반환합니다.
+
+    경로는 원본 이미지의 내용으로만 결정되므로 같은 이미지를 다시 업로드하면 같은 경로를 사용합니다.
+
+    Args:
+        content_hash (str): 원본 이미지의 해시
+        image_variant (ImageVariant): 파생 이미지
+
+    Returns:
+        str: 파생 이미지를 업로드할 경로
+    """
+    return f"images/variants/{content_hash[:2]}/{content_hash}/{image_variant.name}"
+
+
+def get_content_hash(file_obj: IO[bytes], chunk_size: int = 64 * 1024) -> str:
+    """이 함수는 파일을 나누어 읽으며 내용의 BLAKE2b 해시를 계산합니다.
+
+    Args:
+        file_obj (IO[bytes]): 파일 객체
+        chunk_size (int): 한 번에 읽을 크기
+
+    Returns:
+        str: 32바이트 BLAKE2b 해시의 16진수 문자열
+    """
+    content_hash = hashlib.blake2b(digest_size=32)
+    file_obj.seek(0)
+    while chunk := file_obj.read(chunk_size):
+        content_hash.update(chunk)
+    file_obj.seek(0)
+    return content_hash.hexdigest()
+
+
+def create_image_variant(image: Image.Image, image_variant: ImageVariant) -> bytes:
+    """이 함수는 원본 이미지를 파생 이미지의 너비로 축소하여 인코딩합니다.
+
+    EXIF 방향 정보는 픽셀에 적용한 뒤 EXIF를 포함하지 않고 저장하므로 촬영 위치 등의 메타데이터가 제거됩니다.
+    원본보다 큰 너비로는 확대하지 않습니다.
+
+    Args:
+        image (Image.Image): 원본 이미지
+        image_variant (ImageVariant): 파생 이미지
+
+    Returns:
+        bytes: 인코딩된 파생 이미지
+    """
+    variant = ImageOps.exif_transpose(image)
+    if variant.width > image_variant.width:
+        height = max(round(variant.height * image_variant.width / variant.width), 1)
+        variant = variant.resize((image_variant.width, height), Image.Resampling.LANCZOS)
+
+    # JPEG는 투명도를 지원하지 않으며, 팔레트 등 그 외 모드는 두 형식 모두 RGB(A)로 변환
+    has_alpha = variant.mode in ("RGBA", "LA", "PA") or "transparency" in variant.info
+    if image_variant.image_format == "WEBP" and has_alpha:
+        variant = variant.convert("RGBA")
+    else:
+        variant = variant.convert("RGB")
+
+    buffer = io.BytesIO()
+    variant.save(
+        buffer,
+        format=image_variant.image_format,
+        quality=settings.FILE_IMAGE_VARIANT_QUALITY,
+        optimize=True,
+        exif=b"",
+        icc_profile=image.info.get("icc_profile"),
+    )
+    return buffer.getvalue()
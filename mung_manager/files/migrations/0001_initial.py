@@ -0,0 +1,28 @@
+# Generated by Django 5.0.6 on 2024-06-28 14:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadedImage',
+            fields=[
+                ('id', models.AutoField(auto_created=True, db_column='uploaded_image_id', db_comment='업로드 이미지 아이디', primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_comment='생성 일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_comment='수정 일시')),
+                ('file_url', models.URLField(db_comment='원본 파일 URL', max_length=512, unique=True)),
+                ('content_hash', models.CharField(db_comment='원본 파일 BLAKE2b 해시', db_index=True, max_length=64)),
+                ('variant_urls', models.JSONField(db_comment='파생 이미지 이름별 URL', default=dict)),
+            ],
+            options={
+                'db_table': 'uploaded_image',
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import models
+
+from mung_manager.common.base.models import TimeStampedModel
+
+
+class UploadedImage(TimeStampedModel):
+    """
+    업로드된 이미지와 파생 이미지(썸네일) URL
+    """
+
+    id = models.AutoField(
+        auto_created=True,
+        primary_key=True,
+        db_column="uploaded_image_id",
+        serialize=False,
+        db_comment="업로드 이미지 아이디",
+    )
+    file_url = models.URLField(max_length=512, unique=True, db_comment="원본 파일 URL")
+    content_hash = models.CharField(max_length=64, db_index=True, db_comment="원본 파일 BLAKE2b 해시")
+    variant_urls = models.JSONField(default=dict, db_comment="파생 이미지 이름별 URL")
+
+    class Meta:
+        db_table = "uploaded_image"
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from mung_manager.errors.exceptions import NotImplementedException
+
+
+class AbstractUploadedImageSelector(ABC):
+    @abstractmethod
+    def get_variant_urls_by_file_url(self, file_url: str) -> dict[str, str]:
+        raise NotImplementedException()
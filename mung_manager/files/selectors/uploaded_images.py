@@ -0,0 +1,19 @@
+from mung_manager.files.models import UploadedImage
+from mung_manager.files.selectors.abstracts import AbstractUploadedImageSelector
+
+
+class UploadedImageSelector(AbstractUploadedImageSelector):
+    """이 클래스는 업로드 이미지를 DB에서 PULL하는 비즈니스 로직을 담당합니다."""
+
+    def get_variant_urls_by_file_url(self, file_url: str) -> dict[str, str]:
+        """
+        이 함수는 원본 파일 URL로 파생 이미지 URL을 조회합니다.
+
+        Args:
+            file_url (str): 원본 파일 URL
+
+        Returns:
+            dict[str, str]: 파생 이미지 이름별 URL이며 업로드 이미지가 아니면(기본 이미지 등) 빈 딕셔너리를 반환
+        """
+        variant_urls = UploadedImage.objects.filter(file_url=file_url).values_list("variant_urls", flat=True).first()
+        return variant_urls or {}
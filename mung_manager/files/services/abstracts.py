@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from mung_manager.errors.exceptions import NotImplementedException
+from mung_manager.files.storages import SpooledFile
 
 
 class AbstractFileUploadService(ABC):
@@ -9,13 +10,27 @@ class AbstractFileUploadService(ABC):
         raise NotImplementedException()
 
     @abstractmethod
-    def _validate_file_type(self):
+    def _validate_file_type(self) -> str:
         raise NotImplementedException()
 
     @abstractmethod
-    def _get_resource_path(self) -> str:
+    def _get_resource_path(self, content_hash: str, image_format: str) -> str:
         raise NotImplementedException()
 
     @abstractmethod
-    def upload_file(self) -> str:
+    def upload_file(self) -> SpooledFile:
+        raise NotImplementedException()
+
+
+class AbstractFileStorageService(ABC):
+    @abstractmethod
+    def push_spooled_file(self, spool_name: str, upload_path: str) -> str:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def delete_spooled_file(self, spool_name: str) -> None:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def create_image_variants(self, upload_path: str, content_hash: str) -> list[str]:
         raise NotImplementedException()
@@ -1,19 +1,34 @@
-from datetime import datetime
-
 from django.conf import settings
+from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from PIL import Image
 
 from mung_manager.common.constants import SYSTEM_CODE
 from mung_manager.errors.exceptions import ValidationException
-from mung_manager.files.services.abstracts import AbstractFileUploadService
+from mung_manager.files.images import (
+    create_image_variant,
+    get_content_hash,
+    get_image_variant_path,
+    get_image_variants,
+)
+from mung_manager.files.models import UploadedImage
+from mung_manager.files.services.abstracts import (
+    AbstractFileStorageService,
+    AbstractFileUploadService,
+)
+from mung_manager.files.storages import SpooledFile, get_spool_storage
 from mung_manager.files.utils import bytes_to_mib
 
 
 class FileUploadService(AbstractFileUploadService):
     """이 클래스는 파일 업로드와 관련된 비즈니스 로직을 담당합니다."""
 
-    MAX_TRY_COUNT = 3
+    # 허용하는 이미지 형식 (파일 앞부분의 시그니처로 판별)
+    ALLOWED_IMAGE_FORMATS = ("JPEG", "PNG", "GIF", "WEBP")
+    # True이면 JPEG를 draft 모드(1/8 크기)로 디코딩하여 손상된 파일까지 검출하고, False이면 구조만 검증
+    DECODE_IMAGE = True
+    # 파일 크기를 알 수 없는 경우 나누어 읽을 크기
+    READ_CHUNK_SIZE = 64 * 1024
 
     def __init__(self, file_obj, resource_type, user_id):
         self.file_obj = file_obj
@@ -21,9 +36,14 @@ class FileUploadService(AbstractFileUploadService):
         self.user_id = user_id
 
     def _validate_file_size(self):
-        """이 함수는 파일의 크기가 설정된 최대 크기를 넘지 않는지 확인합니다. (10MB)"""
+        """이 함수는 파일의 크기가 설정된 최대 크기를 넘지 않는지 확인합니다. (10MB)
+
+        업로드 파일의 크기(size)를 사용하며, 크기를 알 수 없는 경우에만 최대 크기를 넘을 때까지 나누어 읽습니다.
+        """
         max_size = settings.FILE_MAX_SIZE
-        file_size = len(self.file_obj.read())
+        file_size = getattr(self.file_obj, "size", None)
+        if file_size is None:
+            file_size = self._read_file_size(max_size)
 
         if file_size > max_size:
             raise ValidationException(
@@ -31,11 +51,32 @@ class FileUploadService(AbstractFileUploadService):
                 code=SYSTEM_CODE.code("MAX_FILE_SIZE"),
             )
 
-    def _validate_file_type(self):
-        """이 함수는 파일의 타입이 이미지인지 확인합니다."""
+    def _read_file_size(self, max_size: int) -> int:
+        file_size = 0
+        while chunk := self.file_obj.read(self.READ_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > max_size:
+                break
+        self.file_obj.seek(0)
+        return file_size
+
+    def _validate_file_type(self) -> str:
+        """이 함수는 파일의 타입이 허용된 이미지인지 확인합니다.
+
+        이미지 형식은 파일 앞부분의 시그니처로 판별하며, JPEG는 draft 모드로 축소 디코딩하고
+        그 외 형식은 픽셀을 디코딩하지 않고 구조만 검증합니다. 검증이 끝나면 저장을 위해 파일 위치를 한 번만 되돌립니다.
+
+        Returns:
+            str: 이미지 형식 (ALLOWED_IMAGE_FORMATS 중 하나)
+        """
         try:
-            file = Image.open(self.file_obj)
-            file.verify()
+            image = Image.open(self.file_obj, formats=self.ALLOWED_IMAGE_FORMATS)
+            if self.DECODE_IMAGE and image.format == "JPEG":
+                image.draft(image.mode, (max(image.width // 8, 1), max(image.height // 8, 1)))
+                image.load()
+            else:
+                image.verify()
+            return image.format
 
         except Exception as e:
             raise ValidationException(
@@ -43,51 +84,160 @@ class FileUploadService(AbstractFileUploadService):
                 code=SYSTEM_CODE.code("INVALID_FILE_TYPE"),
             )
 
-    def _get_resource_path(self) -> str:
+        finally:
+            self.file_obj.seek(0)
+
+    def _get_resource_path(self, content_hash: str, image_format: str) -> str:
         """이 함수는 파일을 업로드할 경로를 반환합니다.
 
+        경로는 파일 내용의 해시와 이미지 형식으로만 정해지므로 같은 파일은 항상 같은 경로에 업로드되며,
+        경로의 내용이 바뀌지 않으므로 변경 불가능한 캐시(AWS_S3_IMMUTABLE_CACHE_CONTROL)로 제공합니다.
+
+        Args:
+            content_hash (str): 파일 내용의 해시
+            image_format (str): 이미지 형식
+
         Returns:
             resource_path(str): 파일을 업로드할 경로
         """
-        id_path = str(self.user_id)
-        ext = str(self.file_obj.name).split(".")[-1]
+        ext = image_format.lower()
 
         if self.resource_type == "pet_kindergarden":
-            resource_path = (
-                "users/" + id_path + "/pet-kindergarden/" + datetime.now().strftime("%Y-%m-%d-%H-%M-%S.%f") + "." + ext
-            )
+            resource_path = "images/pet-kindergarden/" + content_hash[:2] + "/" + content_hash + "." + ext
 
         return resource_path
 
-    def upload_file(self) -> str:
-        """이 파일을 검증하고 AWS S3에 업로드합니다.
+    def upload_file(self) -> SpooledFile:
+        """이 파일을 검증하고 AWS S3에 업로드하기 위해 스풀 저장소에 저장합니다.
+
+        AWS S3 업로드는 반환된 스풀 파일로 push_spooled_file 작업을 실행하여 백그라운드에서 처리하며,
+        파일 URL은 업로드 경로로 미리 정해지므로 업로드가 끝나기 전에 반환할 수 있습니다.
+        파생 이미지 URL도 파일 내용의 해시로 미리 정해지므로 원본 파일 URL과 함께 저장합니다.
 
         Returns:
-            file_url(str): 업로드된 파일의 URL
+            SpooledFile: 스풀 파일 이름, 업로드 경로, 업로드될 파일의 URL, 파일 해시, 파생 이미지 URL
         """
         try:
             # 파일 크기 검증
             self._validate_file_size()
 
             # 파일 타입 검증
-            self._validate_file_type()
+            image_format = self._validate_file_type()
 
             # 파일 업로드 경로 설정
-            upload_path = self._get_resource_path()
-
-            # 파일 업로드 (최대 3회 시도)
-            # @TODO: Celery로 비동기 처리
-            for attempt in range(1, self.MAX_TRY_COUNT + 1):
-                try:
-                    default_storage.save(upload_path, self.file_obj)
-                    break
-                except Exception as e:
-                    if attempt < self.MAX_TRY_COUNT:
-                        continue
-                    else:
-                        raise ValidationException(str(e))
-
-            return settings.AWS_S3_URL + "/" + upload_path
+            content_hash = get_content_hash(self.file_obj)
+            upload_path = self._get_resource_path(content_hash, image_format)
+
+            # 파생 이미지 경로 설정
+            variant_urls = {
+                image_variant.name: settings.AWS_S3_URL + "/" + get_image_variant_path(content_hash, image_variant)
+                for image_variant in get_image_variants()
+            }
+
+            # 로컬 스풀 저장소에 저장
+            spool_name = get_spool_storage().save(upload_path, self.file_obj)
+
+            # 같은 파일을 다시 업로드한 경우 업로드 경로가 같으므로 기존 업로드 이미지를 사용
+            file_url = settings.AWS_S3_URL + "/" + upload_path
+            UploadedImage.objects.get_or_create(
+                file_url=file_url,
+                defaults={"content_hash": content_hash, "variant_urls": variant_urls},
+            )
+
+            return SpooledFile(
+                spool_name=spool_name,
+                upload_path=upload_path,
+                file_url=file_url,
+                content_hash=content_hash,
+                variant_urls=variant_urls,
+            )
 
         except Exception as e:
             raise ValidationException(str(e))
+
+
+class FileStorageService(AbstractFileStorageService):
+    """이 클래스는 스풀 저장소의 파일을 AWS S3로 옮기는 비즈니스 로직을 담당합니다."""
+
+    def push_spooled_file(self, spool_name: str, upload_path: str) -> str:
+        """이 함수는 스풀 저장소의 파일을 AWS S3에 업로드하고 스풀 파일을 삭제합니다.
+
+        업로드 경로는 파일 내용의 해시이므로 AWS S3에 이미 있는 파일은 같은 내용으로 간주하여 다시 업로드하지 않으며,
+        재시도로 여러 번 실행되어도 결과가 같습니다.
+
+        Args:
+            spool_name (str): 스풀 저장소의 파일 이름
+            upload_path (str): AWS S3에 업로드할 경로
+
+        Returns:
+            str: 업로드된 경로
+
+        Raises:
+            FileNotFoundError: 스풀 파일이 없고 AWS S3에도 업로드되지 않은 경우
+        """
+        spool_storage = get_spool_storage()
+
+        # 이전 시도에서 업로드 후 스풀 파일 삭제까지 끝난 경우
+        if not spool_storage.exists(spool_name):
+            if default_storage.exists(upload_path):
+                return upload_path
+            raise FileNotFoundError(f"Spooled file does not exist: {spool_name}")
+
+        # 같은 파일이 이미 업로드된 경우 업로드하지 않고 스풀 파일만 삭제
+        if not default_storage.exists(upload_path):
+            with spool_storage.open(spool_name, "rb") as spooled_file:
+                default_storage.save(upload_path, spooled_file)
+
+        spool_storage.delete(spool_name)
+        return upload_path
+
+    def delete_spooled_file(self, spool_name: str) -> None:
+        """이 함수는 AWS S3에 업로드하지 않을 스풀 파일을 삭제합니다.
+
+        업로드 작업을 실행하지 못한 경우 스풀 저장소에 파일이 남지 않도록 호출합니다.
+
+        Args:
+            spool_name (str): 스풀 저장소의 파일 이름
+        """
+        get_spool_storage().delete(spool_name)
+
+    def create_image_variants(self, upload_path: str, content_hash: str) -> list[str]:
+        """이 함수는 AWS S3에 업로드된 원본 이미지로 파생 이미지(썸네일)를 생성하여 업로드합니다.
+
+        파생 이미지 경로는 원본 이미지의 해시로 정해지므로 이미 업로드된 파생 이미지는 다시 생성하지 않으며,
+        같은 이미지를 다시 업로드하거나 작업이 재시도되어도 중복으로 업로드되지 않습니다.
+
+        Args:
+            upload_path (str): 원본 이미지가 업로드된 경로
+            content_hash (str): 원본 이미지의 해시
+
+        Returns:
+            list[str]: 새로 업로드된 파생 이미지 경로 리스트
+        """
+        image_variants = [
+            (image_variant, get_image_variant_path(content_hash, image_variant))
+            for image_variant in get_image_variants()
+        ]
+        image_variants = [
+            (image_variant, variant_path)
+            for image_variant, variant_path in image_variants
+            if not default_storage.exists(variant_path)
+        ]
+        if not image_variants:
+            return []
+
+        variant_paths = []
+        with default_storage.open(upload_path, "rb") as original_file, Image.open(original_file) as image:
+            # JPEG는 가장 큰 파생 이미지 너비 이상을 유지하는 범위에서 축소 디코딩
+            # EXIF 방향에 따라 회전될 수 있으므로 가로, 세로 모두 너비 이상을 유지
+            max_width = max(image_variant.width for image_variant, _ in image_variants)
+            image.draft(image.mode, (max_width, max_width))
+            image.load()
+
+            for image_variant, variant_path in image_variants:
+                variant_file = ContentFile(create_image_variant(image, image_variant))
+                variant_file.content_type = image_variant.content_type  # type: ignore
+                default_storage.save(variant_path, variant_file)
+                variant_paths.append(variant_path)
+
+        return variant_paths
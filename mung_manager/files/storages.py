@@ -0,0 +1,55 @@
+import functools
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.files.storage import Storage
+from django.utils.module_loading import import_string
+from storages.backends.s3boto3 import S3Boto3Storage
+
+
+class SpooledFile(NamedTuple):
+    """이 클래스는 스풀 저장소에 저장되어 AWS S3 업로드를 기다리는 파일입니다.
+
+    Attributes:
+        spool_name (str): 스풀 저장소의 파일 이름
+        upload_path (str): AWS S3에 업로드할 경로
+        file_url (str): 업로드가 끝나면 파일에 접근할 URL
+        content_hash (str): 파일 내용의 BLAKE2b 해시
+        variant_urls (dict[str, str]): 파생 이미지 생성이 끝나면 접근할 파생 이미지 이름별 URL
+    """
+
+    spool_name: str
+    upload_path: str
+    file_url: str
+    content_hash: str
+    variant_urls: dict[str, str]
+
+
+@functools.cache
+def get_spool_storage() -> Storage:
+    """이 함수는 업로드 파일을 AWS S3로 옮기기 전에 임시로 저장하는 스풀 저장소를 반환합니다.
+
+    웹 서버와 Celery 워커가 같은 파일을 읽어야 하므로 FILE_UPLOAD_SPOOL_ROOT는 공유 볼륨이어야 하며,
+    프로세스마다 같은 인스턴스를 사용하므로 InMemoryStorage로 바꾸면 eager 모드에서 테스트할 수 있습니다.
+
+    Returns:
+        Storage: 스풀 저장소
+    """
+    storage_class = import_string(settings.FILE_UPLOAD_SPOOL_STORAGE)
+    return storage_class(location=settings.FILE_UPLOAD_SPOOL_ROOT)
+
+
+class ContentAddressedS3Storage(S3Boto3Storage):
+    """이 클래스는 파일 내용의 해시를 경로로 사용하는 파일을 변경 불가능한 캐시로 업로드하는 AWS S3 저장소입니다.
+
+    AWS_S3_OBJECT_PARAMETERS를 기본으로 사용하며, 경로가 AWS_S3_IMMUTABLE_PATH_PREFIXES로 시작하는 파일만
+    CacheControl을 AWS_S3_IMMUTABLE_CACHE_CONTROL로 대체합니다.
+    """
+
+    def get_object_parameters(self, name: str) -> dict:
+        object_parameters = super().get_object_parameters(name)
+        # 업로드 시에는 AWS_LOCATION이 붙은 이름으로 호출되므로 제외하고 비교
+        path = name.removeprefix(self.location).lstrip("/")
+        if path.startswith(tuple(settings.AWS_S3_IMMUTABLE_PATH_PREFIXES)):
+            object_parameters["CacheControl"] = settings.AWS_S3_IMMUTABLE_CACHE_CONTROL
+        return object_parameters
@@ -8,6 +8,7 @@ from mung_manager.pet_kindergardens.apis.customers.apis import (
     CustomerBatchRegisterAPI,
     CustomerCreateAPI,
     CustomerDetailAPI,
+    CustomerImportJobDetailAPI,
     CustomerListAPI,
     CustomerTicketActiveListAPI,
     CustomerTicketCreateAPI,
@@ -31,11 +32,12 @@ from mung_manager.schemas.errors.commons import (
     ErrorNotAuthenticatedSchema,
     ErrorPermissionDeniedSchema,
     ErrorPhoneNumberInvalidSchema,
+    ErrorTaskEnqueueFailedSchema,
     ErrorUnknownServerSchema,
 )
 from mung_manager.schemas.errors.customers import (
     ErrorCustomerAlreadyExistsSchema,
-    ErrorCustomerCsvPhoneNumberDuplicatedSchema,
+    ErrorCustomerImportJobNotFoundSchema,
     ErrorCustomerNotFoundSchema,
     ErrorCustomerPetAlreadyExistsSchema,
     ErrorCustomerPetNameDuplicatedSchema,
@@ -153,19 +155,19 @@ class CustomerBatchRegisterAPIManager(BaseAPIManager):
         summary="반려동물 유치원 고객 일괄 등록",
         description="""
         Rogic
-            - 유저가 반려동물 유치원 고객을 일괄 등록합니다.
+            - 유저가 반려동물 유치원 고객 일괄 등록 작업을 생성합니다.
+            - CSV 파일은 백그라운드에서 처리되며 작업 상태 조회 API로 진행 상황과 결과를 확인합니다.
+            - 검증에 실패한 행(빈 값, 전화번호 형식, 반려동물 이름 중복, 파일 내 전화번호 중복, 기존 고객)은
+              등록하지 않고 행 번호와 오류를 결과의 errors에 담으며, 나머지 행은 등록합니다.
+            - 백그라운드 작업을 실행하지 못하면 작업을 생성하지 않고 503을 반환합니다.
         """,
         request=VIEWS_BY_METHOD["POST"]().cls.InputSerializer,
         responses={
-            status.HTTP_201_CREATED: VIEWS_BY_METHOD["POST"]().cls.OutputSerializer,
+            status.HTTP_202_ACCEPTED: VIEWS_BY_METHOD["POST"]().cls.OutputSerializer,
             status.HTTP_400_BAD_REQUEST: OpenApiResponse(
                 response=OpenApiTypes.OBJECT,
                 examples=[
                     ErrorInvalidParameterFormatSchema,
-                    ErrorCustomerCsvPhoneNumberDuplicatedSchema,
-                    ErrorCustomerPetNameDuplicatedSchema,
-                    ErrorPhoneNumberInvalidSchema,
-                    ErrorCustomerAlreadyExistsSchema,
                 ],
             ),
             status.HTTP_401_UNAUTHORIZED: OpenApiResponse(
@@ -191,12 +193,60 @@ class CustomerBatchRegisterAPIManager(BaseAPIManager):
             status.HTTP_500_INTERNAL_SERVER_ERROR: OpenApiResponse(
                 response=OpenApiTypes.OBJECT, examples=[ErrorUnknownServerSchema]
             ),
+            status.HTTP_503_SERVICE_UNAVAILABLE: OpenApiResponse(
+                response=OpenApiTypes.OBJECT, examples=[ErrorTaskEnqueueFailedSchema]
+            ),
         },
     )
     def post(self, request, *args, **kwargs):
         return self.VIEWS_BY_METHOD["POST"]()(request, *args, **kwargs)
 
 
+class CustomerImportJobDetailAPIManager(BaseAPIManager):
+    VIEWS_BY_METHOD = {
+        "GET": CustomerImportJobDetailAPI.as_view,
+    }
+
+    @extend_schema(
+        tags=["반려동물 유치원-고객"],
+        summary="반려동물 유치원 고객 일괄 등록 작업 상태 조회",
+        description="""
+        Rogic
+            - 유저가 반려동물 유치원 고객 일괄 등록 작업의 상태를 조회합니다.
+            - 처리 중(PROGRESS)인 경우 progress, 완료(SUCCESS)된 경우 result를 반환합니다.
+        """,
+        responses={
+            status.HTTP_200_OK: VIEWS_BY_METHOD["GET"]().cls.OutputSerializer,
+            status.HTTP_401_UNAUTHORIZED: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    ErrorAuthenticationFailedSchema,
+                    ErrorNotAuthenticatedSchema,
+                    ErrorInvalidTokenSchema,
+                    ErrorAuthorizationHeaderSchema,
+                    ErrorAuthenticationPasswordChangedSchema,
+                    ErrorAuthenticationUserDeletedSchema,
+                    ErrorAuthenticationUserInactiveSchema,
+                    ErrorAuthenticationUserNotFoundSchema,
+                    ErrorTokenIdentificationSchema,
+                ],
+            ),
+            status.HTTP_403_FORBIDDEN: OpenApiResponse(
+                response=OpenApiTypes.OBJECT, examples=[ErrorPermissionDeniedSchema]
+            ),
+            status.HTTP_404_NOT_FOUND: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                examples=[ErrorCustomerImportJobNotFoundSchema, ErrorPetKindergardenNotFoundSchema],
+            ),
+            status.HTTP_500_INTERNAL_SERVER_ERROR: OpenApiResponse(
+                response=OpenApiTypes.OBJECT, examples=[ErrorUnknownServerSchema]
+            ),
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        return self.VIEWS_BY_METHOD["GET"]()(request, *args, **kwargs)
+
+
 class CustomerDetailAPIManager(BaseAPIManager):
     VIEWS_BY_METHOD = {
         "GET": CustomerDetailAPI.as_view,
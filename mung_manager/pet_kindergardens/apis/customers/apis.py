@@ -1,11 +1,12 @@
 from django.utils import timezone
+from kombu.exceptions import OperationalError
 from rest_framework import serializers, status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from mung_manager.apis.mixins import APIAuthMixin
-from mung_manager.apis.pagination import LimitOffsetPagination, get_paginated_data
+from mung_manager.apis.pagination import KeysetPagination, get_paginated_data
 from mung_manager.common.base.serializers import BaseSerializer
 from mung_manager.common.constants import SYSTEM_CODE
 from mung_manager.common.selectors import (
@@ -18,25 +19,30 @@ from mung_manager.common.validators import (
     UniquePetNameValidator,
 )
 from mung_manager.customers.containers import CustomerContainer
+from mung_manager.errors.exceptions import ServiceUnavailableException
+from mung_manager.tasks.tasks import import_customers_by_csv
 from mung_manager.tickets.containers import TicketContainer
 
 
 class CustomerListAPI(APIAuthMixin, APIView):
-    class Pagination(LimitOffsetPagination):
-        default_limit = 10
+    class Pagination(KeysetPagination):
+        page_size = 10
+        max_page_size = 50
+        count_mode = "exact"
 
     class FilterSerializer(BaseSerializer):
         customer_name = serializers.CharField(required=False, help_text="이름")
         customer_phone_number = serializers.CharField(required=False, help_text="고객 전화번호")
         customer_pet_name = serializers.CharField(required=False, help_text="반려동물 이름")
         is_active = serializers.BooleanField(required=True, help_text="활성화 여부")
-        limit = serializers.IntegerField(
-            default=10,
+        cursor = serializers.CharField(required=False, help_text="커서")
+        page_size = serializers.IntegerField(
+            required=False,
+            help_text="페이지 크기",
             min_value=1,
             max_value=50,
-            help_text="페이지당 조회 개수",
+            default=10,
         )
-        offset = serializers.IntegerField(default=0, min_value=0, help_text="페이지 오프셋")
 
     class OutputSerializer(BaseSerializer):
         id = serializers.IntegerField(label="고객 아이디")
@@ -68,27 +74,21 @@ class CustomerListAPI(APIAuthMixin, APIView):
             },
         )
         memo = serializers.CharField(label="메모")
-        recent_reserved_at = serializers.DateTimeField(label="최근 예약 일시")
+        recent_reserved_at = serializers.DateTimeField(source="last_reserved_at", label="최근 예약 일시")
         created_at = serializers.DateTimeField(label="생성 일시")
         is_active = serializers.BooleanField(label="활성화 여부")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._pet_kindergarden_selector = CustomerContainer.pet_kindergarden_selector()
         self._customer_selector = CustomerContainer.customer_selector()
 
     def get(self, request: Request, pet_kindergarden_id: int) -> Response:
         filter_serializer = self.FilterSerializer(data=request.query_params)
         filter_serializer.is_valid(raise_exception=True)
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=request.user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
+        customers = self._customer_selector.get_by_filter_for_search(
+            pet_kindergarden_id=pet_kindergarden_id,
+            filters=filter_serializer.validated_data,
         )
-        customers = self._customer_selector.get_by_filter_for_search(filters=filter_serializer.validated_data)
         pagination_customers_data = get_paginated_data(
             pagination_class=self.Pagination,
             serializer_class=self.OutputSerializer,
@@ -137,8 +137,7 @@ class CustomerCreateAPI(APIAuthMixin, APIView):
         input_serializer = self.InputSerializer(data=request.data)
         input_serializer.is_valid(raise_exception=True)
         customer = self._customer_service.create_customer(
-            pet_kindergarden_id=pet_kindergarden_id,
-            user=request.user,
+            tenant=self.get_tenant(),
             **input_serializer.validated_data,
         )
         customer_data = self.OutputSerializer(customer).data
@@ -150,17 +149,8 @@ class CustomerBatchRegisterAPI(APIAuthMixin, APIView):
         csv_file = serializers.FileField(required=True, label="CSV 파일")
 
     class OutputSerializer(BaseSerializer):
-        id = serializers.IntegerField(label="고객 아이디")
-        name = serializers.CharField(label="고객 이름")
-        phone_number = serializers.CharField(label="고객 전화번호")
-        customer_pets = inline_serializer(
-            label="고객 반려동물 목록",
-            many=True,
-            fields={
-                "id": serializers.IntegerField(label="반려동물 아이디"),
-                "name": serializers.CharField(label="반려동물 이름"),
-            },
-        )
+        id = serializers.IntegerField(label="고객 일괄 등록 작업 아이디")
+        created_at = serializers.DateTimeField(label="생성 일시")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -169,13 +159,80 @@ class CustomerBatchRegisterAPI(APIAuthMixin, APIView):
     def post(self, request: Request, pet_kindergarden_id: int) -> Response:
         input_serializer = self.InputSerializer(data=request.data)
         input_serializer.is_valid(raise_exception=True)
-        customers = self._customer_service.create_customers_by_csv(
-            pet_kindergarden_id=pet_kindergarden_id,
-            user=request.user,
+        customer_import_job = self._customer_service.create_customer_import_job(
+            tenant=self.get_tenant(),
             csv_file=input_serializer.validated_data["csv_file"],
         )
-        customers_data = self.OutputSerializer(customers, many=True).data
-        return Response(data=customers_data, status=status.HTTP_201_CREATED)
+        # 작업 생성 트랜잭션이 커밋된 뒤 실행하므로 워커에서 작업을 조회할 수 있음
+        try:
+            import_customers_by_csv.apply_async(args=[customer_import_job.id], task_id=customer_import_job.task_id)
+        except OperationalError:
+            # 브로커에 연결할 수 없으면 처리되지 않을 작업을 남기지 않음
+            self._customer_service.delete_customer_import_job(customer_import_job=customer_import_job)
+            raise ServiceUnavailableException(
+                detail=SYSTEM_CODE.message("TASK_ENQUEUE_FAILED"),
+                code=SYSTEM_CODE.code("TASK_ENQUEUE_FAILED"),
+            )
+        customer_import_job_data = self.OutputSerializer(customer_import_job).data
+        return Response(data=customer_import_job_data, status=status.HTTP_202_ACCEPTED)
+
+
+class CustomerImportJobDetailAPI(APIAuthMixin, APIView):
+    class OutputSerializer(BaseSerializer):
+        id = serializers.IntegerField(label="고객 일괄 등록 작업 아이디")
+        status = serializers.CharField(label="작업 상태 (PENDING, PROGRESS, SUCCESS, FAILURE)")
+        progress = inline_serializer(
+            label="진행 상황 (처리 중인 경우)",
+            allow_null=True,
+            fields={
+                "processed_row_count": serializers.IntegerField(label="처리한 행 수"),
+                "created_count": serializers.IntegerField(label="등록된 고객 수"),
+                "error_count": serializers.IntegerField(label="등록하지 못한 행 수"),
+            },
+        )
+        result = inline_serializer(
+            label="등록 결과 (완료된 경우)",
+            allow_null=True,
+            fields={
+                "created_count": serializers.IntegerField(label="등록된 고객 수"),
+                "error_count": serializers.IntegerField(label="등록하지 못한 행 수"),
+                "errors": inline_serializer(
+                    label="행별 오류 목록",
+                    many=True,
+                    fields={
+                        "row_number": serializers.IntegerField(label="행 번호"),
+                        "code": serializers.CharField(label="오류 코드"),
+                        "message": serializers.CharField(label="오류 메시지"),
+                    },
+                ),
+            },
+        )
+        created_at = serializers.DateTimeField(label="생성 일시")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._customer_import_job_selector = CustomerContainer.customer_import_job_selector()
+
+    def get(self, request: Request, pet_kindergarden_id: int, customer_import_job_id: int) -> Response:
+        customer_import_job = get_object_or_not_found(
+            self._customer_import_job_selector.get_by_id_and_pet_kindergarden_id(
+                customer_import_job_id=customer_import_job_id,
+                pet_kindergarden_id=pet_kindergarden_id,
+            ),
+            msg=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER_IMPORT_JOB"),
+            code=SYSTEM_CODE.code("NOT_FOUND_CUSTOMER_IMPORT_JOB"),
+        )
+        customer_import_job_state = self._customer_import_job_selector.get_state_by_task_id(
+            task_id=customer_import_job.task_id,
+        )
+        customer_import_job_data = self.OutputSerializer(
+            {
+                "id": customer_import_job.id,
+                "created_at": customer_import_job.created_at,
+                **customer_import_job_state._asdict(),
+            }
+        ).data
+        return Response(data=customer_import_job_data, status=status.HTTP_200_OK)
 
 
 class CustomerDetailAPI(APIAuthMixin, APIView):
@@ -202,18 +259,9 @@ class CustomerDetailAPI(APIAuthMixin, APIView):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._pet_kindergarden_selector = CustomerContainer.pet_kindergarden_selector()
         self._customer_selector = CustomerContainer.customer_selector()
 
     def get(self, request: Request, pet_kindergarden_id: int, customer_id: int) -> Response:
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=request.user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
         customer = get_object_or_not_found(
             self._customer_selector.get_with_undeleted_customer_pet_by_id(
                 customer_id=customer_id,
@@ -236,8 +284,7 @@ class CustomerToggleActiveAPI(APIAuthMixin, APIView):
 
     def patch(self, request: Request, pet_kindergarden_id: int, customer_id: int) -> Response:
         customer = self._customer_service.toggle_customer_is_active(
-            pet_kindergarden_id=pet_kindergarden_id,
-            user=request.user,
+            tenant=self.get_tenant(),
             customer_id=customer_id,
         )
         customer_data = self.OutputSerializer(customer).data
@@ -293,8 +340,7 @@ class CustomerUpdateAPI(APIAuthMixin, APIView):
         input_serializer = self.InputSerializer(data=request.data)
         input_serializer.is_valid(raise_exception=True)
         customer = self._customer_service.update_customer(
-            pet_kindergarden_id=pet_kindergarden_id,
-            user=request.user,
+            tenant=self.get_tenant(),
             customer_id=customer_id,
             **input_serializer.validated_data,
         )
@@ -313,18 +359,9 @@ class CustomerTicketActiveListAPI(APIAuthMixin, APIView):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._pet_kindergarden_selector = CustomerContainer.pet_kindergarden_selector()
         self._ticket_selector = TicketContainer.ticket_selector()
 
     def get(self, request: Request, pet_kindergarden_id: int) -> Response:
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=request.user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
         tickets = self._ticket_selector.get_querset_by_pet_kindergarden_id_for_undeleted_ticket(
             pet_kindergarden_id=pet_kindergarden_id,
         )
@@ -333,17 +370,20 @@ class CustomerTicketActiveListAPI(APIAuthMixin, APIView):
 
 
 class CustomerTicketListAPI(APIAuthMixin, APIView):
-    class Pagination(LimitOffsetPagination):
-        default_limit = 10
+    class Pagination(KeysetPagination):
+        page_size = 10
+        max_page_size = 50
+        count_mode = "exact"
 
     class FilterSerializer(BaseSerializer):
-        limit = serializers.IntegerField(
-            default=10,
+        cursor = serializers.CharField(required=False, help_text="커서")
+        page_size = serializers.IntegerField(
+            required=False,
+            help_text="페이지 크기",
             min_value=1,
             max_value=50,
-            help_text="페이지당 조회 개수",
+            default=10,
         )
-        offset = serializers.IntegerField(default=0, min_value=0, help_text="페이지 오프셋")
 
     class OutputSerializer(BaseSerializer):
         id = serializers.IntegerField(label="고객 티켓 등록 로그 아이디")
@@ -365,19 +405,10 @@ class CustomerTicketListAPI(APIAuthMixin, APIView):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._pet_kindergarden_selector = CustomerContainer.pet_kindergarden_selector()
         self._customer_selector = CustomerContainer.customer_selector()
         self._customer_ticket_registration_log_selector = CustomerContainer.customer_ticket_registration_log_selector()
 
     def get(self, request: Request, pet_kindergarden_id: int, customer_id: int) -> Response:
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=request.user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
         check_object_or_not_found(
             self._customer_selector.exists_by_id(customer_id=customer_id),
             msg=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER"),
@@ -419,8 +450,7 @@ class CustomerTicketCreateAPI(APIAuthMixin, APIView):
     ) -> Response:
         customer_ticket = self._customer_ticket_service.register_ticket(
             customer_id=customer_id,
-            pet_kindergarden_id=pet_kindergarden_id,
-            user=request.user,
+            tenant=self.get_tenant(),
             ticket_id=ticket_id,
         )
 
@@ -429,17 +459,20 @@ class CustomerTicketCreateAPI(APIAuthMixin, APIView):
 
 
 class CustomerTicketLogListAPI(APIAuthMixin, APIView):
-    class Pagination(LimitOffsetPagination):
-        default_limit = 10
+    class Pagination(KeysetPagination):
+        page_size = 10
+        max_page_size = 50
+        count_mode = "exact"
 
     class FilterSerializer(BaseSerializer):
-        limit = serializers.IntegerField(
-            default=10,
+        cursor = serializers.CharField(required=False, help_text="커서")
+        page_size = serializers.IntegerField(
+            required=False,
+            help_text="페이지 크기",
             min_value=1,
             max_value=50,
-            help_text="페이지당 조회 개수",
+            default=10,
         )
-        offset = serializers.IntegerField(default=0, min_value=0, help_text="페이지 오프셋")
 
     class OutputSerializer(BaseSerializer):
         id = serializers.IntegerField(label="고객 티켓 사용 로그 아이디")
@@ -455,19 +488,10 @@ class CustomerTicketLogListAPI(APIAuthMixin, APIView):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._pet_kindergarden_selector = CustomerContainer.pet_kindergarden_selector()
         self._customer_selector = CustomerContainer.customer_selector()
         self._customer_ticket_usage_log_selector = CustomerContainer.customer_ticket_usage_log_selector()
 
     def get(self, request: Request, pet_kindergarden_id: int, customer_id: int) -> Response:
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=request.user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
         check_object_or_not_found(
             self._customer_selector.exists_by_id(customer_id=customer_id),
             msg=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER"),
@@ -179,9 +179,16 @@ class PetkindergardenSearchAPIManager(BaseAPIManager):
         description="""
         Rogic
             - 유저가 반려동물 유치원을 검색합니다.
+            - 이름(name) 또는 위도, 경도(latitude, longitude)로 검색하며 둘 다 입력하면 두 조건을 모두 만족하는 결과를 반환합니다.
+            - 이름만 입력하면 이름 또는 도로명 주소에 검색어를 포함하는 결과를 유사도가 높은 순서로 반환합니다.
+              (공백, 대소문자와 관계없이 검색하며 입력 중인 한글 자모로도 검색할 수 있습니다.)
+            - 위도, 경도로 검색하면 반경(radius, 기본 3km) 이내의 결과를 가까운 순서로 반환하며,
+              이름과 함께 검색하면 이름이 검색어로 시작하는 결과를 먼저 반환합니다.
+            - 거리(distance)는 위도, 경도로 검색한 경우에만 응답에 포함합니다.
         """,
+        parameters=[VIEWS_BY_METHOD["GET"]().cls.FilterSerializer],
         responses={
-            status.HTTP_200_OK: VIEWS_BY_METHOD["GET"]().cls.OutputSerializer,
+            status.HTTP_200_OK: VIEWS_BY_METHOD["GET"]().cls.DistanceOutputSerializer,
             status.HTTP_400_BAD_REQUEST: OpenApiResponse(
                 response=OpenApiTypes.OBJECT, examples=[ErrorInvalidParameterFormatSchema]
             ),
@@ -14,6 +14,10 @@ from mung_manager.pet_kindergardens.enums import (
     ReservationAvailabilityOption,
     ReservationChangeOption,
 )
+from mung_manager.pet_kindergardens.search import (
+    DEFAULT_SEARCH_RADIUS,
+    MAX_SEARCH_RADIUS,
+)
 
 
 class PetKindergardenCreateAPI(APIAuthMixin, APIView):
@@ -87,6 +91,16 @@ class PetKindergardenCreateAPI(APIAuthMixin, APIView):
         name = serializers.CharField(label="반려동물 유치원 이름")
         main_thumbnail_url = serializers.URLField(label="메인 이미지 URL")
         profile_thumbnail_url = serializers.URLField(label="프로필 이미지 URL")
+        main_thumbnail_variant_urls = serializers.DictField(
+            child=serializers.URLField(),
+            label="메인 이미지 파생 이미지 URL",
+            help_text="파생 이미지 이름(w{너비}.{형식})별 URL이며 업로드한 이미지가 아니면 빈 객체",
+        )
+        profile_thumbnail_variant_urls = serializers.DictField(
+            child=serializers.URLField(),
+            label="프로필 이미지 파생 이미지 URL",
+            help_text="파생 이미지 이름(w{너비}.{형식})별 URL이며 업로드한 이미지가 아니면 빈 객체",
+        )
         phone_number = serializers.CharField(label="전화번호")
         visible_phone_number = serializers.ListField(child=serializers.CharField(), label="노출 전화번호")
         business_start_hour = serializers.TimeField(label="영업 시작 시간")
@@ -185,6 +199,16 @@ class PetKindergardenUpdateAPI(APIAuthMixin, APIView):
         name = serializers.CharField(label="반려동물 유치원 이름")
         main_thumbnail_url = serializers.URLField(label="메인 이미지 URL")
         profile_thumbnail_url = serializers.URLField(label="프로필 이미지 URL")
+        main_thumbnail_variant_urls = serializers.DictField(
+            child=serializers.URLField(),
+            label="메인 이미지 파생 이미지 URL",
+            help_text="파생 이미지 이름(w{너비}.{형식})별 URL이며 업로드한 이미지가 아니면 빈 객체",
+        )
+        profile_thumbnail_variant_urls = serializers.DictField(
+            child=serializers.URLField(),
+            label="프로필 이미지 파생 이미지 URL",
+            help_text="파생 이미지 이름(w{너비}.{형식})별 URL이며 업로드한 이미지가 아니면 빈 객체",
+        )
         phone_number = serializers.CharField(label="전화번호")
         visible_phone_number = serializers.ListField(child=serializers.CharField(), label="노출 전화번호")
         business_start_hour = serializers.TimeField(label="영업 시작 시간")
@@ -220,6 +244,16 @@ class PetKindergardenDetailAPI(APIAuthMixin, APIView):
         name = serializers.CharField(label="반려동물 유치원 이름")
         main_thumbnail_url = serializers.URLField(label="메인 이미지 URL")
         profile_thumbnail_url = serializers.URLField(label="프로필 이미지 URL")
+        main_thumbnail_variant_urls = serializers.DictField(
+            child=serializers.URLField(),
+            label="메인 이미지 파생 이미지 URL",
+            help_text="파생 이미지 이름(w{너비}.{형식})별 URL이며 업로드한 이미지가 아니면 빈 객체",
+        )
+        profile_thumbnail_variant_urls = serializers.DictField(
+            child=serializers.URLField(),
+            label="프로필 이미지 파생 이미지 URL",
+            help_text="파생 이미지 이름(w{너비}.{형식})별 URL이며 업로드한 이미지가 아니면 빈 객체",
+        )
         phone_number = serializers.CharField(label="전화번호")
         visible_phone_number = serializers.ListField(child=serializers.CharField(), label="노출 전화번호")
         business_start_hour = serializers.TimeField(label="영업 시작 시간")
@@ -255,10 +289,27 @@ class PetKindergardenSearchAPI(APIAuthMixin, APIView):
         default_limit = 10
 
     class FilterSerializer(BaseSerializer):
-        name = serializers.CharField(max_length=64, label="반려동물 유치원 이름")
+        name = serializers.CharField(required=False, max_length=64, label="반려동물 유치원 이름")
+        latitude = serializers.FloatField(required=False, min_value=-90, max_value=90, label="위도")
+        longitude = serializers.FloatField(required=False, min_value=-180, max_value=180, label="경도")
+        radius = serializers.IntegerField(
+            default=DEFAULT_SEARCH_RADIUS,
+            min_value=1,
+            max_value=MAX_SEARCH_RADIUS,
+            label="반경 (m)",
+            help_text="위도, 경도가 있는 경우에만 사용",
+        )
         limit = serializers.IntegerField(default=10, min_value=1, max_value=50, label="조회 개수")
         offset = serializers.IntegerField(default=0, min_value=0, label="조회 시작 위치")
 
+        def validate(self, attrs):
+            has_latitude = "latitude" in attrs
+            if has_latitude != ("longitude" in attrs):
+                raise serializers.ValidationError("latitude and longitude must be provided together.")
+            if not has_latitude and "name" not in attrs:
+                raise serializers.ValidationError("name or latitude and longitude is required.")
+            return attrs
+
     class OutputSerializer(BaseSerializer):
         profile_thumbnail_url = serializers.URLField(source="thum_url", label="프로필 이미지 URL")
         name = serializers.CharField(label="이름")
@@ -270,6 +321,13 @@ class PetKindergardenSearchAPI(APIAuthMixin, APIView):
         business_start_hour = serializers.TimeField(label="영업 시작 시간")
         business_end_hour = serializers.TimeField(label="영업 종료 시간")
 
+    class DistanceOutputSerializer(OutputSerializer):
+        distance = serializers.FloatField(
+            source="distance.m",
+            label="거리 (m)",
+            help_text="위도, 경도로 검색한 경우에만 포함",
+        )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._raw_pet_kindergarden_selector = PetKindergardenContainer.raw_pet_kindergarden_selector()
@@ -278,13 +336,32 @@ class PetKindergardenSearchAPI(APIAuthMixin, APIView):
         filter_serializer = self.FilterSerializer(data=request.query_params)
         filter_serializer.is_valid(raise_exception=True)
 
-        raw_pet_kindergardens = self._raw_pet_kindergarden_selector.get_queryset_by_name(
-            name=filter_serializer.validated_data["name"]
-        )
+        validated_data = filter_serializer.validated_data
+        if "latitude" not in validated_data:
+            raw_pet_kindergardens = self._raw_pet_kindergarden_selector.get_queryset_by_name(
+                name=validated_data["name"]
+            )
+        elif "name" not in validated_data:
+            raw_pet_kindergardens = self._raw_pet_kindergarden_selector.get_queryset_by_location(
+                latitude=validated_data["latitude"],
+                longitude=validated_data["longitude"],
+                radius=validated_data["radius"],
+            )
+        else:
+            raw_pet_kindergardens = self._raw_pet_kindergarden_selector.get_queryset_by_name_and_location(
+                name=validated_data["name"],
+                latitude=validated_data["latitude"],
+                longitude=validated_data["longitude"],
+                radius=validated_data["radius"],
+            )
 
+        # 이름으로만 검색한 경우 거리를 계산하지 않으므로 응답에 거리를 포함하지 않음
+        output_serializer_class = (
+            self.DistanceOutputSerializer if "latitude" in validated_data else self.OutputSerializer
+        )
         pagination_raw_pet_kindergardens_data = get_paginated_data(
             pagination_class=self.Pagination,
-            serializer_class=self.OutputSerializer,
+            serializer_class=output_serializer_class,
             queryset=raw_pet_kindergardens,
             request=request,
             view=self,
@@ -308,6 +385,10 @@ class PetKindergardenProfileAPI(APIAuthMixin, APIView):
                 "id": serializers.IntegerField(label="아이디"),
                 "name": serializers.CharField(label="이름"),
                 "profile_thumbnail_url": serializers.URLField(label="프로필 이미지 URL"),
+                "profile_thumbnail_variant_urls": serializers.DictField(
+                    child=serializers.URLField(),
+                    label="프로필 이미지 파생 이미지 URL",
+                ),
             },
             label="반려동물 유치원",
         )
@@ -4,11 +4,9 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from mung_manager.apis.mixins import APIAuthMixin
-from mung_manager.apis.pagination import CursorPagination, get_paginated_data
+from mung_manager.apis.pagination import KeysetPagination, get_paginated_data
 from mung_manager.common.base.serializers import BaseSerializer
-from mung_manager.common.constants import SYSTEM_CODE
 from mung_manager.common.fields import DateFromDateTimeField, TimeFromDateTimeField
-from mung_manager.common.selectors import check_object_or_not_found
 from mung_manager.common.utils import inline_serializer
 from mung_manager.common.validators import (
     InvalidEndAtValidator,
@@ -56,42 +54,44 @@ class ReservationCalendarListAPI(APIAuthMixin, APIView):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._daily_reservation_selector = ReservationContainer.daily_reservation_selector()
-        self._pet_kindergarden_selector = ReservationContainer.pet_kindergarden_selector()
         self._day_off_selector = ReservationContainer.day_off_selector()
         self._korea_special_day_selector = ReservationContainer.korea_special_day_selector()
+        self._reservation_calendar_cache = ReservationContainer.reservation_calendar_cache()
 
     def get(self, request: Request, pet_kindergarden_id: int) -> Response:
         filter_serializer = self.FilterSerializer(data=request.query_params)
         filter_serializer.is_valid(raise_exception=True)
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=request.user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
+        year = filter_serializer.validated_data["year"]
+        month = filter_serializer.validated_data["month"]
+        daily_reservations_data = self._reservation_calendar_cache.get_or_set(
+            pet_kindergarden_id=pet_kindergarden_id,
+            year=year,
+            month=month,
+            default=lambda: self._get_calendar_data(pet_kindergarden_id=pet_kindergarden_id, year=year, month=month),
         )
+        return Response(data=daily_reservations_data, status=status.HTTP_200_OK)
+
+    def _get_calendar_data(self, pet_kindergarden_id: int, year: int, month: int) -> dict:
         daily_reservations = self._daily_reservation_selector.get_queryset_by_year_and_month_and_pet_kindergarden_id(
-            year=filter_serializer.validated_data["year"],
-            month=filter_serializer.validated_data["month"],
+            year=year,
+            month=month,
             pet_kindergarden_id=pet_kindergarden_id,
         )
         day_offs = self._day_off_selector.get_queryset_by_pet_kindergarden_id_and_day_off_at(
             pet_kindergarden_id=pet_kindergarden_id,
-            year=filter_serializer.validated_data["year"],
-            month=filter_serializer.validated_data["month"],
+            year=year,
+            month=month,
         )
-        korea_special_days = self._korea_special_day_selector.get_queryset_by_year_and_month(
-            year=filter_serializer.validated_data["year"], month=filter_serializer.validated_data["month"]
+        korea_special_days = self._korea_special_day_selector.get_list_by_year_and_month(year=year, month=month)
+        return dict(
+            self.OutputSerializer(
+                {
+                    "daily_reservations": daily_reservations,
+                    "day_offs": day_offs,
+                    "korea_special_days": korea_special_days,
+                }
+            ).data
         )
-        daily_reservations_data = self.OutputSerializer(
-            {
-                "daily_reservations": daily_reservations,
-                "day_offs": day_offs,
-                "korea_special_days": korea_special_days,
-            }
-        ).data
-        return Response(data=daily_reservations_data, status=status.HTTP_200_OK)
 
 
 class ReservationDayOffCreateAPI(APIAuthMixin, APIView):
@@ -109,9 +109,8 @@ class ReservationDayOffCreateAPI(APIAuthMixin, APIView):
         input_serializer = self.InputSerializer(data=request.data)
         input_serializer.is_valid(raise_exception=True)
         day_off = self._day_off_service.create_day_off(
-            pet_kindergarden_id=pet_kindergarden_id,
+            tenant=self.get_tenant(),
             day_off_at=input_serializer.validated_data["day_off_at"],
-            user=request.user,
         )
         day_off_data = self.OutputSerializer(day_off).data
         return Response(data=day_off_data, status=status.HTTP_201_CREATED)
@@ -125,9 +124,8 @@ class ReservationDayOffDeleteAPI(APIAuthMixin, APIView):
 
     def delete(self, request: Request, pet_kindergarden_id: int, day_off_id: int) -> Response:
         self._day_off_service.delete_day_off(
-            pet_kindergarden_id=pet_kindergarden_id,
+            tenant=self.get_tenant(),
             day_off_id=day_off_id,
-            user=request.user,
         )
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -211,19 +209,10 @@ class ReservationListAPI(APIAuthMixin, APIView):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._reservation_selector = ReservationContainer.reservation_selector()
-        self._pet_kindergarden_selector = ReservationContainer.pet_kindergarden_selector()
 
     def get(self, request: Request, pet_kindergarden_id: int) -> Response:
         filter_serializer = self.FilterSerializer(data=request.query_params)
         filter_serializer.is_valid(raise_exception=True)
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=request.user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
         reservations = self._reservation_selector.get_queryset_for_ticket_type_uncanceld_reservations(
             pet_kindergarden_id=pet_kindergarden_id,
             reserved_at=filter_serializer.validated_data["reserved_at"],
@@ -243,17 +232,17 @@ class ReservationToggleAttendanceAPI(APIAuthMixin, APIView):
 
     def patch(self, request: Request, pet_kindergarden_id: int, reservation_id: int) -> Response:
         reservation = self._reservation_service.toggle_reservation_is_attended(
-            pet_kindergarden_id=pet_kindergarden_id,
+            tenant=self.get_tenant(),
             reservation_id=reservation_id,
-            user=request.user,
         )
         reservation_data = self.OutputSerializer(reservation).data
         return Response(data=reservation_data, status=status.HTTP_200_OK)
 
 
 class ReservationCustomerPetListAPI(APIAuthMixin, APIView):
-    class Pagination(CursorPagination):
+    class Pagination(KeysetPagination):
         page_size = 10
+        ordering = ("-rank", "-id")
 
     class FilterSerializer(BaseSerializer):
         cursor = serializers.CharField(required=False, help_text="커서")
@@ -281,20 +270,12 @@ class ReservationCustomerPetListAPI(APIAuthMixin, APIView):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._customer_pet_selector = ReservationContainer.customer_pet_selector()
-        self._pet_kindergarden_selector = ReservationContainer.pet_kindergarden_selector()
 
     def get(self, request: Request, pet_kindergarden_id: int) -> Response:
         filter_serializer = self.FilterSerializer(data=request.query_params)
         filter_serializer.is_valid(raise_exception=True)
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=request.user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
-        customer_pets = self._customer_pet_selector.get_by_keyword_for_search(
+        customer_pets = self._customer_pet_selector.get_queryset_by_keyword_for_search(
+            pet_kindergarden_id=pet_kindergarden_id,
             keyword=filter_serializer.validated_data["keyword"],
         )
         pagination_customer_pets_data = get_paginated_data(
@@ -342,17 +323,8 @@ class ReservationCustomerTicketListAPI(APIAuthMixin, APIView):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._customer_ticket_selector = ReservationContainer.customer_ticket_selector()
-        self._pet_kindergarden_selector = ReservationContainer.pet_kindergarden_selector()
 
     def get(self, request: Request, pet_kindergarden_id: int, customer_id: int) -> Response:
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=request.user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
         customer_tickets = self._customer_ticket_selector.get_queryset_by_customer_id_for_ticket_type(
             customer_id=customer_id,
         )
@@ -388,13 +360,12 @@ class ReservationRegisterAPI(APIAuthMixin, APIView):
         input_serializer = self.InputSerializer(data=request.data)
         input_serializer.is_valid(raise_exception=True)
         reservation = self._reservation_service.register_reservation(
-            pet_kindergarden_id=pet_kindergarden_id,
+            tenant=self.get_tenant(),
             customer_ticket_ids=input_serializer.validated_data["customer_ticket_ids"],
             customer_id=input_serializer.validated_data["customer_id"],
             customer_pet_id=input_serializer.validated_data["customer_pet_id"],
             reserved_at=input_serializer.validated_data["reserved_at"],
             end_at=input_serializer.validated_data["end_at"],
-            user=request.user,
         )
         reservation_data = self.OutputSerializer(reservation).data
         return Response(data=reservation_data, status=status.HTTP_201_CREATED)
@@ -407,8 +378,7 @@ class ReservationCancelAPI(APIAuthMixin, APIView):
 
     def delete(self, request: Request, pet_kindergarden_id: int, reservation_id: int) -> Response:
         self._reservation_service.cancel_reservation(
-            pet_kindergarden_id=pet_kindergarden_id,
+            tenant=self.get_tenant(),
             reservation_id=reservation_id,
-            user=request.user,
         )
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -5,8 +5,6 @@ from rest_framework.views import APIView
 
 from mung_manager.apis.mixins import APIAuthMixin
 from mung_manager.common.base.serializers import BaseSerializer
-from mung_manager.common.constants import SYSTEM_CODE
-from mung_manager.common.selectors import check_object_or_not_found
 from mung_manager.tickets.containers import TicketContainer
 from mung_manager.tickets.enums import TicketType
 
@@ -23,18 +21,9 @@ class TicketListAPI(APIAuthMixin, APIView):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._pet_kindergarden_selector = TicketContainer.pet_kindergarden_selector()
         self._ticket_selector = TicketContainer.ticket_selector()
 
     def get(self, request: Request, pet_kindergarden_id: int) -> Response:
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=request.user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
         tickets = self._ticket_selector.get_queryset_by_pet_kindergarden_id(pet_kindergarden_id=pet_kindergarden_id)
         tickets_data = self.OutputSerializer(tickets, many=True).data
         return Response(data=tickets_data, status=status.HTTP_200_OK)
@@ -70,8 +59,7 @@ class TicketCreateAPI(APIAuthMixin, APIView):
         input_serializer = self.InputSerializer(data=request.data)
         input_serializer.is_valid(raise_exception=True)
         ticket = self._ticket_service.create_ticket(
-            pet_kindergarden_id=pet_kindergarden_id,
-            user=request.user,
+            tenant=self.get_tenant(),
             **input_serializer.validated_data,
         )
         ticket_data = self.OutputSerializer(ticket).data
@@ -86,7 +74,6 @@ class TicketDeleteView(APIAuthMixin, APIView):
     def delete(self, request: Request, pet_kindergarden_id: int, ticket_id: int) -> Response:
         self._ticket_service.delete_ticket(
             ticket_id=ticket_id,
-            pet_kindergarden_id=pet_kindergarden_id,
-            user=request.user,
+            tenant=self.get_tenant(),
         )
         return Response(status=status.HTTP_204_NO_CONTENT)
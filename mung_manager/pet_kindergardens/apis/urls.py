@@ -3,6 +3,7 @@ from django.urls import path
 from mung_manager.pet_kindergardens.apis.customers.api_managers import (
     CustomerBatchRegisterAPIManager,
     CustomerDetailAPIManager,
+    CustomerImportJobDetailAPIManager,
     CustomerListAPIManager,
     CustomerTicketActiveListAPIManager,
     CustomerTicketDetailAPIManager,
@@ -77,6 +78,11 @@ pet_kindergarden_customer_urls = [
         CustomerBatchRegisterAPIManager.as_view(),
         name="pet-kindergarden-customers-batch-register",
     ),
+    path(
+        "/<int:pet_kindergarden_id>/customers/import-jobs/<int:customer_import_job_id>",
+        CustomerImportJobDetailAPIManager.as_view(),
+        name="pet-kindergarden-customers-import-jobs-detail",
+    ),
     path(
         "/<int:pet_kindergarden_id>/customers/tickets",
         CustomerTicketActiveListAPIManager.as_view(),
@@ -0,0 +1,49 @@
+from typing import Callable
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+class PetKindergardenOwnerCache:
+    """이 클래스는 유저가 소유한 반려동물 유치원 아이디 리스트를 캐시합니다.
+
+    반려동물 유치원의 소유자는 생성 이후 변경되지 않으므로 긴 만료 시간을 사용하며,
+    반려동물 유치원이 생성되면 delete로 무효화합니다.
+    """
+
+    KEY_PREFIX = "pet-kindergarden-owner"
+    TIMEOUT = 60 * 60 * 24
+
+    def get_or_set(self, user_id: int, default: Callable[[], list[int]]) -> list[int]:
+        """이 함수는 유저가 소유한 반려동물 유치원 아이디 리스트를 조회하며, 없으면 default로 생성하여 저장합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+            default (Callable[[], list[int]]): 캐시가 없을 경우 반려동물 유치원 아이디 리스트를 조회하는 함수
+
+        Returns:
+            list[int]: 반려동물 유치원 아이디 리스트
+        """
+        key = self._get_key(user_id)
+        pet_kindergarden_ids = cache.get(key)
+        if pet_kindergarden_ids is not None:
+            return pet_kindergarden_ids
+
+        pet_kindergarden_ids = default()
+        cache.set(key, pet_kindergarden_ids, timeout=self.TIMEOUT)
+        return pet_kindergarden_ids
+
+    def delete(self, user_id: int) -> None:
+        """이 함수는 트랜잭션 커밋 후 유저가 소유한 반려동물 유치원 아이디 리스트 캐시를 삭제합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+
+        Returns:
+            None
+        """
+        key = self._get_key(user_id)
+        transaction.on_commit(lambda: cache.delete(key))
+
+    def _get_key(self, user_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{user_id}"
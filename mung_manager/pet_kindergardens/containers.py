@@ -1,5 +1,12 @@
 from dependency_injector import containers, providers
 
+from mung_manager.common.http import get_http_client
+from mung_manager.files.selectors.uploaded_images import UploadedImageSelector
+from mung_manager.pet_kindergardens.caches import PetKindergardenOwnerCache
+from mung_manager.pet_kindergardens.geocoders import (
+    PetKindergardenGeocoder,
+    get_geocoding_provider,
+)
 from mung_manager.pet_kindergardens.selectors.pet_kindergardens import (
     PetKindergardenSelector,
 )
@@ -9,6 +16,10 @@ from mung_manager.pet_kindergardens.selectors.raw_pet_kindergardens import (
 from mung_manager.pet_kindergardens.services.pet_kindergardens import (
     PetKindergardenService,
 )
+from mung_manager.pet_kindergardens.services.raw_pet_kindergardens import (
+    RawPetKindergardenService,
+)
+from mung_manager.pet_kindergardens.tenants import PetKindergardenTenantResolver
 
 
 class PetKindergardenContainer(containers.DeclarativeContainer):
@@ -17,13 +28,38 @@ class PetKindergardenContainer(containers.DeclarativeContainer):
     Attributes:
         pet_kindergarden_selector: 반려동물 유치원 셀렉터
         raw_pet_kindergarden_selector: 원시 반려동물 유치원 셀렉터
+        pet_kindergarden_owner_cache: 반려동물 유치원 소유자 캐시
+        pet_kindergarden_tenant_resolver: 반려동물 유치원 테넌트 리졸버
+        uploaded_image_selector: 업로드 이미지 셀렉터
+        http_client: 외부 API 호출에 사용하는 공유 HTTP 클라이언트
+        geocoding_provider: 좌표 조회 제공자
+        pet_kindergarden_geocoder: 반려동물 유치원 좌표 조회
         pet_kindergarden_service: 반려동물 유치원 서비스
+        raw_pet_kindergarden_service: 원시 반려동물 유치원 서비스
 
     """
 
     pet_kindergarden_selector = providers.Factory(PetKindergardenSelector)
     raw_pet_kindergarden_selector = providers.Factory(RawPetKindergardenSelector)
+    pet_kindergarden_owner_cache = providers.Factory(PetKindergardenOwnerCache)
+    uploaded_image_selector = providers.Factory(UploadedImageSelector)
+    http_client = providers.Factory(get_http_client)
+    geocoding_provider = providers.Factory(get_geocoding_provider, http_client=http_client)
+    pet_kindergarden_geocoder = providers.Factory(
+        PetKindergardenGeocoder,
+        geocoding_provider=geocoding_provider,
+        raw_pet_kindergarden_selector=raw_pet_kindergarden_selector,
+    )
+    pet_kindergarden_tenant_resolver = providers.Factory(
+        PetKindergardenTenantResolver,
+        pet_kindergarden_selector=pet_kindergarden_selector,
+        pet_kindergarden_owner_cache=pet_kindergarden_owner_cache,
+    )
     pet_kindergarden_service = providers.Factory(
         PetKindergardenService,
         pet_kindergarden_selector=pet_kindergarden_selector,
+        pet_kindergarden_owner_cache=pet_kindergarden_owner_cache,
+        uploaded_image_selector=uploaded_image_selector,
+        pet_kindergarden_geocoder=pet_kindergarden_geocoder,
     )
+    raw_pet_kindergarden_service = providers.Factory(RawPetKindergardenService)
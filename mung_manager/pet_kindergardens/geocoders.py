@@ -0,0 +1,147 @@
+import datetime as dt
+import hashlib
+from abc import ABC, abstractmethod
+from math import floor
+from typing import Tuple
+
+import requests
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from mung_manager.common.constants import SYSTEM_CODE
+from mung_manager.common.http import HttpClient
+from mung_manager.errors.exceptions import (
+    AuthenticationFailedException,
+    NotImplementedException,
+)
+from mung_manager.pet_kindergardens.models import GeocodedAddress
+from mung_manager.pet_kindergardens.selectors.raw_pet_kindergardens import (
+    RawPetKindergardenSelector,
+)
+
+
+class AbstractGeocodingProvider(ABC):
+    def __init__(self, http_client: HttpClient):
+        self._http_client = http_client
+
+    @abstractmethod
+    def get_coordinates(self, road_address: str) -> Tuple[float, float]:
+        raise NotImplementedException()
+
+
+class KakaoGeocodingProvider(AbstractGeocodingProvider):
+    """이 클래스는 카카오 주소 검색 API로 도로명 주소의 위도, 경도를 조회합니다."""
+
+    URL = "https://dapi.kakao.com/v2/local/search/address.json"
+
+    def get_coordinates(self, road_address: str) -> Tuple[float, float]:
+        """이 함수는 도로명 주소를 받아 위도, 경도를 얻어옵니다.
+
+        Args:
+            road_address (str): 도로명 주소
+
+        Returns:
+            Tuple[float, float]: 위도, 경도
+        """
+        try:
+            response = self._http_client.get(
+                url=self.URL,
+                headers={"Authorization": f"KakaoAK {settings.KAKAO_API_KEY}"},
+                # @TODO: Fixed Type
+                params={  # type: ignore
+                    "analyze_type": "exact",
+                    "query": road_address,
+                    "page": 1,
+                    "size": 1,
+                },
+            )
+        except requests.RequestException:
+            response = None
+
+        if response is None or response.status_code != 200:
+            raise AuthenticationFailedException(
+                detail=SYSTEM_CODE.message("AUTHENTICATION_FAILED_KAKAO_ADDRESS"),
+                code=SYSTEM_CODE.code("AUTHENTICATION_FAILED_KAKAO_ADDRESS"),
+            )
+
+        response_data = response.json()
+
+        latitude = floor(float(response_data["documents"][0]["road_address"]["y"]) * 10**6) / 10**6
+        longitude = floor(float(response_data["documents"][0]["road_address"]["x"]) * 10**6) / 10**6
+
+        return latitude, longitude
+
+
+class FakeGeocodingProvider(AbstractGeocodingProvider):
+    """이 클래스는 네트워크 없이 도로명 주소의 해시로 국내 범위의 위도, 경도를 계산합니다.
+
+    같은 주소는 항상 같은 좌표를 반환하므로 테스트와 로컬 개발 환경에서 사용하며, HTTP 클라이언트는 사용하지 않습니다.
+    """
+
+    def get_coordinates(self, road_address: str) -> Tuple[float, float]:
+        digest = hashlib.blake2b(road_address.encode(), digest_size=8).digest()
+        latitude = 33 + int.from_bytes(digest[:4], "big") / 2**32 * 5
+        longitude = 124 + int.from_bytes(digest[4:], "big") / 2**32 * 8
+        return floor(latitude * 10**6) / 10**6, floor(longitude * 10**6) / 10**6
+
+
+def get_geocoding_provider(http_client: HttpClient) -> AbstractGeocodingProvider:
+    """이 함수는 GEOCODING_PROVIDER 설정의 좌표 조회 제공자를 반환합니다.
+
+    Args:
+        http_client (HttpClient): HTTP 클라이언트
+
+    Returns:
+        AbstractGeocodingProvider: 좌표 조회 제공자
+    """
+    return import_string(settings.GEOCODING_PROVIDER)(http_client=http_client)
+
+
+class PetKindergardenGeocoder:
+    """이 클래스는 도로명 주소의 위도, 경도를 조회하며 외부 API 조회 결과를 DB에 캐시합니다.
+
+    같은 도로명 주소의 로우 반려동물 유치원 좌표, 만료되지 않은 좌표 캐시, 좌표 조회 제공자 순서로 조회하며
+    제공자로 조회한 좌표만 좌표 캐시에 저장합니다. 좌표 캐시는 주소 체계 변경 등을 반영하도록 TIMEOUT 이후 다시 조회합니다.
+    """
+
+    TIMEOUT = dt.timedelta(days=30)
+
+    def __init__(
+        self,
+        geocoding_provider: AbstractGeocodingProvider,
+        raw_pet_kindergarden_selector: RawPetKindergardenSelector,
+    ):
+        self._geocoding_provider = geocoding_provider
+        self._raw_pet_kindergarden_selector = raw_pet_kindergarden_selector
+
+    def get_coordinates(self, road_address: str) -> Tuple[float, float]:
+        """이 함수는 도로명 주소를 받아 위도, 경도를 조회합니다.
+
+        Args:
+            road_address (str): 도로명 주소
+
+        Returns:
+            Tuple[float, float]: 위도, 경도
+        """
+        coordinates = self._raw_pet_kindergarden_selector.get_coordinates_by_road_address(road_address)
+        if coordinates is not None:
+            return coordinates
+
+        geocoded_address = (
+            GeocodedAddress.objects.filter(
+                road_address=road_address,
+                updated_at__gte=timezone.now() - self.TIMEOUT,
+            )
+            .values_list("latitude", "longitude")
+            .first()
+        )
+        if geocoded_address is not None:
+            return float(geocoded_address[0]), float(geocoded_address[1])
+
+        latitude, longitude = self._geocoding_provider.get_coordinates(road_address)
+        GeocodedAddress.objects.update_or_create(
+            road_address=road_address,
+            defaults={"latitude": latitude, "longitude": longitude},
+        )
+        return latitude, longitude
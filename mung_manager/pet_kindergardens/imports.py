@@ -0,0 +1,170 @@
+import csv
+import datetime as dt
+import io
+import json
+from decimal import Decimal, InvalidOperation
+from typing import IO, Any, Iterator, NamedTuple, Optional
+
+from django.core.files import File
+
+from mung_manager.pet_kindergardens.models import RawPetKindergarden
+
+
+class RawPetKindergardenImportResult(NamedTuple):
+    """이 클래스는 로우 반려동물 유치원 일괄 적재 결과입니다.
+
+    Attributes:
+        read_count (int): 파일에서 읽은 레코드 수
+        skipped_count (int): 필수 값이 없거나 형식이 잘못되어 건너뛴 레코드 수
+        created_count (int): 새로 추가된 로우 반려동물 유치원 수
+        updated_count (int): 전화번호와 주소가 같아 갱신된 로우 반려동물 유치원 수
+        elapsed_seconds (float): 적재에 걸린 시간 (초)
+    """
+
+    read_count: int
+    skipped_count: int
+    created_count: int
+    updated_count: int
+    elapsed_seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.read_count / self.elapsed_seconds if self.elapsed_seconds > 0 else float(self.read_count)
+
+
+class RawPetKindergardenRecordReader:
+    """이 클래스는 수집한 로우 반려동물 유치원 파일을 레코드 단위로 읽어 COPY할 행으로 변환합니다.
+
+    파일 전체를 메모리에 올리지 않고 READ_CHUNK_SIZE 단위로 읽으며 다음 형식을 지원합니다.
+        - json: 레코드 객체의 배열
+        - jsonl: 한 줄에 레코드 객체 하나
+        - csv: 첫 행이 필드 이름인 CSV
+
+    레코드의 키는 모델 필드 이름(thum_url 등)과 수집 데이터의 컬럼 이름(thumUrl 등)을 모두 사용할 수 있습니다.
+    """
+
+    FILE_FORMATS = ("json", "jsonl", "csv")
+    READ_CHUNK_SIZE = 1024 * 1024
+    FIELD_NAMES = (
+        "thum_url",
+        "tel",
+        "virtual_tel",
+        "name",
+        "x",
+        "y",
+        "business_start_hour",
+        "business_end_hour",
+        "address",
+        "road_address",
+        "abbr_address",
+        "short_address",
+    )
+    REQUIRED_FIELD_NAMES = ("name", "x", "y", "business_start_hour", "business_end_hour", "address", "road_address")
+
+    def __init__(self, file: File, file_format: str):
+        if file_format not in self.FILE_FORMATS:
+            raise ValueError(f"Unsupported file format: {file_format}")
+
+        self._file = file
+        self._file_format = file_format
+        self._fields = [RawPetKindergarden._meta.get_field(field_name) for field_name in self.FIELD_NAMES]
+        short_address_field = RawPetKindergarden._meta.get_field("short_address")
+        self._short_address_size = short_address_field.size
+        self._short_address_max_length = short_address_field.base_field.max_length
+        self.skipped_count = 0
+
+    def read_rows(self) -> Iterator[list[Any]]:
+        """이 함수는 파일의 레코드를 FIELD_NAMES 순서의 행으로 변환하여 반환합니다.
+
+        변환할 수 없는 레코드는 건너뛰고 skipped_count에 더합니다.
+
+        Yields:
+            list[Any]: FIELD_NAMES 순서의 값 리스트
+        """
+        with io.TextIOWrapper(self._file.file, encoding="utf-8-sig", newline="") as text_file:
+            for record in self._read_records(text_file):
+                row = self._parse_record(record) if isinstance(record, dict) else None
+                if row is None:
+                    self.skipped_count += 1
+                    continue
+                yield row
+
+    def _read_records(self, text_file: IO[str]) -> Iterator[Any]:
+        if self._file_format == "csv":
+            yield from csv.DictReader(text_file)
+        elif self._file_format == "jsonl":
+            for line in text_file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from self._read_json_array(text_file)
+
+    def _read_json_array(self, text_file: IO[str]) -> Iterator[Any]:
+        # 배열의 원소를 하나씩 디코딩하며 끝까지 디코딩하지 못한 원소는 다음 청크와 합쳐서 다시 디코딩
+        decoder = json.JSONDecoder()
+        buffer = ""
+        has_started = False
+        for chunk in iter(lambda: text_file.read(self.READ_CHUNK_SIZE), ""):
+            buffer += chunk
+            position = 0
+            while True:
+                while position < len(buffer) and buffer[position] in " \t\r\n,":
+                    position += 1
+                if position >= len(buffer):
+                    break
+
+                if not has_started:
+                    if buffer[position] != "[":
+                        raise ValueError("JSON file must be an array of records.")
+                    has_started = True
+                    position += 1
+                    continue
+
+                if buffer[position] == "]":
+                    return
+
+                try:
+                    record, position = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    break
+                yield record
+            buffer = buffer[position:]
+
+        raise ValueError("JSON file ended before the array was closed.")
+
+    def _parse_record(self, record: dict[str, Any]) -> Optional[list[Any]]:
+        values = {}
+        for field in self._fields:
+            value = record.get(field.name, record.get(field.column))
+            values[field.name] = value.strip() if isinstance(value, str) else value
+
+        if any(values[field_name] in (None, "") for field_name in self.REQUIRED_FIELD_NAMES):
+            return None
+
+        try:
+            values["x"] = Decimal(str(values["x"]))
+            values["y"] = Decimal(str(values["y"]))
+            values["business_start_hour"] = dt.time.fromisoformat(str(values["business_start_hour"]))
+            values["business_end_hour"] = dt.time.fromisoformat(str(values["business_end_hour"]))
+            if not (-180 <= values["x"] <= 180 and -90 <= values["y"] <= 90):
+                return None
+        except (InvalidOperation, ValueError):
+            return None
+
+        short_address = values["short_address"] or []
+        if isinstance(short_address, str):
+            short_address = [address.strip() for address in short_address.split(",") if address.strip()]
+        if not isinstance(short_address, list) or len(short_address) > self._short_address_size:
+            return None
+        values["short_address"] = [str(address) for address in short_address]
+
+        for field in self._fields:
+            if field.name in ("x", "y", "business_start_hour", "business_end_hour", "short_address"):
+                continue
+            values[field.name] = str(values[field.name] or "")
+            if field.max_length is not None and len(values[field.name]) > field.max_length:
+                return None
+        if any(len(address) > self._short_address_max_length for address in values["short_address"]):
+            return None
+
+        return [values[field_name] for field_name in self.FIELD_NAMES]
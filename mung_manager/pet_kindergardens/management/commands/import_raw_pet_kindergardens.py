@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+
+from mung_manager.pet_kindergardens.containers import PetKindergardenContainer
+
+
+class Command(BaseCommand):
+    help = "수집한 로우 반려동물 유치원 파일(json, jsonl, csv)을 COPY로 일괄 적재합니다."
+
+    FILE_FORMATS_BY_SUFFIX = {".json": "json", ".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=str, help="적재할 파일 경로")
+        parser.add_argument(
+            "--format",
+            type=str,
+            choices=("json", "jsonl", "csv"),
+            help="파일 형식 (없으면 확장자로 판단)",
+        )
+        parser.add_argument("--batch-size", type=int, default=10000, help="한 번에 COPY할 행 수")
+        parser.add_argument("--skip-reindex", action="store_true", help="적재 후 GIN, GiST 인덱스를 다시 생성하지 않음")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        file_format = options["format"] or self.FILE_FORMATS_BY_SUFFIX.get(path.suffix.lower())
+        if file_format is None:
+            raise CommandError(f"파일 형식을 확인할 수 없습니다: {path}")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size는 1 이상이어야 합니다.")
+
+        raw_pet_kindergarden_service = PetKindergardenContainer.raw_pet_kindergarden_service()
+
+        try:
+            with path.open("rb") as file_obj:
+                result = raw_pet_kindergarden_service.import_raw_pet_kindergardens(
+                    file=File(file_obj, name=path.name),
+                    file_format=file_format,
+                    batch_size=options["batch_size"],
+                    rebuild_indexes=not options["skip_reindex"],
+                )
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e)) from e
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"로우 반려동물 유치원 {result.read_count}건을 읽어 {result.created_count}건을 추가하고 "
+                f"{result.updated_count}건을 갱신했습니다. (건너뜀 {result.skipped_count}건, "
+                f"{result.elapsed_seconds:.1f}초, 초당 {result.rows_per_second:.0f}건)"
+            )
+        )
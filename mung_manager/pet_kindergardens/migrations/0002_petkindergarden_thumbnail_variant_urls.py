@@ -0,0 +1,23 @@
+# Generated by Django 5.0.6 on 2024-06-28 14:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pet_kindergardens', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='petkindergarden',
+            name='main_thumbnail_variant_urls',
+            field=models.JSONField(blank=True, db_comment='메인 썸네일 파생 이미지 URL', default=dict),
+        ),
+        migrations.AddField(
+            model_name='petkindergarden',
+            name='profile_thumbnail_variant_urls',
+            field=models.JSONField(blank=True, db_comment='프로필 썸네일 파생 이미지 URL', default=dict),
+        ),
+    ]
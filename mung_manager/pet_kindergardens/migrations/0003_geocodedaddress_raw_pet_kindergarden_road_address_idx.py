@@ -0,0 +1,31 @@
+# Generated by Django 5.0.6 on 2024-06-28 14:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pet_kindergardens', '0002_petkindergarden_thumbnail_variant_urls'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeocodedAddress',
+            fields=[
+                ('id', models.AutoField(auto_created=True, db_column='geocoded_address_id', db_comment='좌표 캐시 아이디', primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_comment='생성 일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_comment='수정 일시')),
+                ('road_address', models.CharField(db_comment='도로명 주소', max_length=128, unique=True)),
+                ('latitude', models.DecimalField(db_comment='위도', decimal_places=6, max_digits=8)),
+                ('longitude', models.DecimalField(db_comment='경도', decimal_places=6, max_digits=9)),
+            ],
+            options={
+                'db_table': 'geocoded_address',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='rawpetkindergarden',
+            index=models.Index(fields=['road_address'], name='raw_pet_kg_road_address_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.6 on 2024-06-28 14:31
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pet_kindergardens', '0003_geocodedaddress_raw_pet_kindergarden_road_address_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rawpetkindergarden',
+            name='point',
+            field=django.contrib.gis.db.models.fields.PointField(db_comment='위치 좌표', geography=True, null=True, srid=4326),
+        ),
+        migrations.RunSQL(
+            sql='UPDATE raw_pet_kindergarden SET point = ST_SetSRID(ST_MakePoint(x, y), 4326)::geography',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
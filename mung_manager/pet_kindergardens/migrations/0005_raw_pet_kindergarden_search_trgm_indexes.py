@@ -0,0 +1,48 @@
+# Generated by Django 5.0.6 on 2024-06-28 14:31
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+import mung_manager.pet_kindergardens.search
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('pet_kindergardens', '0004_rawpetkindergarden_point'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='rawpetkindergarden',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    mung_manager.pet_kindergardens.search.Normalize(
+                        django.db.models.functions.text.Replace(
+                            django.db.models.functions.text.Lower('name'), models.Value(' '), models.Value('')
+                        )
+                    ),
+                    name='gin_trgm_ops',
+                ),
+                name='raw_pet_kg_name_trgm_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='rawpetkindergarden',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    mung_manager.pet_kindergardens.search.Normalize(
+                        django.db.models.functions.text.Replace(
+                            django.db.models.functions.text.Lower('road_address'), models.Value(' '), models.Value('')
+                        )
+                    ),
+                    name='gin_trgm_ops',
+                ),
+                name='raw_pet_kg_road_addr_trgm_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.0.6 on 2024-07-02 22:05
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+import mung_manager.pet_kindergardens.search
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('pet_kindergardens', '0005_raw_pet_kindergarden_search_trgm_indexes'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='rawpetkindergarden',
+            name='raw_pet_kg_name_trgm_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='rawpetkindergarden',
+            name='raw_pet_kg_road_addr_trgm_idx',
+        ),
+        AddIndexConcurrently(
+            model_name='rawpetkindergarden',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    mung_manager.pet_kindergardens.search.RemoveWhitespace(
+                        mung_manager.pet_kindergardens.search.Normalize(
+                            django.db.models.functions.text.Lower('name')
+                        )
+                    ),
+                    name='gin_trgm_ops',
+                ),
+                name='raw_pet_kg_name_trgm_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='rawpetkindergarden',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    mung_manager.pet_kindergardens.search.RemoveWhitespace(
+                        mung_manager.pet_kindergardens.search.Normalize(
+                            django.db.models.functions.text.Lower('road_address')
+                        )
+                    ),
+                    name='gin_trgm_ops',
+                ),
+                name='raw_pet_kg_road_addr_trgm_idx',
+            ),
+        ),
+    ]
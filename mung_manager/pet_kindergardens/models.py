@@ -1,5 +1,6 @@
 from django.contrib.gis.db.models import PointField
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
 
 from mung_manager.common.base.models import TimeStampedModel
@@ -7,6 +8,7 @@ from mung_manager.pet_kindergardens.enums import (
     ReservationAvailabilityOption,
     ReservationChangeOption,
 )
+from mung_manager.pet_kindergardens.search import get_search_text
 from mung_manager.users.models import User
 
 
@@ -21,6 +23,12 @@ class PetKindergarden(TimeStampedModel):
     name = models.CharField(max_length=64, db_comment="유치원 이름")
     main_thumbnail_url = models.URLField(db_comment="메인 썸네일")
     profile_thumbnail_url = models.URLField(db_comment="프로필 썸네일 이미지")
+    main_thumbnail_variant_urls = models.JSONField(default=dict, blank=True, db_comment="메인 썸네일 파생 이미지 URL")
+    profile_thumbnail_variant_urls = models.JSONField(
+        default=dict,
+        blank=True,
+        db_comment="프로필 썸네일 파생 이미지 URL",
+    )
     phone_number = models.CharField(max_length=16, db_comment="전화번호", blank=True)
     visible_phone_number = ArrayField(models.CharField(max_length=16), db_comment="노출 전화번호", size=2)
     business_start_hour = models.TimeField(db_comment="영업 시작 시간")
@@ -88,6 +96,37 @@ class RawPetKindergarden(models.Model):
         db_column="shortAddress",
         db_comment="간단 주소",
     )
+    # x, y로 생성하며 거리를 m 단위로 계산하도록 geography 타입을 사용 (GiST 인덱스)
+    point = PointField(geography=True, srid=4326, null=True, db_comment="위치 좌표")
 
     class Meta:
         db_table = "raw_pet_kindergarden"
+        indexes = [
+            models.Index(fields=["road_address"], name="raw_pet_kg_road_address_idx"),
+            # 이름, 도로명 주소 부분 검색 (공백, 대소문자, 한글 자모 분해와 관계없이 검색)
+            GinIndex(OpClass(get_search_text("name"), name="gin_trgm_ops"), name="raw_pet_kg_name_trgm_idx"),
+            GinIndex(
+                OpClass(get_search_text("road_address"), name="gin_trgm_ops"),
+                name="raw_pet_kg_road_addr_trgm_idx",
+            ),
+        ]
+
+
+class GeocodedAddress(TimeStampedModel):
+    """
+    도로명 주소 좌표 캐시 (주소 검색 API 조회 결과)
+    """
+
+    id = models.AutoField(
+        auto_created=True,
+        primary_key=True,
+        db_column="geocoded_address_id",
+        serialize=False,
+        db_comment="좌표 캐시 아이디",
+    )
+    road_address = models.CharField(max_length=128, unique=True, db_comment="도로명 주소")
+    latitude = models.DecimalField(max_digits=8, decimal_places=6, db_comment="위도")
+    longitude = models.DecimalField(max_digits=9, decimal_places=6, db_comment="경도")
+
+    class Meta:
+        db_table = "geocoded_address"
@@ -0,0 +1,98 @@
+import re
+import unicodedata
+
+from django.contrib.gis.db.models import PointField
+from django.contrib.gis.geos import Point
+from django.db.models import F, FloatField, Func, Value
+from django.db.models.functions import Lower
+
+# 반경 검색 기본값과 최댓값 (m)
+DEFAULT_SEARCH_RADIUS = 3000
+MAX_SEARCH_RADIUS = 50000
+
+# 검색어에서 제거할 공백 문자 (PostgreSQL 정규식의 \s와 같은 문자)
+WHITESPACE_REGEX = re.compile(r"\s+")
+
+
+class Normalize(Func):
+    """이 클래스는 문자열을 유니코드 NFKD로 정규화하는 식입니다.
+
+    한글 음절은 자모로 분해되고 호환 자모(ㄱ, ㅏ 등)는 조합형 자모로 바뀌므로,
+    입력 중인 마지막 글자(예: "멍머", "멍ㅁ")로도 완성된 이름("멍멍")을 검색할 수 있습니다.
+    """
+
+    function = "NORMALIZE"
+    template = "%(function)s(%(expressions)s, NFKD)"
+
+
+class RemoveWhitespace(Func):
+    """이 클래스는 문자열의 모든 공백 문자(\\s)를 제거하는 식입니다."""
+
+    function = "REGEXP_REPLACE"
+    template = "%(function)s(%(expressions)s, '\\s', '', 'g')"
+
+
+def get_search_text(field_name: str) -> RemoveWhitespace:
+    """이 함수는 검색 대상 문자열을 소문자로 바꾸고 NFKD로 정규화한 뒤 공백을 제거한 식을 생성합니다.
+
+    전각 공백(U+3000) 등 호환 문자는 NFKD 정규화로 일반 공백이 되므로 정규화한 뒤 공백을 제거합니다.
+    로우 반려동물 유치원 트라이그램 인덱스(raw_pet_kg_name_trgm_idx, raw_pet_kg_road_addr_trgm_idx)와
+    같은 식이므로 검색 조건에 이 식을 사용해야 인덱스를 사용할 수 있습니다.
+
+    Args:
+        field_name (str): 필드 이름 (예: "name", "road_address")
+
+    Returns:
+        RemoveWhitespace: 정규화한 문자열 식
+    """
+    return RemoveWhitespace(Normalize(Lower(field_name)))
+
+
+def get_search_keyword(keyword: str) -> str:
+    """이 함수는 검색어를 검색 대상 문자열(get_search_text)과 같은 순서로 정규화합니다.
+
+    Args:
+        keyword (str): 검색어
+
+    Returns:
+        str: 정규화한 검색어
+    """
+    return WHITESPACE_REGEX.sub("", unicodedata.normalize("NFKD", keyword.lower()))
+
+
+class KnnDistance(Func):
+    """이 클래스는 PostGIS의 거리 연산자(<->)로 두 좌표의 거리를 계산하는 식입니다.
+
+    ORDER BY에 사용하면 GiST 인덱스를 사용해 가까운 순서로 읽으므로(k-nearest neighbor)
+    ST_Distance로 모든 행의 거리를 계산하여 정렬하지 않고 LIMIT만큼만 읽습니다.
+    """
+
+    arg_joiner = " <-> "
+    template = "(%(expressions)s)"
+    output_field = FloatField()
+
+
+def get_geography_point(latitude: float, longitude: float) -> Point:
+    """이 함수는 위도, 경도로 WGS84 좌표를 생성합니다.
+
+    Args:
+        latitude (float): 위도
+        longitude (float): 경도
+
+    Returns:
+        Point: 좌표
+    """
+    return Point(longitude, latitude, srid=4326)
+
+
+def get_knn_distance(point: Point, field_name: str = "point") -> KnnDistance:
+    """이 함수는 geography 좌표 필드와 좌표의 거리 연산자(<->) 식을 생성합니다.
+
+    Args:
+        point (Point): 기준 좌표
+        field_name (str): geography 좌표 필드 이름
+
+    Returns:
+        KnnDistance: 거리 연산자 식
+    """
+    return KnnDistance(F(field_name), Value(point, output_field=PointField(geography=True, srid=4326)))
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Tuple
 
 from django.db.models.query import QuerySet
 
@@ -17,15 +17,49 @@ class AbstractPetKindergardenSelector(ABC):
         raise NotImplementedException()
 
     @abstractmethod
-    def exists_by_id_and_user(self, pet_kindergarden_id: int, user) -> bool:
+    def get_ids_by_user(self, user) -> list[int]:
         raise NotImplementedException()
 
     @abstractmethod
     def get_by_id_and_user(self, pet_kindergarden_id: int, user) -> Optional[PetKindergarden]:
         raise NotImplementedException()
 
+    @abstractmethod
+    def get_by_id_for_reservation(
+        self,
+        pet_kindergarden_id: int,
+        customer_id: int,
+        customer_pet_id: int,
+        reserved_at,
+        end_at,
+    ) -> Optional[PetKindergarden]:
+        raise NotImplementedException()
+
 
 class AbstractRawPetKindergardenSelector(ABC):
     @abstractmethod
     def get_queryset_by_name(self, name: str) -> QuerySet[RawPetKindergarden]:
         raise NotImplementedException()
+
+    @abstractmethod
+    def get_coordinates_by_road_address(self, road_address: str) -> Optional[Tuple[float, float]]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_queryset_by_location(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: int,
+    ) -> QuerySet[RawPetKindergarden]:
+        raise NotImplementedException()
+
+    @abstractmethod
+    def get_queryset_by_name_and_location(
+        self,
+        name: str,
+        latitude: float,
+        longitude: float,
+        radius: int,
+    ) -> QuerySet[RawPetKindergarden]:
+        raise NotImplementedException()
@@ -1,9 +1,16 @@
 from typing import Optional
 
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import DateField, Exists, F, OuterRef
+from django.db.models.functions import Cast
+
+from mung_manager.customers.models import CustomerPet
 from mung_manager.pet_kindergardens.models import PetKindergarden
 from mung_manager.pet_kindergardens.selectors.abstracts import (
     AbstractPetKindergardenSelector,
 )
+from mung_manager.reservations.enums import ReservationStatus
+from mung_manager.reservations.models import DailyReservation, DayOff, Reservation
 
 
 class PetKindergardenSelector(AbstractPetKindergardenSelector):
@@ -37,18 +44,17 @@ class PetKindergardenSelector(AbstractPetKindergardenSelector):
         except PetKindergarden.DoesNotExist:
             return None
 
-    def exists_by_id_and_user(self, pet_kindergarden_id: int, user) -> bool:
+    def get_ids_by_user(self, user) -> list[int]:
         """
-        이 함수는 반려동물 유치원 아이디와 유저로 반려동물 유치원이 존재하는지 확인합니다.
+        이 함수는 유저가 소유한 반려동물 유치원 아이디 리스트를 조회합니다.
 
         Args:
-            pet_kindergarden_id (int): 반려동물 유치원 아이디
             user: User: 유저 객체
 
         Returns:
-            bool: 반려동물 유치원이 존재하면 True를 반환하며 존재하지 않으면 예외를 발생시킵니다.
+            list[int]: 반려동물 유치원 아이디 리스트이며 존재하지 않으면 빈 리스트를 반환
         """
-        return PetKindergarden.objects.filter(id=pet_kindergarden_id, user=user).exists()
+        return list(PetKindergarden.objects.filter(user=user).values_list("id", flat=True))
 
     def get_by_id_and_user(self, pet_kindergarden_id: int, user) -> Optional[PetKindergarden]:
         """
@@ -66,3 +72,82 @@ class PetKindergardenSelector(AbstractPetKindergardenSelector):
 
         except PetKindergarden.DoesNotExist:
             return None
+
+    def get_by_id_for_reservation(
+        self,
+        pet_kindergarden_id: int,
+        customer_id: int,
+        customer_pet_id: int,
+        reserved_at,
+        end_at,
+    ) -> Optional[PetKindergarden]:
+        """
+        이 함수는 예약 등록에 필요한 검증 결과를 포함한 반려동물 유치원을 한 번의 쿼리로 조회합니다.
+
+        고객 반려동물 존재 여부, 정원이 초과된 날짜, 휴무일, 반려동물의 중복 예약 날짜를
+        서브쿼리로 함께 annotate 하여 반환합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            customer_id (int): 고객 아이디
+            customer_pet_id (int): 고객 반려동물 아이디
+            reserved_at (datetime): 예약 시작 시간
+            end_at (datetime): 예약 종료 시간
+
+        Returns:
+            Optional[PetKindergarden]: 반려동물 유치원 객체이며 존재하지 않으면 None을 반환
+                - is_customer_pet_exists (bool): 삭제되지 않은 고객 반려동물 존재 여부
+                - overregistered_dates (list[date]): 하루 정원이 초과된 날짜 리스트
+                - day_off_dates (list[date]): 휴무일 날짜 리스트
+                - duplicated_dates (list[date]): 반려동물이 이미 예약한 날짜 리스트
+        """
+        customer_pets = CustomerPet.objects.filter(
+            id=customer_pet_id,
+            customer_id=customer_id,
+            is_deleted=False,
+            deleted_at__isnull=True,
+        )
+        # 하루 정원이 -1인 경우 정원 제한이 없으므로 초과 날짜에서 제외
+        overregistered_dates = (
+            DailyReservation.objects.filter(
+                pet_kindergarden_id=OuterRef("id"),
+                reserved_at__range=[reserved_at, end_at],
+                total_pet_count__gte=F("pet_kindergarden__daily_pet_limit"),
+            )
+            .exclude(pet_kindergarden__daily_pet_limit=-1)
+            .order_by("reserved_at")
+            .values("reserved_at")
+        )
+        day_off_dates = (
+            DayOff.objects.filter(
+                pet_kindergarden_id=OuterRef("id"),
+                day_off_at__range=[reserved_at, end_at],
+            )
+            .order_by("day_off_at")
+            .values("day_off_at")
+        )
+        duplicated_dates = (
+            Reservation.objects.filter(
+                customer_pet_id=customer_pet_id,
+                reserved_at__lte=end_at,
+                end_at__gte=reserved_at,
+            )
+            .exclude(reservation_status=ReservationStatus.CANCELED.value)
+            .annotate(reserved_at_str=Cast("reserved_at", DateField()))
+            .values("reserved_at_str")
+        )
+
+        try:
+            return (
+                PetKindergarden.objects.filter(id=pet_kindergarden_id)
+                .annotate(
+                    is_customer_pet_exists=Exists(customer_pets),
+                    overregistered_dates=ArraySubquery(overregistered_dates),
+                    day_off_dates=ArraySubquery(day_off_dates),
+                    duplicated_dates=ArraySubquery(duplicated_dates),
+                )
+                .get()
+            )
+
+        except PetKindergarden.DoesNotExist:
+            return None
@@ -1,6 +1,19 @@
+from typing import Optional, Tuple
+
+from django.contrib.gis.db.models.functions import Distance
+from django.contrib.gis.measure import D
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.functions import Greatest
 from django.db.models.query import QuerySet
 
 from mung_manager.pet_kindergardens.models import RawPetKindergarden
+from mung_manager.pet_kindergardens.search import (
+    get_geography_point,
+    get_knn_distance,
+    get_search_keyword,
+    get_search_text,
+)
 from mung_manager.pet_kindergardens.selectors.abstracts import (
     AbstractRawPetKindergardenSelector,
 )
@@ -11,12 +24,116 @@ class RawPetKindergardenSelector(AbstractRawPetKindergardenSelector):
 
     def get_queryset_by_name(self, name: str) -> QuerySet[RawPetKindergarden]:
         """
-        이 함수는 이름으로 로우 반려동물 유치원 쿼리셋을 조회합니다.
+        이 함수는 이름 또는 도로명 주소로 로우 반려동물 유치원 쿼리셋을 유사도가 높은 순서로 조회합니다.
+
+        공백, 대소문자와 관계없이 검색어를 포함하는 결과를 트라이그램 인덱스로 조회하며,
+        한글은 자모 단위로 비교하므로 입력 중인 마지막 글자로도 검색할 수 있습니다.
+
+        Args:
+            name: 반려동물 유치원 이름 또는 도로명 주소 검색어
+
+        Returns:
+            QuerySet[RawPetKindergarden]: 유사도(rank)를 포함한 로우 반려동물 유치원 쿼리셋 존재하지 않으면 빈 쿼리셋을 반환
+        """
+        keyword = get_search_keyword(name)
+        if not keyword:
+            return RawPetKindergarden.objects.none()
+
+        return (
+            RawPetKindergarden.objects.alias(
+                name_search_text=get_search_text("name"),
+                road_address_search_text=get_search_text("road_address"),
+            )
+            .filter(Q(name_search_text__contains=keyword) | Q(road_address_search_text__contains=keyword))
+            .annotate(
+                rank=Greatest(
+                    TrigramSimilarity("name_search_text", keyword),
+                    TrigramSimilarity("road_address_search_text", keyword),
+                )
+            )
+            .order_by("-rank", "id")
+        )
+
+    def get_coordinates_by_road_address(self, road_address: str) -> Optional[Tuple[float, float]]:
+        """
+        이 함수는 도로명 주소가 같은 로우 반려동물 유치원의 위도, 경도를 조회합니다.
+
+        Args:
+            road_address (str): 도로명 주소
+
+        Returns:
+            Optional[Tuple[float, float]]: 위도, 경도이며 존재하지 않으면 None을 반환
+        """
+        coordinates = (
+            RawPetKindergarden.objects.filter(road_address=road_address).order_by("id").values_list("y", "x").first()
+        )
+        if coordinates is None:
+            return None
+        return float(coordinates[0]), float(coordinates[1])
+
+    def get_queryset_by_location(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: int,
+    ) -> QuerySet[RawPetKindergarden]:
+        """
+        이 함수는 좌표에서 반경 이내의 로우 반려동물 유치원 쿼리셋을 가까운 순서로 조회합니다.
+
+        반경 조건(ST_DWithin)과 거리 연산자(<->) 정렬 모두 좌표의 GiST 인덱스를 사용합니다.
+
+        Args:
+            latitude (float): 위도
+            longitude (float): 경도
+            radius (int): 반경 (m)
+
+        Returns:
+            QuerySet[RawPetKindergarden]: 거리(distance)를 포함한 로우 반려동물 유치원 쿼리셋이며 존재하지 않으면 빈 쿼리셋을 반환
+        """
+        point = get_geography_point(latitude, longitude)
+        return (
+            RawPetKindergarden.objects.filter(point__dwithin=(point, D(m=radius)))
+            .annotate(distance=Distance("point", point))
+            .order_by(get_knn_distance(point), "id")
+        )
+
+    def get_queryset_by_name_and_location(
+        self,
+        name: str,
+        latitude: float,
+        longitude: float,
+        radius: int,
+    ) -> QuerySet[RawPetKindergarden]:
+        """
+        이 함수는 이름을 포함하며 좌표에서 반경 이내의 로우 반려동물 유치원 쿼리셋을 조회합니다.
+
+        이름은 get_queryset_by_name과 같은 방식(공백, 대소문자, 한글 자모 분해와 관계없이)으로 비교하며,
+        이름이 검색어로 시작하는 반려동물 유치원을 먼저 조회하고 같은 순위는 가까운 순서로 조회합니다.
 
         Args:
-            name: 반려동물 유치원 이름
+            name (str): 반려동물 유치원 이름
+            latitude (float): 위도
+            longitude (float): 경도
+            radius (int): 반경 (m)
 
         Returns:
-            QuerySet[RawPetKindergarden]: 로우 반려동물 유치원 쿼리셋 존재하지 않으면 빈 쿼리셋을 반환
+            QuerySet[RawPetKindergarden]: 거리(distance)를 포함한 로우 반려동물 유치원 쿼리셋이며 존재하지 않으면 빈 쿼리셋을 반환
         """
-        return RawPetKindergarden.objects.filter(name__icontains=name)
+        keyword = get_search_keyword(name)
+        if not keyword:
+            return RawPetKindergarden.objects.none()
+
+        point = get_geography_point(latitude, longitude)
+        return (
+            RawPetKindergarden.objects.alias(name_search_text=get_search_text("name"))
+            .filter(point__dwithin=(point, D(m=radius)), name_search_text__contains=keyword)
+            .annotate(
+                distance=Distance("point", point),
+                name_rank=Case(
+                    When(name_search_text__startswith=keyword, then=Value(0)),
+                    default=Value(1),
+                    output_field=IntegerField(),
+                ),
+            )
+            .order_by("name_rank", get_knn_distance(point), "id")
+        )
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
 from typing import List, Tuple
 
+from django.core.files import File
+
 from mung_manager.errors.exceptions import NotImplementedException
+from mung_manager.pet_kindergardens.imports import RawPetKindergardenImportResult
 from mung_manager.pet_kindergardens.models import PetKindergarden
 
 
@@ -54,3 +57,15 @@ class AbstractPetKindergardenService(ABC):
         main_thumbnail_url: str,
     ) -> PetKindergarden:
         raise NotImplementedException()
+
+
+class AbstractRawPetKindergardenService(ABC):
+    @abstractmethod
+    def import_raw_pet_kindergardens(
+        self,
+        file: File,
+        file_format: str,
+        batch_size: int,
+        rebuild_indexes: bool,
+    ) -> RawPetKindergardenImportResult:
+        raise NotImplementedException()
@@ -1,8 +1,5 @@
-from math import floor
 from typing import List, Tuple
 
-import requests
-from django.conf import settings
 from django.contrib.gis.geos import Point
 from django.db import transaction
 
@@ -12,7 +9,9 @@ from mung_manager.common.selectors import (
     get_object_or_not_found,
 )
 from mung_manager.common.services import update_model
-from mung_manager.errors.exceptions import AuthenticationFailedException
+from mung_manager.files.selectors.uploaded_images import UploadedImageSelector
+from mung_manager.pet_kindergardens.caches import PetKindergardenOwnerCache
+from mung_manager.pet_kindergardens.geocoders import PetKindergardenGeocoder
 from mung_manager.pet_kindergardens.models import PetKindergarden
 from mung_manager.pet_kindergardens.selectors.pet_kindergardens import (
     PetKindergardenSelector,
@@ -25,8 +24,17 @@ from mung_manager.pet_kindergardens.services.abstracts import (
 class PetKindergardenService(AbstractPetKindergardenService):
     """이 클래스는 반려동물 유치원를 DB에 PUSH하는 비즈니스 로직을 담당합니다."""
 
-    def __init__(self, pet_kindergarden_selector: PetKindergardenSelector):
+    def __init__(
+        self,
+        pet_kindergarden_selector: PetKindergardenSelector,
+        pet_kindergarden_owner_cache: PetKindergardenOwnerCache,
+        uploaded_image_selector: UploadedImageSelector,
+        pet_kindergarden_geocoder: PetKindergardenGeocoder,
+    ):
         self._pet_kindergarden_selector = pet_kindergarden_selector
+        self._pet_kindergarden_owner_cache = pet_kindergarden_owner_cache
+        self._uploaded_image_selector = uploaded_image_selector
+        self._pet_kindergarden_geocoder = pet_kindergarden_geocoder
 
     def _get_coordinates_by_road_address(self, road_address: str) -> Tuple[float, float]:
         """이 함수는 도로명 주소를 받아 위도, 경도를 얻어옵니다.
@@ -37,32 +45,8 @@ class PetKindergardenService(AbstractPetKindergardenService):
         Returns:
             Tuple[float, float]: 위도, 경도
         """
-        response = requests.get(
-            url="https://dapi.kakao.com/v2/local/search/address.json",
-            headers={"Authorization": f"KakaoAK {settings.KAKAO_API_KEY}"},
-            # @TODO: Fixed Type
-            params={  # type: ignore
-                "analyze_type": "exact",
-                "query": road_address,
-                "page": 1,
-                "size": 1,
-            },
-            timeout=3,
-        )
-        if response.status_code != 200:
-            raise AuthenticationFailedException(
-                detail=SYSTEM_CODE.message("AUTHENTICATION_FAILED_KAKAO_ADDRESS"),
-                code=SYSTEM_CODE.code("AUTHENTICATION_FAILED_KAKAO_ADDRESS"),
-            )
-
-        response_data = response.json()
+        return self._pet_kindergarden_geocoder.get_coordinates(road_address)
 
-        latitude = floor(float(response_data["documents"][0]["road_address"]["y"]) * 10**6) / 10**6
-        longitude = floor(float(response_data["documents"][0]["road_address"]["x"]) * 10**6) / 10**6
-
-        return latitude, longitude
-
-    @transaction.atomic
     def create_pet_kindergarden(
         self,
         user,
@@ -112,31 +96,42 @@ class PetKindergardenService(AbstractPetKindergardenService):
         )
         # 도로명 주소로 위도, 경도를 조회
         latitude, longitude = self._get_coordinates_by_road_address(road_address)
-        pet_kindergarden = PetKindergarden.objects.create(
-            name=name,
-            profile_thumbnail_url=profile_thumbnail_url,
-            main_thumbnail_url=main_thumbnail_url,
-            phone_number=phone_number,
-            visible_phone_number=visible_phone_number,
-            business_start_hour=business_start_hour,
-            business_end_hour=business_end_hour,
-            road_address=road_address,
-            abbr_address=abbr_address,
-            detail_address=detail_address,
-            short_address=short_address,
-            guide_message=guide_message,
-            latitude=latitude,
-            longitude=longitude,
-            point=Point(longitude, latitude),
-            reservation_availability_option=reservation_availability_option,
-            reservation_change_option=reservation_change_option,
-            daily_pet_limit=daily_pet_limit,
-            user=user,
-        )
 
+        # 외부 API 조회가 끝난 뒤 트랜잭션을 시작하여 조회 중에 DB 연결을 점유하지 않음
+        with transaction.atomic():
+            pet_kindergarden = PetKindergarden.objects.create(
+                name=name,
+                profile_thumbnail_url=profile_thumbnail_url,
+                main_thumbnail_url=main_thumbnail_url,
+                # 업로드한 이미지인 경우 파생 이미지(썸네일) URL을 함께 저장
+                profile_thumbnail_variant_urls=self._uploaded_image_selector.get_variant_urls_by_file_url(
+                    profile_thumbnail_url
+                ),
+                main_thumbnail_variant_urls=self._uploaded_image_selector.get_variant_urls_by_file_url(
+                    main_thumbnail_url
+                ),
+                phone_number=phone_number,
+                visible_phone_number=visible_phone_number,
+                business_start_hour=business_start_hour,
+                business_end_hour=business_end_hour,
+                road_address=road_address,
+                abbr_address=abbr_address,
+                detail_address=detail_address,
+                short_address=short_address,
+                guide_message=guide_message,
+                latitude=latitude,
+                longitude=longitude,
+                point=Point(longitude, latitude),
+                reservation_availability_option=reservation_availability_option,
+                reservation_change_option=reservation_change_option,
+                daily_pet_limit=daily_pet_limit,
+                user=user,
+            )
+
+            # 유저가 소유한 반려동물 유치원 아이디 캐시 무효화
+            self._pet_kindergarden_owner_cache.delete(user.id)
         return pet_kindergarden
 
-    @transaction.atomic
     def update_pet_kindergarden(
         self,
         user,
@@ -188,13 +183,22 @@ class PetKindergardenService(AbstractPetKindergardenService):
             msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
             code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
         )
-        # 도로명 주소로 위도, 경도를 조회
-        latitude, longitude = self._get_coordinates_by_road_address(road_address)
+        # 도로명 주소가 변경된 경우에만 위도, 경도를 조회
+        if road_address == pet_kindergarden.road_address:
+            latitude, longitude = float(pet_kindergarden.latitude), float(pet_kindergarden.longitude)
+        else:
+            latitude, longitude = self._get_coordinates_by_road_address(road_address)
 
         data = {
             "name": name,
             "profile_thumbnail_url": profile_thumbnail_url,
             "main_thumbnail_url": main_thumbnail_url,
+            "profile_thumbnail_variant_urls": self._uploaded_image_selector.get_variant_urls_by_file_url(
+                profile_thumbnail_url
+            ),
+            "main_thumbnail_variant_urls": self._uploaded_image_selector.get_variant_urls_by_file_url(
+                main_thumbnail_url
+            ),
             "phone_number": phone_number,
             "visible_phone_number": visible_phone_number,
             "business_start_hour": business_start_hour,
@@ -212,9 +216,11 @@ class PetKindergardenService(AbstractPetKindergardenService):
             "daily_pet_limit": daily_pet_limit,
         }
 
-        pet_kindergarden, has_updated = update_model(
-            instance=pet_kindergarden,
-            fields=list(data.keys()),
-            data=data,
-        )
+        # 외부 API 조회가 끝난 뒤 트랜잭션을 시작하여 조회 중에 DB 연결을 점유하지 않음
+        with transaction.atomic():
+            pet_kindergarden, has_updated = update_model(
+                instance=pet_kindergarden,
+                fields=list(data.keys()),
+                data=data,
+            )
         return pet_kindergarden
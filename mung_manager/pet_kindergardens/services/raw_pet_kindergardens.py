@@ -0,0 +1,186 @@
+import csv
+import io
+import time
+from itertools import islice
+from typing import Any, Iterator
+
+from django.core.files import File
+from django.db import connection, transaction
+
+from mung_manager.pet_kindergardens.imports import (
+    RawPetKindergardenImportResult,
+    RawPetKindergardenRecordReader,
+)
+from mung_manager.pet_kindergardens.models import RawPetKindergarden
+from mung_manager.pet_kindergardens.services.abstracts import (
+    AbstractRawPetKindergardenService,
+)
+
+
+class RawPetKindergardenService(AbstractRawPetKindergardenService):
+    """이 클래스는 로우 반려동물 유치원을 DB에 PUSH하는 비즈니스 로직을 담당합니다."""
+
+    STAGING_TABLE = "raw_pet_kindergarden_staging"
+    COPY_BATCH_SIZE = 10000
+    # 적재 후 다시 생성할 인덱스 종류 (트라이그램 GIN, 좌표 GiST)
+    REBUILD_INDEX_TYPES = ("gin", "gist")
+    # 스테이징 테이블 컬럼 타입 (RawPetKindergardenRecordReader.FIELD_NAMES 순서)
+    STAGING_COLUMN_TYPES = {
+        "thum_url": "varchar",
+        "tel": "varchar",
+        "virtual_tel": "varchar",
+        "name": "varchar",
+        "x": "numeric(9, 6)",
+        "y": "numeric(8, 6)",
+        "business_start_hour": "time",
+        "business_end_hour": "time",
+        "address": "varchar",
+        "road_address": "varchar",
+        "abbr_address": "varchar",
+        "short_address": "varchar[]",
+    }
+
+    def import_raw_pet_kindergardens(
+        self,
+        file: File,
+        file_format: str,
+        batch_size: int = COPY_BATCH_SIZE,
+        rebuild_indexes: bool = True,
+    ) -> RawPetKindergardenImportResult:
+        """이 함수는 수집한 로우 반려동물 유치원 파일을 적재합니다.
+
+        파일을 batch_size개 행씩 COPY로 임시 스테이징 테이블에 적재한 뒤, 전화번호와 주소가 같은 로우 반려동물 유치원은
+        갱신하고 없으면 추가합니다. 파일 안에서 전화번호와 주소가 같은 레코드는 마지막 레코드를 사용합니다.
+        모든 변경은 하나의 트랜잭션에서 반영되며, 변경된 행이 있으면 커밋 후 GIN, GiST 인덱스를 다시 생성합니다.
+
+        Args:
+            file (File): 수집한 로우 반려동물 유치원 파일
+            file_format (str): 파일 형식 (json, jsonl, csv)
+            batch_size (int): 한 번에 COPY할 행 수
+            rebuild_indexes (bool): 적재 후 인덱스를 다시 생성할지 여부
+
+        Returns:
+            RawPetKindergardenImportResult: 적재 결과
+        """
+        started_at = time.monotonic()
+        reader = RawPetKindergardenRecordReader(file=file, file_format=file_format)
+        field_names = RawPetKindergardenRecordReader.FIELD_NAMES
+
+        read_count = 0
+        with transaction.atomic(), connection.cursor() as cursor:
+            self._create_staging_table(cursor, field_names)
+
+            rows = reader.read_rows()
+            while batch := list(islice(rows, batch_size)):
+                self._copy_rows(cursor, field_names, batch, start_line_number=read_count + 1)
+                read_count += len(batch)
+
+            updated_count, created_count = self._merge_staging_table(cursor, field_names)
+            # 바깥 트랜잭션 안에서 호출된 경우 커밋 시점까지 남지 않도록 직접 삭제
+            cursor.execute(f"DROP TABLE {self.STAGING_TABLE}")
+
+        if rebuild_indexes and (updated_count or created_count):
+            self._rebuild_indexes()
+
+        return RawPetKindergardenImportResult(
+            read_count=read_count + reader.skipped_count,
+            skipped_count=reader.skipped_count,
+            created_count=created_count,
+            updated_count=updated_count,
+            elapsed_seconds=time.monotonic() - started_at,
+        )
+
+    def _create_staging_table(self, cursor, field_names: tuple[str, ...]) -> None:
+        columns = ", ".join(
+            f"{field_name} {self.STAGING_COLUMN_TYPES[field_name]} NOT NULL" for field_name in field_names
+        )
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {self.STAGING_TABLE} (line_number bigint NOT NULL, {columns}) ON COMMIT DROP"
+        )
+
+    def _copy_rows(
+        self,
+        cursor,
+        field_names: tuple[str, ...],
+        rows: list[list[Any]],
+        start_line_number: int,
+    ) -> None:
+        # 빈 문자열이 NULL로 해석되지 않도록 모든 값을 따옴표로 감싸서 CSV로 변환
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+        for line_number, row in enumerate(rows, start=start_line_number):
+            writer.writerow([line_number, *self._get_copy_values(row)])
+        buffer.seek(0)
+
+        columns = ", ".join(["line_number", *field_names])
+        cursor.copy_expert(f"COPY {self.STAGING_TABLE} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+    def _get_copy_values(self, row: list[Any]) -> Iterator[Any]:
+        for value in row:
+            if isinstance(value, list):
+                # PostgreSQL 배열 리터럴 ({"a","b"})
+                items = ('"' + item.replace("\\", "\\\\").replace('"', '\\"') + '"' for item in value)
+                yield "{" + ",".join(items) + "}"
+            else:
+                yield value
+
+    def _merge_staging_table(self, cursor, field_names: tuple[str, ...]) -> tuple[int, int]:
+        quote_name = connection.ops.quote_name
+        table = quote_name(RawPetKindergarden._meta.db_table)
+        target_columns = [
+            quote_name(RawPetKindergarden._meta.get_field(field_name).column) for field_name in field_names
+        ]
+        tel_column = quote_name(RawPetKindergarden._meta.get_field("tel").column)
+        address_column = quote_name(RawPetKindergarden._meta.get_field("address").column)
+        point_column = quote_name(RawPetKindergarden._meta.get_field("point").column)
+        point = "ST_SetSRID(ST_MakePoint(source.x, source.y), 4326)::geography"
+
+        # 파일 안에서 전화번호와 주소가 같은 레코드는 마지막 레코드를 사용
+        source = (
+            f"SELECT DISTINCT ON (tel, address) * FROM {self.STAGING_TABLE} "
+            "ORDER BY tel, address, line_number DESC"
+        )
+
+        # 값이 바뀐 행만 갱신하여 변경되지 않은 행의 인덱스는 갱신하지 않음
+        cursor.execute(
+            f"UPDATE {table} AS target SET "
+            + ", ".join(
+                f"{target_column} = source.{field_name}"
+                for target_column, field_name in zip(target_columns, field_names)
+            )
+            + f", {point_column} = {point} "
+            f"FROM ({source}) AS source "
+            f"WHERE target.{tel_column} = source.tel AND target.{address_column} = source.address "
+            f"AND ({', '.join(f'target.{target_column}' for target_column in target_columns)}) "
+            f"IS DISTINCT FROM ({', '.join(f'source.{field_name}' for field_name in field_names)})"
+        )
+        updated_count = cursor.rowcount
+
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(target_columns)}, {point_column}) "
+            f"SELECT {', '.join(f'source.{field_name}' for field_name in field_names)}, {point} "
+            f"FROM ({source}) AS source "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {table} AS target "
+            f"WHERE target.{tel_column} = source.tel AND target.{address_column} = source.address)"
+        )
+        created_count = cursor.rowcount
+
+        return updated_count, created_count
+
+    def _rebuild_indexes(self) -> None:
+        # 대량 변경으로 커진 트라이그램(GIN), 좌표(GiST) 인덱스만 다시 생성하고 통계를 갱신
+        # B-tree 인덱스는 대량 변경 후에도 크게 부풀지 않으므로 다시 생성하지 않음
+        # 트랜잭션 안에서는 CONCURRENTLY를 사용할 수 없으므로 잠금을 사용하는 REINDEX로 대신함
+        quote_name = connection.ops.quote_name
+        table = RawPetKindergarden._meta.db_table
+        concurrently = "" if connection.in_atomic_block else " CONCURRENTLY"
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, table)
+            index_names = sorted(
+                name
+                for name, constraint in constraints.items()
+                if constraint["index"] and constraint["type"] in self.REBUILD_INDEX_TYPES
+            )
+            for index_name in index_names:
+                cursor.execute(f"REINDEX INDEX{concurrently} {quote_name(index_name)}")
+            cursor.execute(f"ANALYZE {quote_name(table)}")
@@ -0,0 +1,55 @@
+from typing import NamedTuple
+
+from mung_manager.common.constants import SYSTEM_CODE
+from mung_manager.errors.exceptions import NotFoundException
+from mung_manager.pet_kindergardens.caches import PetKindergardenOwnerCache
+from mung_manager.pet_kindergardens.selectors.pet_kindergardens import (
+    PetKindergardenSelector,
+)
+
+
+class PetKindergardenTenant(NamedTuple):
+    """이 클래스는 요청한 유저가 소유한 것으로 확인된 반려동물 유치원입니다.
+
+    서비스는 테넌트를 인자로 받으므로 반려동물 유치원 소유 여부를 다시 조회하지 않습니다.
+
+    Attributes:
+        pet_kindergarden_id (int): 반려동물 유치원 아이디
+        user: 반려동물 유치원을 소유한 유저 객체
+    """
+
+    pet_kindergarden_id: int
+    user: object
+
+
+class PetKindergardenTenantResolver:
+    """이 클래스는 요청마다 반려동물 유치원 소유 여부를 확인하여 테넌트를 생성합니다."""
+
+    def __init__(
+        self,
+        pet_kindergarden_selector: PetKindergardenSelector,
+        pet_kindergarden_owner_cache: PetKindergardenOwnerCache,
+    ):
+        self._pet_kindergarden_selector = pet_kindergarden_selector
+        self._pet_kindergarden_owner_cache = pet_kindergarden_owner_cache
+
+    def resolve(self, pet_kindergarden_id: int, user) -> PetKindergardenTenant:
+        """이 함수는 유저가 반려동물 유치원을 소유하고 있는지 확인 후 테넌트를 반환합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            user: 유저 객체
+
+        Returns:
+            PetKindergardenTenant: 반려동물 유치원 테넌트
+        """
+        pet_kindergarden_ids = self._pet_kindergarden_owner_cache.get_or_set(
+            user_id=user.id,
+            default=lambda: self._pet_kindergarden_selector.get_ids_by_user(user),
+        )
+        if pet_kindergarden_id not in pet_kindergarden_ids:
+            raise NotFoundException(
+                detail=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
+                code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
+            )
+        return PetKindergardenTenant(pet_kindergarden_id=pet_kindergarden_id, user=user)
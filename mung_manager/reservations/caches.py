@@ -0,0 +1,208 @@
+import datetime as dt
+import threading
+import time
+from typing import Callable, NamedTuple, Optional
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+from mung_manager.reservations.models import KoreaSpecialDay
+
+
+class ReservationCalendarCache:
+    """이 클래스는 반려동물 유치원의 월별 예약 캘린더 응답을 캐시합니다.
+
+    캐시 키는 (반려동물 유치원 아이디, 년도, 월) 단위이며 월별 버전을 포함합니다.
+    예약 및 휴무일이 변경되면 트랜잭션 커밋 후 해당 월의 버전을 올려 이전 캐시를 무효화하므로,
+    변경 전에 조회를 시작한 요청이 이전 데이터를 저장하더라도 다시 사용되지 않습니다.
+    """
+
+    KEY_PREFIX = "reservation-calendar"
+    TIMEOUT = 60 * 60 * 24
+    HIT_COUNT_KEY = f"{KEY_PREFIX}:hit-count"
+    MISS_COUNT_KEY = f"{KEY_PREFIX}:miss-count"
+
+    def get_or_set(self, pet_kindergarden_id: int, year: int, month: int, default: Callable[[], dict]) -> dict:
+        """이 함수는 월별 예약 캘린더 캐시를 조회하며, 없으면 default로 생성하여 저장합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            year (int): 년도
+            month (int): 월
+            default (Callable[[], dict]): 캐시가 없을 경우 캘린더 응답을 생성하는 함수
+
+        Returns:
+            dict: 월별 예약 캘린더 응답
+        """
+        # 조회 시작 시점의 버전으로 저장해야 조회 중 무효화된 데이터가 사용되지 않음
+        # 캘린더 응답에 공휴일이 포함되므로 공휴일 버전이 바뀌어도 이전 캐시를 사용하지 않음
+        version_key = self._get_version_key(pet_kindergarden_id, year, month)
+        versions = cache.get_many([version_key, KoreaSpecialDayCache.VERSION_KEY])
+        version = f"{versions.get(version_key, 0)}-{versions.get(KoreaSpecialDayCache.VERSION_KEY, 0)}"
+        key = self._get_key(pet_kindergarden_id, year, month, version)
+
+        data = cache.get(key)
+        if data is not None:
+            self._increase_count(self.HIT_COUNT_KEY)
+            return data
+
+        self._increase_count(self.MISS_COUNT_KEY)
+        data = default()
+        cache.set(key, data, timeout=self.TIMEOUT)
+        return data
+
+    def delete_by_date_range(self, pet_kindergarden_id: int, start_date: dt.date, end_date: dt.date) -> None:
+        """이 함수는 날짜 범위에 해당하는 모든 월의 예약 캘린더 캐시를 트랜잭션 커밋 후 무효화합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            start_date (date): 시작 날짜
+            end_date (date): 종료 날짜
+
+        Returns:
+            None
+        """
+        version_keys = [
+            self._get_version_key(pet_kindergarden_id, year, month)
+            for year, month in self._get_months(start_date, end_date)
+        ]
+        transaction.on_commit(lambda: self._increase_versions(version_keys))
+
+    def get_statistics(self) -> dict[str, int]:
+        """이 함수는 예약 캘린더 캐시의 히트/미스 횟수를 조회합니다.
+
+        Returns:
+            dict[str, int]: hit_count, miss_count 를 키로 가지는 딕셔너리
+        """
+        counts = cache.get_many([self.HIT_COUNT_KEY, self.MISS_COUNT_KEY])
+        return {
+            "hit_count": counts.get(self.HIT_COUNT_KEY, 0),
+            "miss_count": counts.get(self.MISS_COUNT_KEY, 0),
+        }
+
+    def _get_key(self, pet_kindergarden_id: int, year: int, month: int, version: str) -> str:
+        return f"{self.KEY_PREFIX}:{pet_kindergarden_id}:{year}:{month}:{version}"
+
+    def _get_version_key(self, pet_kindergarden_id: int, year: int, month: int) -> str:
+        return f"{self.KEY_PREFIX}:{pet_kindergarden_id}:{year}:{month}:version"
+
+    def _get_months(self, start_date: dt.date, end_date: dt.date) -> list[tuple[int, int]]:
+        months = []
+        year, month = start_date.year, start_date.month
+        while (year, month) <= (end_date.year, end_date.month):
+            months.append((year, month))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return months
+
+    def _increase_versions(self, version_keys: list[str]) -> None:
+        for version_key in version_keys:
+            self._increase_count(version_key)
+
+    def _increase_count(self, key: str) -> None:
+        # 키가 없으면 incr가 ValueError를 발생시키므로 생성 후 다시 증가
+        try:
+            cache.incr(key)
+        except ValueError:
+            if cache.add(key, 1, timeout=None) is False:
+                cache.incr(key)
+
+
+class KoreaSpecialDayIndex(NamedTuple):
+    """이 클래스는 한 시점에 적재된 한국 특별일의 변경 불가능한 인덱스입니다.
+
+    Attributes:
+        version (int): 적재 시점의 공휴일 버전
+        loaded_at (float): 적재 시점 (time.monotonic)
+        special_days_by_month (dict[tuple[int, int], tuple[KoreaSpecialDay, ...]]): (년도, 월)별 특별일
+        holidays (frozenset[date]): 공휴일 날짜 집합
+    """
+
+    version: int
+    loaded_at: float
+    special_days_by_month: dict[tuple[int, int], tuple[KoreaSpecialDay, ...]]
+    holidays: frozenset[dt.date]
+
+
+class KoreaSpecialDayCache:
+    """이 클래스는 한국 특별일을 프로세스 메모리에 보관합니다.
+
+    특별일은 매년 공휴일이 공표될 때만 변경되므로 전체를 한 번 읽어 인덱스로 보관하며,
+    공유 캐시에 저장된 버전이 바뀐 경우에만 다시 읽습니다. 특별일이 변경되면 refresh로 버전을 올려
+    모든 워커가 다음 조회에서 다시 적재하도록 합니다.
+
+    워커 간 버전 공유를 위해 공유 캐시(CACHE_REDIS_URL)가 필요합니다. 프로세스 메모리 캐시(locmem 등)에서는
+    다른 프로세스에서 호출한 refresh가 보이지 않으므로, 버전과 관계없이 LOCAL_CACHE_TIMEOUT이 지난 인덱스를 다시 적재합니다.
+    """
+
+    VERSION_KEY = "korea-special-day:version"
+    LOCAL_CACHE_TIMEOUT = 60 * 5
+
+    # 인덱스는 프로세스 전역으로 공유하며 적재가 끝난 인덱스로 한 번에 교체
+    _index: Optional[KoreaSpecialDayIndex] = None
+    _lock = threading.Lock()
+
+    def get_or_set(self, default: Callable[[], list[KoreaSpecialDay]]) -> KoreaSpecialDayIndex:
+        """이 함수는 현재 버전의 특별일 인덱스를 조회하며, 없거나 버전이 다르면 default로 다시 적재합니다.
+
+        Args:
+            default (Callable[[], list[KoreaSpecialDay]]): 전체 특별일을 조회하는 함수
+
+        Returns:
+            KoreaSpecialDayIndex: 특별일 인덱스
+        """
+        version = self._get_version()
+        index = KoreaSpecialDayCache._index
+        if self._is_valid(index, version):
+            return index
+
+        with KoreaSpecialDayCache._lock:
+            # 대기하는 동안 다른 스레드가 적재했다면 다시 읽지 않음
+            index = KoreaSpecialDayCache._index
+            if not self._is_valid(index, version):
+                index = self._build_index(version, default())
+                KoreaSpecialDayCache._index = index
+        return index
+
+    def refresh(self) -> int:
+        """이 함수는 특별일 버전을 올려 모든 프로세스의 인덱스를 무효화합니다.
+
+        Returns:
+            int: 변경된 버전
+        """
+        try:
+            return cache.incr(self.VERSION_KEY)
+        except ValueError:
+            # 버전이 없는 경우 적재된 인덱스(버전 1)와 구분되도록 2부터 시작
+            if cache.add(self.VERSION_KEY, 2, timeout=None) is False:
+                return cache.incr(self.VERSION_KEY)
+            return 2
+
+    def _is_valid(self, index: Optional[KoreaSpecialDayIndex], version: int) -> bool:
+        if index is None or index.version != version:
+            return False
+        # 프로세스 메모리 캐시는 다른 프로세스의 버전 변경을 알 수 없으므로 적재 후 일정 시간만 사용
+        if isinstance(caches["default"], (LocMemCache, DummyCache)):
+            return time.monotonic() - index.loaded_at < self.LOCAL_CACHE_TIMEOUT
+        return True
+
+    def _get_version(self) -> int:
+        version = cache.get(self.VERSION_KEY)
+        if version is None:
+            cache.add(self.VERSION_KEY, 1, timeout=None)
+            version = cache.get(self.VERSION_KEY, 1)
+        return version
+
+    def _build_index(self, version: int, korea_special_days: list[KoreaSpecialDay]) -> KoreaSpecialDayIndex:
+        special_days_by_month: dict[tuple[int, int], list[KoreaSpecialDay]] = {}
+        for korea_special_day in sorted(korea_special_days, key=lambda x: (x.special_day_at, x.id)):
+            month = (korea_special_day.special_day_at.year, korea_special_day.special_day_at.month)
+            special_days_by_month.setdefault(month, []).append(korea_special_day)
+
+        return KoreaSpecialDayIndex(
+            version=version,
+            loaded_at=time.monotonic(),
+            special_days_by_month={month: tuple(days) for month, days in special_days_by_month.items()},
+            holidays=frozenset(x.special_day_at for x in korea_special_days if x.is_holiday),
+        )
@@ -1,14 +1,23 @@
 from dependency_injector import containers, providers
 
+from mung_manager.customers.selectors.customer_import_jobs import (
+    CustomerImportJobSelector,
+)
 from mung_manager.customers.selectors.customer_pets import CustomerPetSelector
 from mung_manager.customers.selectors.customer_ticket_usage_logs import (
     CustomerTicketUsageLogSelector,
 )
 from mung_manager.customers.selectors.customer_tickets import CustomerTicketSelector
 from mung_manager.customers.selectors.customers import CustomerSelector
+from mung_manager.customers.services.customer_tickets import CustomerTicketService
+from mung_manager.customers.services.customers import CustomerService
 from mung_manager.pet_kindergardens.selectors.pet_kindergardens import (
     PetKindergardenSelector,
 )
+from mung_manager.reservations.caches import (
+    KoreaSpecialDayCache,
+    ReservationCalendarCache,
+)
 from mung_manager.reservations.selectors.daily_reservations import (
     DailyReservationSelector,
 )
@@ -17,8 +26,12 @@ from mung_manager.reservations.selectors.korea_special_days import (
     KoreaSpecialDaySelector,
 )
 from mung_manager.reservations.selectors.reservations import ReservationSelector
+from mung_manager.reservations.services.daily_reservations import (
+    DailyReservationService,
+)
 from mung_manager.reservations.services.day_offs import DayOffService
 from mung_manager.reservations.services.reservations import ReservationService
+from mung_manager.tickets.selectors.tickets import TicketSelector
 
 
 class ReservationContainer(containers.DeclarativeContainer):
@@ -28,12 +41,19 @@ class ReservationContainer(containers.DeclarativeContainer):
         pet_kindergarden_selector: 반려동물 유치원 셀렉터
         customer_selector: 고객 셀렉터
         customer_pet_selector: 고객 반려동물 셀렉터
+        customer_import_job_selector: 고객 일괄 등록 작업 셀렉터
         customer_ticket_selector: 고객 티켓 셀렉터
         customer_ticket_usage_log_selector: 고객 티켓 사용 로그 셀렉터
         daily_reservation_selector: 일일 예약 셀렉터
         reservation_selector: 예약 셀렉터
         day_off_selector: 휴무일 셀렉터
         korea_special_day_selector: 한국 특별일 셀렉터
+        ticket_selector: 티켓 셀렉터
+        reservation_calendar_cache: 예약 캘린더 캐시
+        korea_special_day_cache: 한국 특별일 캐시
+        customer_ticket_service: 고객 티켓 서비스
+        customer_service: 고객 서비스
+        daily_reservation_service: 일일 예약 서비스
         day_off_service: 휴무일 서비스
         reservation_service: 예약 서비스
     """
@@ -41,24 +61,45 @@ class ReservationContainer(containers.DeclarativeContainer):
     pet_kindergarden_selector = providers.Factory(PetKindergardenSelector)
     customer_selector = providers.Factory(CustomerSelector)
     customer_pet_selector = providers.Factory(CustomerPetSelector)
+    customer_import_job_selector = providers.Factory(CustomerImportJobSelector)
     customer_ticket_selector = providers.Factory(CustomerTicketSelector)
     customer_ticket_usage_log_selector = providers.Factory(CustomerTicketUsageLogSelector)
     daily_reservation_selector = providers.Factory(DailyReservationSelector)
     reservation_selector = providers.Factory(ReservationSelector)
     day_off_selector = providers.Factory(DayOffSelector)
-    korea_special_day_selector = providers.Factory(KoreaSpecialDaySelector)
+    ticket_selector = providers.Factory(TicketSelector)
+    reservation_calendar_cache = providers.Factory(ReservationCalendarCache)
+    korea_special_day_cache = providers.Factory(KoreaSpecialDayCache)
+    korea_special_day_selector = providers.Factory(
+        KoreaSpecialDaySelector,
+        korea_special_day_cache=korea_special_day_cache,
+    )
+    customer_ticket_service = providers.Factory(
+        CustomerTicketService,
+        customer_selector=customer_selector,
+        customer_ticket_selector=customer_ticket_selector,
+        ticket_selector=ticket_selector,
+    )
+    customer_service = providers.Factory(
+        CustomerService,
+        customer_selector=customer_selector,
+        customer_pet_selector=customer_pet_selector,
+        customer_import_job_selector=customer_import_job_selector,
+    )
+    daily_reservation_service = providers.Factory(DailyReservationService)
     day_off_service = providers.Factory(
         DayOffService,
         day_off_selector=day_off_selector,
-        pet_kindergarden_selector=pet_kindergarden_selector,
+        reservation_calendar_cache=reservation_calendar_cache,
     )
     reservation_service = providers.Factory(
         ReservationService,
-        customer_selector=customer_selector,
         customer_ticket_selector=customer_ticket_selector,
         customer_ticket_usage_log_selector=customer_ticket_usage_log_selector,
-        daily_reservation_selector=daily_reservation_selector,
-        day_off_selector=day_off_selector,
         reservation_selector=reservation_selector,
         pet_kindergarden_selector=pet_kindergarden_selector,
+        customer_ticket_service=customer_ticket_service,
+        customer_service=customer_service,
+        daily_reservation_service=daily_reservation_service,
+        reservation_calendar_cache=reservation_calendar_cache,
     )
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from mung_manager.reservations.containers import ReservationContainer
+
+
+class Command(BaseCommand):
+    help = "한국 특별일 버전을 올려 모든 워커의 메모리 공휴일 인덱스를 다시 적재하도록 합니다."
+
+    def handle(self, *args, **options):
+        version = ReservationContainer.korea_special_day_cache().refresh()
+        self.stdout.write(self.style.SUCCESS(f"한국 특별일 버전이 {version}(으)로 변경되었습니다."))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from mung_manager.reservations.containers import ReservationContainer
+
+
+class Command(BaseCommand):
+    help = "월별 예약 캘린더 캐시의 히트/미스 횟수와 히트율을 출력합니다."
+
+    def handle(self, *args, **options):
+        statistics = ReservationContainer.reservation_calendar_cache().get_statistics()
+        hit_count = statistics["hit_count"]
+        miss_count = statistics["miss_count"]
+        total_count = hit_count + miss_count
+        hit_ratio = hit_count / total_count * 100 if total_count > 0 else 0
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"예약 캘린더 캐시 히트 {hit_count}회, 미스 {miss_count}회 (히트율 {hit_ratio:.1f}%)"
+            )
+        )
@@ -0,0 +1,45 @@
+# Generated by Django 5.0.6 on 2024-06-20 21:10
+
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def merge_duplicated_daily_reservations(apps, schema_editor):
+    DailyReservation = apps.get_model('reservations', 'DailyReservation')
+
+    duplicated_keys = (
+        DailyReservation.objects.values('pet_kindergarden_id', 'reserved_at')
+        .annotate(row_count=models.Count('id'))
+        .filter(row_count__gt=1)
+    )
+    for duplicated_key in duplicated_keys:
+        daily_reservations = DailyReservation.objects.filter(
+            pet_kindergarden_id=duplicated_key['pet_kindergarden_id'],
+            reserved_at=duplicated_key['reserved_at'],
+        ).order_by('id')
+        pet_counts = daily_reservations.aggregate(
+            total_pet_count=Sum('total_pet_count'),
+            time_pet_count=Sum('time_pet_count'),
+            all_day_pet_count=Sum('all_day_pet_count'),
+            hotel_pet_count=Sum('hotel_pet_count'),
+        )
+        kept_daily_reservation = daily_reservations.first()
+        daily_reservations.exclude(id=kept_daily_reservation.id).delete()
+        DailyReservation.objects.filter(id=kept_daily_reservation.id).update(**pet_counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservations', '0003_reservation_is_extented'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicated_daily_reservations, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='dailyreservation',
+            constraint=models.UniqueConstraint(
+                fields=('pet_kindergarden', 'reserved_at'), name='unique_daily_reservation_pet_kindergarden_reserved_at'
+            ),
+        ),
+    ]
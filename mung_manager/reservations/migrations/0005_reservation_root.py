@@ -0,0 +1,45 @@
+# Generated by Django 5.0.6 on 2024-06-24 22:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservations', '0004_dailyreservation_unique_pet_kindergarden_reserved_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reservation',
+            name='root',
+            field=models.ForeignKey(
+                db_comment='연박 예약의 루트 예약 아이디',
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='chain_reservations',
+                to='reservations.reservation',
+            ),
+        ),
+        migrations.RunSQL(
+            sql="""
+            WITH RECURSIVE chain AS (
+                SELECT reservation_id, reservation_id AS root_id
+                FROM reservation
+                WHERE parent_id IS NULL AND is_extented = TRUE
+
+                UNION ALL
+
+                SELECT r.reservation_id, c.root_id
+                FROM reservation r
+                INNER JOIN chain c ON r.parent_id = c.reservation_id
+            )
+            UPDATE reservation
+            SET root_id = chain.root_id
+            FROM chain
+            WHERE reservation.reservation_id = chain.reservation_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.0.6 on 2024-06-27 20:42
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('reservations', '0005_reservation_root'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='reservation',
+            index=models.Index(
+                condition=models.Q(('reservation_status', '취소'), _negated=True),
+                fields=['pet_kindergarden', 'reserved_at'],
+                name='reservation_pk_reserved_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='reservation',
+            index=models.Index(
+                condition=models.Q(('reservation_status', '취소'), _negated=True),
+                fields=['pet_kindergarden', 'end_at'],
+                name='reservation_pk_end_at_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='reservation',
+            index=models.Index(
+                condition=models.Q(('reservation_status', '취소'), _negated=True),
+                fields=['customer_pet', 'reserved_at', 'end_at'],
+                name='reservation_pet_reserved_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='dayoff',
+            index=models.Index(fields=['pet_kindergarden', 'day_off_at'], name='day_off_pk_day_off_at_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='koreaspecialday',
+            index=models.Index(fields=['special_day_at'], name='korea_special_day_at_idx'),
+        ),
+    ]
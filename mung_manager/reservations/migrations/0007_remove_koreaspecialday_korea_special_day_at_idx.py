@@ -0,0 +1,20 @@
+# Generated by Django 5.0.6 on 2024-07-02 21:10
+
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('reservations', '0006_reservation_indexes'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='koreaspecialday',
+            name='korea_special_day_at_idx',
+        ),
+    ]
@@ -27,6 +27,13 @@ class Reservation(TimeStampedModel):
         db_comment="부모 예약 아이디",
         null=True,
     )
+    root = models.ForeignKey(
+        "self",
+        on_delete=models.CASCADE,
+        related_name="chain_reservations",
+        db_comment="연박 예약의 루트 예약 아이디",
+        null=True,
+    )
     depth = models.PositiveIntegerField(
         db_comment="노드 깊이",
         default=0,
@@ -59,6 +66,26 @@ class Reservation(TimeStampedModel):
 
     class Meta:
         db_table = "reservation"
+        indexes = [
+            # 날짜별 예약 조회 (취소된 예약 제외)
+            models.Index(
+                fields=["pet_kindergarden", "reserved_at"],
+                name="reservation_pk_reserved_idx",
+                condition=~models.Q(reservation_status=ReservationStatus.CANCELED.value),
+            ),
+            # 날짜별 호텔 예약 조회 (퇴실 시간 기준, 취소된 예약 제외)
+            models.Index(
+                fields=["pet_kindergarden", "end_at"],
+                name="reservation_pk_end_at_idx",
+                condition=~models.Q(reservation_status=ReservationStatus.CANCELED.value),
+            ),
+            # 반려동물 중복 예약 검증 (취소된 예약 제외)
+            models.Index(
+                fields=["customer_pet", "reserved_at", "end_at"],
+                name="reservation_pet_reserved_idx",
+                condition=~models.Q(reservation_status=ReservationStatus.CANCELED.value),
+            ),
+        ]
 
 
 class DailyReservation(TimeStampedModel):
@@ -83,6 +110,12 @@ class DailyReservation(TimeStampedModel):
 
     class Meta:
         db_table = "daily_reservation"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["pet_kindergarden", "reserved_at"],
+                name="unique_daily_reservation_pet_kindergarden_reserved_at",
+            ),
+        ]
 
 
 class DayOff(TimeStampedModel):
@@ -103,6 +136,9 @@ class DayOff(TimeStampedModel):
 
     class Meta:
         db_table = "day_off"
+        indexes = [
+            models.Index(fields=["pet_kindergarden", "day_off_at"], name="day_off_pk_day_off_at_idx"),
+        ]
 
 
 class KoreaSpecialDay(TimeStampedModel):
@@ -1,3 +1,4 @@
+import datetime as dt
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -24,25 +25,11 @@ class AbstractReservationSelector(ABC):
         raise NotImplementedException()
 
     @abstractmethod
-    def exists_by_customer_pet_id_and_reserved_at(self, customer_pet_id: int, reserved_at: str) -> bool:
+    def get_queryset_by_root_id(self, root_id: int) -> QuerySet[Reservation]:
         raise NotImplementedException()
 
     @abstractmethod
-    def get_queryset_with_customer_ticket_and_ticket_by_ids(self, reservation_ids: list[int]) -> QuerySet[Reservation]:
-        raise NotImplementedException()
-
-    @abstractmethod
-    def get_queryset_by_ids(self, reservation_ids: list[int]) -> QuerySet[Reservation]:
-        raise NotImplementedException()
-
-    @abstractmethod
-    def get_child_ids_by_parent_id(self, parent_id: int) -> list[tuple[int, None]]:
-        raise NotImplementedException()
-
-    @abstractmethod
-    def get_queryset_for_customer_pet_duplicated_reserved_at(
-        self, customer_pet_id: int, reserved_at: str, end_at: str
-    ) -> list[Optional[str]]:
+    def get_queryset_with_customer_ticket_and_ticket_by_root_id(self, root_id: int) -> QuerySet[Reservation]:
         raise NotImplementedException()
 
 
@@ -53,24 +40,6 @@ class AbstractDailyReservationSelector(ABC):
     ) -> QuerySet[DailyReservation]:
         raise NotImplementedException()
 
-    @abstractmethod
-    def get_queryset_by_pet_kindergarden_id_and_reserved_at(
-        self, pet_kindergarden_id: int, reserved_at: str
-    ) -> QuerySet[DailyReservation]:
-        raise NotImplementedException()
-
-    @abstractmethod
-    def get_by_pet_kindergarden_id_and_reserved_at_and_end_at(
-        self, pet_kindergarden_id: int, reserved_at: str, end_at: str
-    ) -> QuerySet[DailyReservation]:
-        raise NotImplementedException()
-
-    @abstractmethod
-    def get_queryset_for_overregistered(
-        self, pet_kindergarden_id: int, reserved_at: list[str], daily_pet_limit: int
-    ) -> list[Optional[str]]:
-        raise NotImplementedException()
-
 
 class AbstractDayOffSelector(ABC):
     @abstractmethod
@@ -87,14 +56,12 @@ class AbstractDayOffSelector(ABC):
     def exists_by_day_off_at_and_pet_kindergarden_id(self, day_off_at: str, pet_kindergarden_id: int) -> bool:
         raise NotImplementedException()
 
+
+class AbstractKoreaSpecialDaySelector(ABC):
     @abstractmethod
-    def get_queryset_by_pet_kindergarden_id_and_day_off_at_for_day_offs(
-        self, pet_kindergarden_id: int, day_off_at: list[str]
-    ) -> list[Optional[str]]:
+    def get_list_by_year_and_month(self, year: int, month: int) -> list[KoreaSpecialDay]:
         raise NotImplementedException()
 
-
-class AbstractKoreaSpecialDaySelector(ABC):
     @abstractmethod
-    def get_queryset_by_year_and_month(self, year: int, month: int) -> QuerySet[KoreaSpecialDay]:
+    def is_holiday(self, date: dt.date) -> bool:
         raise NotImplementedException()
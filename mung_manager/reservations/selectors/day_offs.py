@@ -1,9 +1,8 @@
 from typing import Optional
 
-from django.db.models import DateField
-from django.db.models.functions import Cast
 from django.db.models.query import QuerySet
 
+from mung_manager.common.utils import month_window
 from mung_manager.reservations.models import DayOff
 from mung_manager.reservations.selectors.abstracts import AbstractDayOffSelector
 
@@ -24,8 +23,9 @@ class DayOffSelector(AbstractDayOffSelector):
         Returns:
             QuerySet[DayOff]: 휴무일 리스트 쿼리셋이며 존재하지 않으면 빈 쿼리셋을 반환
         """
+        month_start_at, month_end_at = month_window(year, month)
         return DayOff.objects.filter(
-            pet_kindergarden_id=pet_kindergarden_id, day_off_at__year=year, day_off_at__month=month
+            pet_kindergarden_id=pet_kindergarden_id, day_off_at__gte=month_start_at, day_off_at__lt=month_end_at
         )
 
     def get_by_id(self, day_off_id: int) -> Optional[DayOff]:
@@ -53,23 +53,3 @@ class DayOffSelector(AbstractDayOffSelector):
             bool: 휴무일이 존재하면 True를 반환하고, 존재하지 않으면 False를 반환
         """
         return DayOff.objects.filter(day_off_at=day_off_at, pet_kindergarden_id=pet_kindergarden_id).exists()
-
-    def get_queryset_by_pet_kindergarden_id_and_day_off_at_for_day_offs(
-        self, pet_kindergarden_id: int, day_off_at: list[str]
-    ) -> list[Optional[str]]:
-        """휴무일 날짜 범위와 반려동물 유치원 아이디로 휴무일이 존재하는 날짜들을 반환합니다.
-
-        Args:
-            date_range (list[str]): 휴무일 날짜 범위 (시작일, 종료일)
-            pet_kindergarden_id (int): 반려동물 유치원 아이디
-
-        Returns:
-            list[str]: 휴무일이 존재하는 날짜 리스트
-        """
-        day_off_dates = (
-            DayOff.objects.filter(pet_kindergarden_id=pet_kindergarden_id, day_off_at__range=day_off_at)
-            .annotate(day_off_at_str=Cast("day_off_at", DateField()))
-            .values_list("day_off_at_str", flat=True)
-        )
-
-        return [date.strftime("%Y-%m-%d") for date in day_off_dates]
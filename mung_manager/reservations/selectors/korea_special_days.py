@@ -1,5 +1,6 @@
-from django.db.models.query import QuerySet
+import datetime as dt
 
+from mung_manager.reservations.caches import KoreaSpecialDayCache
 from mung_manager.reservations.models import KoreaSpecialDay
 from mung_manager.reservations.selectors.abstracts import (
     AbstractKoreaSpecialDaySelector,
@@ -7,9 +8,15 @@ from mung_manager.reservations.selectors.abstracts import (
 
 
 class KoreaSpecialDaySelector(AbstractKoreaSpecialDaySelector):
-    """이 클래스는 한국의 공휴일을 DB에서 PULL하는 비즈니스 로직을 담당합니다."""
+    """이 클래스는 한국의 공휴일을 PULL하는 비즈니스 로직을 담당합니다.
 
-    def get_queryset_by_year_and_month(self, year: int, month: int) -> QuerySet[KoreaSpecialDay]:
+    공휴일은 프로세스 메모리의 인덱스에서 조회하며 인덱스가 없거나 갱신된 경우에만 DB에서 읽습니다.
+    """
+
+    def __init__(self, korea_special_day_cache: KoreaSpecialDayCache):
+        self._korea_special_day_cache = korea_special_day_cache
+
+    def get_list_by_year_and_month(self, year: int, month: int) -> list[KoreaSpecialDay]:
         """년도와 월로 공휴일 리스트를 조회합니다.
 
         Args:
@@ -17,6 +24,22 @@ class KoreaSpecialDaySelector(AbstractKoreaSpecialDaySelector):
             month (int): 월
 
         Returns:
-            QuerySet[DayOff]: 공휴일 리스트 쿼리셋이며 존재하지 않으면 빈 쿼리셋을 반환
+            list[KoreaSpecialDay]: 날짜 오름차순 공휴일 리스트이며 존재하지 않으면 빈 리스트를 반환
         """
-        return KoreaSpecialDay.objects.filter(special_day_at__year=year, special_day_at__month=month)
+        index = self._korea_special_day_cache.get_or_set(default=self._get_all)
+        return list(index.special_days_by_month.get((year, month), ()))
+
+    def is_holiday(self, date: dt.date) -> bool:
+        """날짜가 공휴일인지 확인합니다.
+
+        Args:
+            date (date): 날짜
+
+        Returns:
+            bool: 공휴일이면 True, 아니면 False
+        """
+        index = self._korea_special_day_cache.get_or_set(default=self._get_all)
+        return date in index.holidays
+
+    def _get_all(self) -> list[KoreaSpecialDay]:
+        return list(KoreaSpecialDay.objects.all())
@@ -1,10 +1,9 @@
 from typing import Optional
 
-from django.db import connection
-from django.db.models import DateField, Q
-from django.db.models.functions import Cast
+from django.db.models import Q
 from django.db.models.query import QuerySet
 
+from mung_manager.common.utils import day_window
 from mung_manager.reservations.enums import ReservationStatus
 from mung_manager.reservations.models import Reservation
 from mung_manager.reservations.selectors.abstracts import AbstractReservationSelector
@@ -26,6 +25,8 @@ class ReservationSelector(AbstractReservationSelector):
         Returns:
             dict: 예약 리스트를 'time', 'all_day', 'hotel' 키로 구분하여 반환하며, 존재하지 않으면 빈 리스트 반환
         """
+        day_start_at, day_end_at = day_window(reserved_at)
+
         time_reservations = []
         all_day_reservations = []
         hotel_reservations = []
@@ -43,12 +44,12 @@ class ReservationSelector(AbstractReservationSelector):
             .filter(
                 (
                     Q(customer_ticket__ticket__ticket_type=TicketType.HOTEL.value)
-                    & Q(reserved_at__date__lte=reserved_at, end_at__date__gte=reserved_at)
+                    & Q(reserved_at__lt=day_end_at, end_at__gte=day_start_at)
                     & Q(depth=0)
                 )
                 | (
                     Q(customer_ticket__ticket__ticket_type__in=[TicketType.TIME.value, TicketType.ALL_DAY.value])
-                    & Q(reserved_at__date=reserved_at)
+                    & Q(reserved_at__gte=day_start_at, reserved_at__lt=day_end_at)
                 )
             )
             .filter(
@@ -79,102 +80,39 @@ class ReservationSelector(AbstractReservationSelector):
             Optional[Reservation]: 예약이 존재하면 예약 객체를 반환하고, 존재하지 않으면 None을 반환
         """
         try:
-            return Reservation.objects.filter(
-                Q(id=reservation_id) & ~Q(reservation_status=ReservationStatus.CANCELED.value)
-            ).get()
+            return (
+                Reservation.objects.filter(
+                    Q(id=reservation_id) & ~Q(reservation_status=ReservationStatus.CANCELED.value)
+                )
+                .select_related("customer_ticket", "customer_ticket__ticket")
+                .get()
+            )
 
         except Reservation.DoesNotExist:
             return None
 
-    def exists_by_customer_pet_id_and_reserved_at(self, customer_pet_id: int, reserved_at: str) -> bool:
-        """고객 반려동물 아이디와 예약 날짜로 예약이 존재하는지 확인합니다.
-
-        Args:
-            customer_pet_id (int): 고객 반려동물 아이디
-            reserved_at (str): 예약 날짜
-
-        Returns:
-            bool: 예약이 존재하면 True를 반환하며, 존재하지 않으면 False를 반환
-        """
-        return Reservation.objects.filter(customer_pet_id=customer_pet_id, reserved_at__date=reserved_at).exists()
-
-    def get_queryset_with_customer_ticket_and_ticket_by_ids(self, reservation_ids: list[int]) -> QuerySet[Reservation]:
-        """예약 아이디 리스트로 고객 티켓과 티켓을 포함한 예약 쿼리셋을 조회합니다.
-
-        Args:
-            reservation_ids (list[int]): 예약 아이디 리스트
-
-        Returns:
-            QuerySet[Reservation]: 예약 쿼리셋을 반환이며 존재하지 않으면 빈 쿼리셋을 반환
-        """
-        return Reservation.objects.filter(id__in=reservation_ids).select_related(
-            "customer_ticket", "customer_ticket__ticket"
-        )
-
-    def get_queryset_by_ids(self, reservation_ids: list[int]) -> QuerySet[Reservation]:
-        """예약 아이디 리스트로 예약 쿼리셋을 조회합니다.
+    def get_queryset_by_root_id(self, root_id: int) -> QuerySet[Reservation]:
+        """루트 예약 아이디로 연박 예약 전체 쿼리셋을 조회합니다.
 
         Args:
-            reservation_ids (list[int]): 예약 아이디 리스트
+            root_id (int): 루트 예약 아이디
 
         Returns:
-            QuerySet[Reservation]: 예약 쿼리셋을 반환하며 존재하지 않으면 빈 쿼리셋을 반환
+            QuerySet[Reservation]: 루트 예약을 포함한 연박 예약 쿼리셋이며 존재하지 않으면 빈 쿼리셋을 반환
         """
-        return Reservation.objects.filter(id__in=reservation_ids)
+        return Reservation.objects.filter(root_id=root_id)
 
-    def get_child_ids_by_parent_id(self, parent_id: int) -> list[tuple[int, None]]:
-        """부모 예약 아이디로 모든 자식 예약 아이디를 조회합니다.
+    def get_queryset_with_customer_ticket_and_ticket_by_root_id(self, root_id: int) -> QuerySet[Reservation]:
+        """루트 예약 아이디로 고객 티켓과 티켓을 포함한 연박 예약 쿼리셋을 깊이 순으로 조회합니다.
 
         Args:
-            parent_id (int): 부모 예약 아이디
+            root_id (int): 루트 예약 아이디
 
         Returns:
-            list[tuple[int, int]]: 부모 예약 아이디와 모든 자식 예약 아이디를 튜플로 반환
+            QuerySet[Reservation]: 루트 예약을 포함한 연박 예약 쿼리셋이며 존재하지 않으면 빈 쿼리셋을 반환
         """
-        with connection.cursor() as cursor:
-            query = """
-            WITH RECURSIVE CTE AS (
-                -- Anchor member: This selects the initial parent_id
-                SELECT reservation_id,parent_id
-                FROM reservation
-                WHERE parent_id = %s
-
-                UNION ALL
-
-                -- Recursive member: This joins the table to itself
-                SELECT r.reservation_id, r.parent_id
-                FROM reservation r
-                INNER JOIN CTE c ON r.parent_id = c.reservation_id
-            )
-            SELECT reservation_id
-            FROM CTE;
-            """
-            cursor.execute(query, [parent_id])
-            result = cursor.fetchall()
-        return result
-
-    def get_queryset_for_customer_pet_duplicated_reserved_at(
-        self, customer_pet_id: int, reserved_at: str, end_at: str
-    ) -> list[Optional[str]]:
-        """고객 반려동물 아이디와 예약 시작일과 종료일로 취소된 예약을 제외한 중복된 예약 날짜 리스트를 조회합니다.
-
-        Args:
-            customer_pet_id (int): 고객 반려동물 아이디
-            reserved_at (str): 예약 시작일
-            end_at (str): 예약 종료일
-
-        Returns:
-            list[str]: 중복된 예약 날짜 리스트
-        """
-        duplicated_dates = (
-            Reservation.objects.filter(
-                customer_pet_id=customer_pet_id,
-                reserved_at__lte=end_at,
-                end_at__gte=reserved_at,
-            )
-            .exclude(reservation_status=ReservationStatus.CANCELED.value)
-            .annotate(reserved_at_str=Cast("reserved_at", DateField()))
-            .values_list("reserved_at_str", flat=True)
+        return (
+            Reservation.objects.filter(root_id=root_id)
+            .select_related("customer_ticket", "customer_ticket__ticket")
+            .order_by("depth")
         )
-
-        return [date.strftime("%Y-%m-%d") for date in duplicated_dates]
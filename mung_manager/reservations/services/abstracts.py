@@ -1,22 +1,38 @@
+import datetime as dt
 from abc import ABC, abstractmethod
 
 from mung_manager.errors.exceptions import NotImplementedException
+from mung_manager.pet_kindergardens.tenants import PetKindergardenTenant
 from mung_manager.reservations.models import DayOff, Reservation
 
 
 class AbstractDayOffService(ABC):
     @abstractmethod
-    def create_day_off(self, pet_kindergarden_id: int, day_off_at: str, user) -> DayOff:
+    def create_day_off(self, tenant: PetKindergardenTenant, day_off_at: str) -> DayOff:
         raise NotImplementedException()
 
     @abstractmethod
-    def delete_day_off(self, pet_kindergarden_id: int, day_off_id: int, user) -> None:
+    def delete_day_off(self, tenant: PetKindergardenTenant, day_off_id: int) -> None:
+        raise NotImplementedException()
+
+
+class AbstractDailyReservationService(ABC):
+    @abstractmethod
+    def update_pet_count(
+        self,
+        pet_kindergarden_id: int,
+        reserved_at,
+        end_at,
+        ticket_type: str,
+        pet_count: int,
+        daily_pet_limit: int = -1,
+    ) -> list[dt.date]:
         raise NotImplementedException()
 
 
 class AbstractReservationService(ABC):
     @abstractmethod
-    def toggle_reservation_is_attended(self, pet_kindergarden_id: int, reservation_id: int, user) -> Reservation:
+    def toggle_reservation_is_attended(self, tenant: PetKindergardenTenant, reservation_id: int) -> Reservation:
         raise NotImplementedException()
 
     # @abstractmethod
@@ -0,0 +1,134 @@
+import datetime as dt
+
+from django.db import connection, transaction
+
+from mung_manager.reservations.services.abstracts import (
+    AbstractDailyReservationService,
+)
+from mung_manager.tickets.enums import TicketType
+
+
+class DailyReservationService(AbstractDailyReservationService):
+    """이 클래스는 일간 예약을 DB에 PUSH하는 비즈니스 로직을 담당합니다."""
+
+    # 티켓 종류별로 증감할 일간 예약의 반려동물 수 필드
+    PET_COUNT_FIELDS = {
+        TicketType.TIME.value: "time_pet_count",
+        TicketType.ALL_DAY.value: "all_day_pet_count",
+        TicketType.HOTEL.value: "hotel_pet_count",
+    }
+
+    @transaction.atomic
+    def update_pet_count(
+        self,
+        pet_kindergarden_id: int,
+        reserved_at,
+        end_at,
+        ticket_type: str,
+        pet_count: int,
+        daily_pet_limit: int = -1,
+    ) -> list[dt.date]:
+        """이 함수는 예약 기간의 일간 예약 반려동물 수를 증감하며, 증가시킬 때 일간 예약이 없는 날짜는 생성합니다.
+
+        예약 등록(pet_count > 0)은 (pet_kindergarden_id, reserved_at) 유니크 제약조건에 대한
+        INSERT ... ON CONFLICT DO UPDATE 한 번으로 기간 전체를 처리하므로 동시 예약에서도 중복 행이 생기지 않습니다.
+        예약 취소(pet_count < 0)는 이미 있는 일간 예약만 감소시키며, 반려동물 수는 0 미만으로 내려가지 않습니다.
+
+        하루 정원이 주어지면 정원이 남은 날짜만 증가시키며(조건부 UPDATE), 증가시키지 못한 날짜를
+        정원이 초과된 날짜로 반환합니다. 행 잠금은 날짜 오름차순으로 획득하므로 연박 예약끼리
+        교착 상태가 발생하지 않으며, 초과된 날짜가 있으면 호출한 쪽에서 예외를 발생시켜
+        트랜잭션을 롤백해야 합니다.
+
+        Args:
+            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            reserved_at (datetime): 예약 시작 시간
+            end_at (datetime): 예약 종료 시간 (퇴실 날짜까지 포함)
+            ticket_type (str): 티켓 종류
+            pet_count (int): 증감할 반려동물 수
+            daily_pet_limit (int): 하루 정원이며 -1인 경우 정원 제한 없음
+
+        Returns:
+            list[date]: 정원이 초과되어 증가시키지 못한 날짜 리스트
+        """
+        pet_counts = {field: 0 for field in self.PET_COUNT_FIELDS.values()}
+        pet_counts[self.PET_COUNT_FIELDS[ticket_type]] = pet_count
+
+        start_date = reserved_at.date()
+        end_date = end_at.date()
+        if pet_count < 0:
+            self._decrease_pet_count(pet_kindergarden_id, start_date, end_date, pet_count, pet_counts)
+            return []
+
+        # 하루 정원이 0인 경우 어떤 날짜도 예약할 수 없으므로 생성하지 않음
+        query = """
+        INSERT INTO daily_reservation (
+            created_at, updated_at, pet_kindergarden_id, reserved_at,
+            total_pet_count, time_pet_count, all_day_pet_count, hotel_pet_count
+        )
+        SELECT
+            NOW(), NOW(), %(pet_kindergarden_id)s, day::date,
+            %(total_pet_count)s, %(time_pet_count)s, %(all_day_pet_count)s, %(hotel_pet_count)s
+        FROM generate_series(%(start_date)s::date, %(end_date)s::date, INTERVAL '1 day') AS day
+        WHERE %(daily_pet_limit)s <> 0
+        ORDER BY day
+        ON CONFLICT (pet_kindergarden_id, reserved_at) DO UPDATE SET
+            total_pet_count = daily_reservation.total_pet_count + %(total_pet_count)s,
+            time_pet_count = daily_reservation.time_pet_count + %(time_pet_count)s,
+            all_day_pet_count = daily_reservation.all_day_pet_count + %(all_day_pet_count)s,
+            hotel_pet_count = daily_reservation.hotel_pet_count + %(hotel_pet_count)s,
+            updated_at = NOW()
+        WHERE %(daily_pet_limit)s = -1 OR daily_reservation.total_pet_count < %(daily_pet_limit)s
+        RETURNING reserved_at;
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                query,
+                {
+                    "pet_kindergarden_id": pet_kindergarden_id,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "daily_pet_limit": daily_pet_limit,
+                    "total_pet_count": pet_count,
+                    **pet_counts,
+                },
+            )
+            updated_dates = {row[0] for row in cursor.fetchall()}
+
+        date_range = [start_date + dt.timedelta(days=x) for x in range((end_date - start_date).days + 1)]
+        return [date for date in date_range if date not in updated_dates]
+
+    def _decrease_pet_count(
+        self,
+        pet_kindergarden_id: int,
+        start_date: dt.date,
+        end_date: dt.date,
+        pet_count: int,
+        pet_counts: dict[str, int],
+    ) -> None:
+        # 일간 예약이 없는 날짜는 생성하지 않으며, 행 잠금은 예약 등록과 같이 날짜 오름차순으로 획득
+        query = """
+        UPDATE daily_reservation SET
+            total_pet_count = GREATEST(daily_reservation.total_pet_count + %(total_pet_count)s, 0),
+            time_pet_count = GREATEST(daily_reservation.time_pet_count + %(time_pet_count)s, 0),
+            all_day_pet_count = GREATEST(daily_reservation.all_day_pet_count + %(all_day_pet_count)s, 0),
+            hotel_pet_count = GREATEST(daily_reservation.hotel_pet_count + %(hotel_pet_count)s, 0),
+            updated_at = NOW()
+        WHERE daily_reservation.daily_reservation_id IN (
+            SELECT daily_reservation_id FROM daily_reservation
+            WHERE pet_kindergarden_id = %(pet_kindergarden_id)s
+                AND reserved_at BETWEEN %(start_date)s AND %(end_date)s
+            ORDER BY reserved_at
+            FOR UPDATE
+        );
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                query,
+                {
+                    "pet_kindergarden_id": pet_kindergarden_id,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "total_pet_count": pet_count,
+                    **pet_counts,
+                },
+            )
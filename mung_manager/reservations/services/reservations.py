@@ -1,9 +1,8 @@
 import datetime as dt
+from collections import defaultdict
 from datetime import timedelta
 
-from concurrency.exceptions import RecordModifiedError
 from django.db import transaction
-from django.db.models import F
 from django.utils import timezone
 
 from mung_manager.common.constants import SYSTEM_CODE
@@ -11,24 +10,26 @@ from mung_manager.common.selectors import (
     check_object_or_not_found,
     get_object_or_not_found,
 )
-from mung_manager.customers.models import CustomerTicketUsageLog
+from mung_manager.customers.models import CustomerTicket, CustomerTicketUsageLog
 from mung_manager.customers.selectors.customer_ticket_usage_logs import (
     CustomerTicketUsageLogSelector,
 )
 from mung_manager.customers.selectors.customer_tickets import CustomerTicketSelector
-from mung_manager.customers.selectors.customers import CustomerSelector
+from mung_manager.customers.services.customer_tickets import CustomerTicketService
+from mung_manager.customers.services.customers import CustomerService
 from mung_manager.errors.exceptions import ValidationException
 from mung_manager.pet_kindergardens.selectors.pet_kindergardens import (
     PetKindergardenSelector,
 )
+from mung_manager.pet_kindergardens.tenants import PetKindergardenTenant
+from mung_manager.reservations.caches import ReservationCalendarCache
 from mung_manager.reservations.enums import ReservationStatus
-from mung_manager.reservations.models import DailyReservation, Reservation
-from mung_manager.reservations.selectors.daily_reservations import (
-    DailyReservationSelector,
-)
-from mung_manager.reservations.selectors.day_offs import DayOffSelector
+from mung_manager.reservations.models import Reservation
 from mung_manager.reservations.selectors.reservations import ReservationSelector
 from mung_manager.reservations.services.abstracts import AbstractReservationService
+from mung_manager.reservations.services.daily_reservations import (
+    DailyReservationService,
+)
 from mung_manager.tickets.enums import TicketType
 
 
@@ -38,42 +39,34 @@ class ReservationService(AbstractReservationService):
     def __init__(
         self,
         pet_kindergarden_selector: PetKindergardenSelector,
-        customer_selector: CustomerSelector,
         customer_ticket_selector: CustomerTicketSelector,
         customer_ticket_usage_log_selector: CustomerTicketUsageLogSelector,
-        daily_reservation_selector: DailyReservationSelector,
-        day_off_selector: DayOffSelector,
         reservation_selector: ReservationSelector,
+        customer_ticket_service: CustomerTicketService,
+        customer_service: CustomerService,
+        daily_reservation_service: DailyReservationService,
+        reservation_calendar_cache: ReservationCalendarCache,
     ):
         self._pet_kindergarden_selector = pet_kindergarden_selector
-        self._customer_selector = customer_selector
         self._customer_ticket_selector = customer_ticket_selector
         self._customer_ticket_usage_log_selector = customer_ticket_usage_log_selector
-        self._daily_reservation_selector = daily_reservation_selector
-        self._day_off_selector = day_off_selector
         self._reservation_selector = reservation_selector
+        self._customer_ticket_service = customer_ticket_service
+        self._customer_service = customer_service
+        self._daily_reservation_service = daily_reservation_service
+        self._reservation_calendar_cache = reservation_calendar_cache
 
     @transaction.atomic
-    def toggle_reservation_is_attended(self, pet_kindergarden_id: int, reservation_id: int, user) -> Reservation:
+    def toggle_reservation_is_attended(self, tenant: PetKindergardenTenant, reservation_id: int) -> Reservation:
         """이 함수는 예약의 출석 활성화/비활성화를 변경합니다.
 
         Args:
-            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            tenant (PetKindergardenTenant): 반려동물 유치원 테넌트
             reservation_id (int): 예약 아이디
-            user: 유저 객체
 
         Returns:
             bool: 예약 출석 상태
         """
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
-
         reservation = get_object_or_not_found(
             self._reservation_selector.get_by_id_for_uncanceled_reservation(
                 reservation_id=reservation_id,
@@ -88,10 +81,7 @@ class ReservationService(AbstractReservationService):
             and reservation.depth == 0
             and reservation.is_extented is True
         ):
-            root_id = reservation.id
-            child_ids = self._reservation_selector.get_child_ids_by_parent_id(parent_id=root_id)
-            reservation_ids = [root_id] + [child_id[0] for child_id in child_ids]
-            reservations = self._reservation_selector.get_queryset_by_ids(reservation_ids=reservation_ids)
+            reservations = self._reservation_selector.get_queryset_by_root_id(root_id=reservation.id)
             reservations.update(is_attended=not reservation.is_attended)
         else:
             reservation.is_attended = not reservation.is_attended
@@ -103,33 +93,37 @@ class ReservationService(AbstractReservationService):
     @transaction.atomic
     def register_reservation(
         self,
-        pet_kindergarden_id: int,
+        tenant: PetKindergardenTenant,
         customer_ticket_ids: list[int],
         customer_id: int,
         customer_pet_id: int,
         reserved_at,
         end_at,
-        user,
     ) -> Reservation:
         """이 함수는 예약을 생성합니다.
 
+        검증에 필요한 조회는 반려동물 유치원 조회 한 번과 고객 티켓 조회 한 번으로 처리하고,
+        일간 예약 정원은 조건부 upsert로 확보한 뒤 예약, 티켓 사용 내역을 bulk 쿼리로 생성합니다.
+
         Args:
-            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            tenant (PetKindergardenTenant): 반려동물 유치원 테넌트
             customer_ticket_ids (list[int]): 고객 티켓 아이디 리스트
             customer_id (int): 고객 아이디
             customer_pet_id (int): 고객 반려동물 아이디
             reserved_at (str): 예약 시작 시간
             end_at (str): 예약 종료 시간
-            user: 유저 객체
 
         Returns:
-            Reservation: 예약 객체
+            Reservation: 예약 객체 (연박인 경우 마지막 예약 객체)
         """
-        # 반려동물 유치원 검증
+        # 반려동물 유치원 검증 및 고객, 정원, 휴무일, 중복 예약 검증 결과 조회 / 연박 공통
         pet_kindergarden = get_object_or_not_found(
-            self._pet_kindergarden_selector.get_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=user,
+            self._pet_kindergarden_selector.get_by_id_for_reservation(
+                pet_kindergarden_id=tenant.pet_kindergarden_id,
+                customer_id=customer_id,
+                customer_pet_id=customer_pet_id,
+                reserved_at=reserved_at,
+                end_at=end_at,
             ),
             msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
             code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
@@ -137,44 +131,30 @@ class ReservationService(AbstractReservationService):
 
         # 고객 및 고객 반려동물 검증 / 연박 공통
         check_object_or_not_found(
-            self._customer_selector.get_by_id_and_customer_pet_id_for_undeleted_customer_pets(
-                customer_id=customer_id,
-                customer_pet_id=customer_pet_id,
-            ),
+            pet_kindergarden.is_customer_pet_exists,
             msg=SYSTEM_CODE.message("NOT_FOUND_CUSTOMER"),
             code=SYSTEM_CODE.code("NOT_FOUND_CUSTOMER"),
         )
 
         # 반려동물 유치원에 대한 하루 정원 검증 / 연박 공통
-        overregistered_reserved_at = self._daily_reservation_selector.get_queryset_for_overregistered(
-            pet_kindergarden_id=pet_kindergarden_id,
-            reserved_at=[reserved_at, end_at],
-            daily_pet_limit=pet_kindergarden.daily_pet_limit,
-        )
-        if len(overregistered_reserved_at) > 0:
+        if len(pet_kindergarden.overregistered_dates) > 0:
+            overregistered_reserved_at = [date.strftime("%Y-%m-%d") for date in pet_kindergarden.overregistered_dates]
             raise ValidationException(
                 detail=f"The daily pet limit has been exceeded: {overregistered_reserved_at}",
                 code=SYSTEM_CODE.code("OVER_DAILY_PET_LIMIT"),
             )
 
         # 휴무일에 대한 예약 검증 / 연박 공통
-        day_offs = self._day_off_selector.get_queryset_by_pet_kindergarden_id_and_day_off_at_for_day_offs(
-            day_off_at=[reserved_at, end_at],
-            pet_kindergarden_id=pet_kindergarden_id,
-        )
-        if len(day_offs) > 0:
+        if len(pet_kindergarden.day_off_dates) > 0:
+            day_offs = [date.strftime("%Y-%m-%d") for date in pet_kindergarden.day_off_dates]
             raise ValidationException(
                 detail=f"The pet kindergarden is closed on this day: {day_offs}",
                 code=SYSTEM_CODE.code("PET_KINDERGARDEN_CLOSED"),
             )
 
         # 반려동물 동일 시간 예약 검증 / 연박 공통
-        duplication_reserved_at = self._reservation_selector.get_queryset_for_customer_pet_duplicated_reserved_at(
-            customer_pet_id=customer_pet_id,
-            reserved_at=reserved_at,
-            end_at=end_at,
-        )
-        if len(duplication_reserved_at) > 0:
+        if len(pet_kindergarden.duplicated_dates) > 0:
+            duplication_reserved_at = [date.strftime("%Y-%m-%d") for date in pet_kindergarden.duplicated_dates]
             raise ValidationException(
                 detail=f"Reservation already exists for customer pet.: {duplication_reserved_at}",
                 code=SYSTEM_CODE.code("ALREADY_EXISTS_RESERVATION_CUSTOMER_PET"),
@@ -258,113 +238,17 @@ class ReservationService(AbstractReservationService):
                     code=SYSTEM_CODE.code("NO_CUSTOMER_TICKET_COUNT"),
                 )
 
-            # 티켓 횟수 증감 처리(낙관적 잠금 처리)
-            # 재시도 로직 필요 x -> 유저 혼란 방지
-            if (
-                customer_ticket.ticket.ticket_type == TicketType.TIME.value
-                or customer_ticket.ticket.ticket_type == TicketType.ALL_DAY.value
-            ):
-                ticket_count = 1
             # 호텔권인 경우 이용권은 1일에 1회로 지정
+            if customer_ticket.ticket.ticket_type == TicketType.HOTEL.value:
+                ticket_count = (end_at - reserved_at).days
             else:
-                ticket_count = timedelta(days=(end_at - reserved_at).days).days
-
-            try:
-                customer_ticket.used_count += ticket_count
-                customer_ticket.unused_count -= ticket_count
-                customer_ticket.save(update_fields=["used_count", "unused_count", "version"])
-
-            except RecordModifiedError:
-                raise ValidationException(
-                    detail=SYSTEM_CODE.message("CONFILCT_CUSTOMER_TICKET"),
-                    code=SYSTEM_CODE.code("CONFILCT_CUSTOMER_TICKET"),
-                )
-
-            # 예약 생성
-            reservation = Reservation.objects.create(
-                reserved_at=reserved_at,
-                end_at=end_at,
-                is_attended=False,
-                reservation_status=ReservationStatus.COMPLETED.value,
-                pet_kindergarden_id=pet_kindergarden_id,
-                customer_id=customer_id,
-                customer_pet_id=customer_pet_id,
-                customer_ticket_id=customer_ticket.id,
-            )
-
-            if customer_ticket.ticket.ticket_type != TicketType.HOTEL.value:
-                # 일간 예약 생성 및 증가 처리
-                daily_reservations = (
-                    self._daily_reservation_selector.get_queryset_by_pet_kindergarden_id_and_reserved_at(
-                        pet_kindergarden_id=pet_kindergarden_id,
-                        reserved_at=reserved_at,
-                    )
-                )
-
-                if daily_reservations.exists() is False:
-                    if customer_ticket.ticket.ticket_type == TicketType.TIME.value:
-                        DailyReservation.objects.create(
-                            pet_kindergarden_id=pet_kindergarden_id,
-                            reserved_at=reserved_at,
-                            total_pet_count=1,
-                            time_pet_count=1,
-                        )
-                    elif customer_ticket.ticket.ticket_type == TicketType.ALL_DAY.value:
-                        DailyReservation.objects.create(
-                            pet_kindergarden_id=pet_kindergarden_id,
-                            reserved_at=reserved_at,
-                            total_pet_count=1,
-                            all_day_pet_count=1,
-                        )
-                else:
-                    if customer_ticket.ticket.ticket_type == TicketType.TIME.value:
-                        daily_reservations.update(
-                            time_pet_count=F("time_pet_count") + 1, total_pet_count=F("total_pet_count") + 1
-                        )
-                    elif customer_ticket.ticket.ticket_type == TicketType.ALL_DAY.value:
-                        daily_reservations.update(
-                            all_day_pet_count=F("all_day_pet_count") + 1, total_pet_count=F("total_pet_count") + 1
-                        )
-
-            else:
-                # 일간 예약 생성 및 증가 처리 (호텔권)
-                # date_range + 1의 이유: 이용권 감소는 몇박으로 횟수를 확인하지만
-                # 날짜 표시로는 몇일로 표시되기 때문에 +1을 해줌
-                date_range = [(reserved_at + timedelta(days=x)).date() for x in range((end_at - reserved_at).days + 1)]
-                existing_daily_reservations = (
-                    self._daily_reservation_selector.get_by_pet_kindergarden_id_and_reserved_at_and_end_at(
-                        pet_kindergarden_id=pet_kindergarden_id,
-                        reserved_at=reserved_at,
-                        end_at=end_at,
-                    )
-                )
-
-                existing_dates = [daily_reservation.reserved_at for daily_reservation in existing_daily_reservations]
-                missing_dates = [date for date in date_range if date not in existing_dates]
-                existing_daily_reservations.update(
-                    hotel_pet_count=F("hotel_pet_count") + 1, total_pet_count=F("total_pet_count") + 1
-                )
-
-                DailyReservation.objects.bulk_create(
-                    [
-                        DailyReservation(
-                            pet_kindergarden_id=pet_kindergarden_id,
-                            reserved_at=date,
-                            total_pet_count=1,
-                            hotel_pet_count=1,
-                        )
-                        for date in missing_dates
-                    ]
-                )
+                ticket_count = 1
 
-            # 티켓 사용 내역 생성
-            CustomerTicketUsageLog.objects.create(
-                customer_ticket_id=customer_ticket.id,
-                reservation_id=reservation.id,
-                used_count=ticket_count,
-            )
+            ticket_type = customer_ticket.ticket.ticket_type
+            is_extented = False
+            customer_ticket_counts = [(customer_ticket, ticket_count)]
 
-            # 연박 예약에 대한 검증 / 호텔권만 가능
+        # 연박 예약에 대한 검증 / 호텔권만 가능
         else:
             # 호텔권인 경우 1일 이내 예약 검증
             if (end_at - reserved_at) < timedelta(days=1):
@@ -373,10 +257,11 @@ class ReservationService(AbstractReservationService):
                     code=SYSTEM_CODE.code("INVALID_RESERVATION_TIME_TICKET_TYPE_HOTEL"),
                 )
 
-            # 티켓 존재 여부 검증
-            customer_tickets = self._customer_ticket_selector.get_queryset_for_hotel(
-                customer_ticket_ids=customer_ticket_ids,
-                customer_id=customer_id,
+            customer_tickets = list(
+                self._customer_ticket_selector.get_queryset_for_hotel(
+                    customer_ticket_ids=customer_ticket_ids,
+                    customer_id=customer_id,
+                )
             )
 
             # 티켓 존재 여부 검증
@@ -404,116 +289,105 @@ class ReservationService(AbstractReservationService):
                     code=SYSTEM_CODE.code("NO_CUSTOMER_TICKET_COUNT"),
                 )
 
-            depth = 0
-            parent_id = None
-            total_ticket_count = timedelta(days=(end_at - reserved_at).days).days
-            current_ticket_count = 0
-
-            # 티켓 사용 횟수 검증
+            # 만료일이 빠른 티켓부터 박수만큼 차감 횟수를 배분
+            # 배분이 끝난 뒤 남은 티켓은 사용하지 않으므로 예약을 생성하지 않음
+            ticket_type = TicketType.HOTEL.value
+            is_extented = True
+            customer_ticket_counts = []
+            total_ticket_count = (end_at - reserved_at).days
             for customer_ticket in customer_tickets:
-                current_ticket_count = customer_ticket.unused_count
-                if total_ticket_count > current_ticket_count:
-                    try:
-                        customer_ticket.used_count += current_ticket_count
-                        customer_ticket.unused_count -= current_ticket_count
-                        customer_ticket.save(update_fields=["used_count", "unused_count", "version"])
-                    except RecordModifiedError:
-                        raise ValidationException(
-                            detail=SYSTEM_CODE.message("CONFILCT_CUSTOMER_TICKET"),
-                            code=SYSTEM_CODE.code("CONFILCT_CUSTOMER_TICKET"),
-                        )
-
-                else:
-                    try:
-                        current_ticket_count = total_ticket_count
-                        customer_ticket.used_count += current_ticket_count
-                        customer_ticket.unused_count -= current_ticket_count
-                        customer_ticket.save(update_fields=["used_count", "unused_count", "version"])
-                    except RecordModifiedError:
-                        raise ValidationException(
-                            detail=SYSTEM_CODE.message("CONFILCT_CUSTOMER_TICKET"),
-                            code=SYSTEM_CODE.code("CONFILCT_CUSTOMER_TICKET"),
-                        )
-
-                # 예약 생성
-                reservation = Reservation.objects.create(
+                if total_ticket_count <= 0:
+                    break
+                ticket_count = min(customer_ticket.unused_count, total_ticket_count)
+                customer_ticket_counts.append((customer_ticket, ticket_count))
+                total_ticket_count -= ticket_count
+
+        # 일간 예약 정원 확보 및 증가 처리
+        # 위의 정원 검증은 조회 시점 기준이므로 동시 예약에 대비해 정원이 남은 날짜만 원자적으로 증가시키고
+        # 증가시키지 못한 날짜가 있으면 예외를 발생시켜 트랜잭션 전체를 롤백
+        overregistered_dates = self._daily_reservation_service.update_pet_count(
+            pet_kindergarden_id=tenant.pet_kindergarden_id,
+            reserved_at=reserved_at,
+            end_at=end_at,
+            ticket_type=ticket_type,
+            pet_count=1,
+            daily_pet_limit=pet_kindergarden.daily_pet_limit,
+        )
+        if len(overregistered_dates) > 0:
+            overregistered_reserved_at = [date.strftime("%Y-%m-%d") for date in overregistered_dates]
+            raise ValidationException(
+                detail=f"The daily pet limit has been exceeded: {overregistered_reserved_at}",
+                code=SYSTEM_CODE.code("OVER_DAILY_PET_LIMIT"),
+            )
+
+        # 티켓 횟수 증감 처리(낙관적 잠금 처리)
+        # 재시도 로직 필요 x -> 유저 혼란 방지
+        self._customer_ticket_service.update_customer_ticket_counts(
+            customer_ticket_counts=customer_ticket_counts,
+        )
+
+        # 예약 생성 (연박인 경우 티켓 순서대로 depth를 부여)
+        reservations = Reservation.objects.bulk_create(
+            [
+                Reservation(
                     reserved_at=reserved_at,
                     end_at=end_at,
                     is_attended=False,
-                    parent_id=parent_id,
                     depth=depth,
-                    is_extented=True,
+                    is_extented=is_extented,
                     reservation_status=ReservationStatus.COMPLETED.value,
-                    pet_kindergarden_id=pet_kindergarden_id,
+                    pet_kindergarden_id=tenant.pet_kindergarden_id,
                     customer_id=customer_id,
                     customer_pet_id=customer_pet_id,
                     customer_ticket_id=customer_ticket.id,
                 )
+                for depth, (customer_ticket, _) in enumerate(customer_ticket_counts)
+            ]
+        )
 
-                # 티켓 사용 내역 생성
-                CustomerTicketUsageLog.objects.create(
+        # 연박 예약의 부모 예약 및 루트 예약 연결은 아이디가 생성된 뒤 한 번에 갱신
+        if is_extented is True:
+            for parent, child in zip(reservations, reservations[1:]):
+                child.parent_id = parent.id
+            for reservation in reservations:
+                reservation.root_id = reservations[0].id
+            Reservation.objects.bulk_update(reservations, fields=["parent", "root"])
+
+        # 티켓 사용 내역 생성
+        CustomerTicketUsageLog.objects.bulk_create(
+            [
+                CustomerTicketUsageLog(
                     customer_ticket_id=customer_ticket.id,
                     reservation_id=reservation.id,
-                    used_count=current_ticket_count,
-                )
-                depth += 1
-                parent_id = reservation.id
-                total_ticket_count -= current_ticket_count
-
-            # 일간 예약 생성 및 증가 처리
-            # date_range + 1의 이유: 이용권 감소는 몇박으로 횟수를 확인하지만
-            # 날짜 표시로는 몇일로 표시되기 때문에 +1을 해줌
-            date_range = [(reserved_at + timedelta(days=x)).date() for x in range((end_at - reserved_at).days + 1)]
-            existing_daily_reservations = (
-                self._daily_reservation_selector.get_by_pet_kindergarden_id_and_reserved_at_and_end_at(
-                    pet_kindergarden_id=pet_kindergarden_id,
-                    reserved_at=reserved_at,
-                    end_at=end_at,
+                    used_count=ticket_count,
                 )
-            )
+                for reservation, (customer_ticket, ticket_count) in zip(reservations, customer_ticket_counts)
+            ]
+        )
 
-            existing_dates = [daily_reservation.reserved_at for daily_reservation in existing_daily_reservations]
-            missing_dates = [date for date in date_range if date not in existing_dates]
-            existing_daily_reservations.update(
-                hotel_pet_count=F("hotel_pet_count") + 1, total_pet_count=F("total_pet_count") + 1
-            )
+        # 고객의 최근 예약 일시와 예약 횟수 갱신
+        self._customer_service.increase_reservation_summary(customer_id=customer_id, reserved_at=reserved_at)
 
-            DailyReservation.objects.bulk_create(
-                [
-                    DailyReservation(
-                        pet_kindergarden_id=pet_kindergarden_id,
-                        reserved_at=date,
-                        total_pet_count=1,
-                        hotel_pet_count=1,
-                    )
-                    for date in missing_dates
-                ]
-            )
+        # 예약 기간이 포함된 월의 예약 캘린더 캐시 무효화
+        self._reservation_calendar_cache.delete_by_date_range(
+            pet_kindergarden_id=tenant.pet_kindergarden_id,
+            start_date=reserved_at.date(),
+            end_date=end_at.date(),
+        )
 
-        return reservation
+        return reservations[-1]
 
     @transaction.atomic
-    def cancel_reservation(self, pet_kindergarden_id: int, reservation_id: int, user):
+    def cancel_reservation(self, tenant: PetKindergardenTenant, reservation_id: int):
         """이 함수는 예약을 취소합니다.
 
         Args:
-            pet_kindergarden_id (int): 반려동물 유치원 아이디
+            tenant (PetKindergardenTenant): 반려동물 유치원 테넌트
             reservation_id (int): 예약 아이디
-            user: 유저 객체
 
         Returns:
             Reservation: 예약 객체
         """
-        # 유저 반려동물 유치원 검증
-        check_object_or_not_found(
-            self._pet_kindergarden_selector.exists_by_id_and_user(
-                pet_kindergarden_id=pet_kindergarden_id,
-                user=user,
-            ),
-            msg=SYSTEM_CODE.message("NOT_FOUND_PET_KINDERGARDEN"),
-            code=SYSTEM_CODE.code("NOT_FOUND_PET_KINDERGARDEN"),
-        )
-
         # 예약이 존재하는지 검증
         reservation = get_object_or_not_found(
             self._reservation_selector.get_by_id_for_uncanceled_reservation(
@@ -529,107 +403,65 @@ class ReservationService(AbstractReservationService):
             and reservation.depth == 0
             and reservation.is_extented is True
         ):
-            root_id = reservation.id
-            child_ids = self._reservation_selector.get_child_ids_by_parent_id(parent_id=root_id)
-            reservation_ids = [root_id] + [child_id[0] for child_id in child_ids]
-            reservations = self._reservation_selector.get_queryset_with_customer_ticket_and_ticket_by_ids(
-                reservation_ids=reservation_ids
-            )
-            reservations.update(reservation_status=ReservationStatus.CANCELED.value)
-
-            # 티켓 사용 횟수 증가(낙관적 잠금 처리)
-            # 단. 티켓의 만료기간이 오늘 기준 과거일 경우 이용권 증가를 하지 않음
-            for reservation in reservations:
-                # 각각의 예약에 대한 만료일이 다르기에 예약별로 처리
-                if reservation.customer_ticket.expired_at.date() >= timezone.now().date():
-                    try:
-                        customer_ticket = reservation.customer_ticket
-                        customer_ticket.used_count -= 1
-                        customer_ticket.unused_count += 1
-                        customer_ticket.save(update_fields=["used_count", "unused_count", "version"])
-                    except RecordModifiedError:
-                        raise ValidationException(
-                            detail=SYSTEM_CODE.message("CONFILCT_CUSTOMER_TICKET"),
-                            code=SYSTEM_CODE.code("CONFILCT_CUSTOMER_TICKET"),
-                        )
-
-            # 티켓 사용 내역 사용 횟수 처리
-            reservation_ids = [reservation.id for reservation in reservations]
-            customer_ticket_usage_logs = self._customer_ticket_usage_log_selector.get_queryset_by_reservation_ids(
-                reservation_ids=reservation_ids,
+            chain_reservations = self._reservation_selector.get_queryset_with_customer_ticket_and_ticket_by_root_id(
+                root_id=reservation.id
             )
-            customer_ticket_usage_logs.update(used_count=0)
-
-            # 예약 첫번째 예약 날짜와 예약 마지막 퇴실 날짜
-            # 일간 예약에서 해당 예약 감소 처리
-            reservations_list: list[Reservation] = [reservation for reservation in reservations]
-            reserved_at = reservations_list[0].reserved_at
-            end_at = reservations_list[-1].end_at
-            # @TODO: Fixed Type
-            daily_reservations = self._daily_reservation_selector.get_by_pet_kindergarden_id_and_reserved_at_and_end_at(
-                pet_kindergarden_id=pet_kindergarden_id,
-                reserved_at=reserved_at,  # type: ignore
-                end_at=end_at,  # type: ignore
-            )
-
-            if reservation.customer_ticket.ticket.ticket_type == TicketType.HOTEL.value:
-                daily_reservations.update(
-                    total_pet_count=F("total_pet_count") - 1, hotel_pet_count=F("hotel_pet_count") - 1
-                )
-
-            if reservation.customer_ticket.ticket.ticket_type == TicketType.TIME.value:
-                daily_reservations.update(
-                    total_pet_count=F("total_pet_count") - 1, time_pet_count=F("time_pet_count") - 1
-                )
-
-            if reservation.customer_ticket.ticket.ticket_type == TicketType.ALL_DAY.value:
-                daily_reservations.update(
-                    total_pet_count=F("total_pet_count") - 1, all_day_pet_count=F("all_day_pet_count") - 1
-                )
-
+            reservations: list[Reservation] = list(chain_reservations)
+            chain_reservations.update(reservation_status=ReservationStatus.CANCELED.value)
         else:
+            reservations = [reservation]
             reservation.reservation_status = ReservationStatus.CANCELED.value
             reservation.save(update_fields=["reservation_status"])
 
-            # 티켓 사용 횟수 증가(낙관적 잠금 처리)
-            # 단. 티켓의 만료기간이 오늘 기준 과거일 경우 이용권 증가를 하지 않음
-            if reservation.customer_ticket.expired_at.date() >= timezone.now().date():
-                try:
-                    customer_ticket = reservation.customer_ticket
-                    customer_ticket.used_count -= 1
-                    customer_ticket.unused_count += 1
-                    customer_ticket.save(update_fields=["used_count", "unused_count", "version"])
-                except RecordModifiedError:
-                    raise ValidationException(
-                        detail=SYSTEM_CODE.message("CONFILCT_CUSTOMER_TICKET"),
-                        code=SYSTEM_CODE.code("CONFILCT_CUSTOMER_TICKET"),
-                    )
+        # 티켓 사용 횟수 환불(낙관적 잠금 처리)
+        # 예약별로 사용한 횟수만큼 환불하며 티켓별로 합산하여 한 번에 처리
+        # 단. 티켓의 만료기간이 오늘 기준 과거일 경우 이용권 증가를 하지 않음
+        reservation_ids = [reservation.id for reservation in reservations]
+        customer_ticket_usage_logs = self._customer_ticket_usage_log_selector.get_queryset_by_reservation_ids(
+            reservation_ids=reservation_ids,
+        )
+        used_counts = {
+            customer_ticket_usage_log.reservation_id: customer_ticket_usage_log.used_count
+            for customer_ticket_usage_log in customer_ticket_usage_logs
+        }
+        customer_tickets: dict[int, CustomerTicket] = {}
+        refund_counts: dict[int, int] = defaultdict(int)
+        for reservation in reservations:
+            # 각각의 예약에 대한 만료일이 다르기에 예약별로 처리
+            customer_ticket = reservation.customer_ticket
+            if customer_ticket.expired_at.date() >= timezone.now().date():
+                customer_tickets[customer_ticket.id] = customer_ticket
+                refund_counts[customer_ticket.id] += used_counts.get(reservation.id, 0)
+
+        # 환불은 예약 등록과 달리 결과가 같으므로 버전 충돌 시 재시도
+        self._customer_ticket_service.update_customer_ticket_counts(
+            customer_ticket_counts=[
+                (customer_tickets[customer_ticket_id], -refund_count)
+                for customer_ticket_id, refund_count in refund_counts.items()
+                if refund_count > 0
+            ],
+            max_retry_count=3,
+        )
 
-            # 티켓 사용 내역 사용 횟수 처리
-            customer_ticket_usage_log = self._customer_ticket_usage_log_selector.get_by_reservation_id(
-                reservation_id=reservation_id,
-            )
-            # @TODO: Fixed Type
-            customer_ticket_usage_log.used_count = 0  # type: ignore
-            customer_ticket_usage_log.save(update_fields=["used_count"])  # type: ignore
-
-            # 일간 예약에서 해당 예약 감소
-            daily_reservations = self._daily_reservation_selector.get_by_pet_kindergarden_id_and_reserved_at_and_end_at(
-                pet_kindergarden_id=pet_kindergarden_id,
-                reserved_at=reservation.reserved_at,
-                end_at=reservation.end_at,
-            )
-            if reservation.customer_ticket.ticket.ticket_type == TicketType.HOTEL.value:
-                daily_reservations.update(
-                    total_pet_count=F("total_pet_count") - 1, hotel_pet_count=F("hotel_pet_count") - 1
-                )
+        # 티켓 사용 내역 사용 횟수 처리
+        customer_ticket_usage_logs.update(used_count=0)
+
+        # 예약 첫번째 예약 날짜와 예약 마지막 퇴실 날짜
+        # 일간 예약에서 해당 예약 감소 처리
+        self._daily_reservation_service.update_pet_count(
+            pet_kindergarden_id=tenant.pet_kindergarden_id,
+            reserved_at=reservations[0].reserved_at,
+            end_at=reservations[-1].end_at,
+            ticket_type=reservations[0].customer_ticket.ticket.ticket_type,
+            pet_count=-1,
+        )
 
-            if reservation.customer_ticket.ticket.ticket_type == TicketType.TIME.value:
-                daily_reservations.update(
-                    total_pet_count=F("total_pet_count") - 1, time_pet_count=F("time_pet_count") - 1
-                )
+        # 취소된 예약을 제외하고 고객의 최근 예약 일시와 예약 횟수 재계산
+        self._customer_service.refresh_reservation_summaries(customer_ids=[reservations[0].customer_id])
 
-            if reservation.customer_ticket.ticket.ticket_type == TicketType.ALL_DAY.value:
-                daily_reservations.update(
-                    total_pet_count=F("total_pet_count") - 1, all_day_pet_count=F("all_day_pet_count") - 1
-                )
+        # 예약 기간이 포함된 월의 예약 캘린더 캐시 무효화
+        self._reservation_calendar_cache.delete_by_date_range(
+            pet_kindergarden_id=tenant.pet_kindergarden_id,
+            start_date=reservations[0].reserved_at.date(),
+            end_date=reservations[-1].end_at.date(),
+        )
@@ -196,3 +196,21 @@ ErrorPhoneNumberInvalidSchema = OpenApiExample(
     status_codes=["400"],
     response_only=True,
 )
+
+ErrorTaskEnqueueFailedSchema = OpenApiExample(
+    name="503(service_unavailable)",
+    summary="[Task Enqueue Failed]",
+    description="""
+    백그라운드 작업을 실행하지 못했을 때 반환되는 응답입니다.
+    잠시 후 다시 요청해주세요.
+    """,
+    value={
+        "success": False,
+        "statusCode": 503,
+        "code": "service_unavailable",
+        "message": "Failed to start the background task, please try again later.",
+        "data": {},
+    },
+    status_codes=["503"],
+    response_only=True,
+)
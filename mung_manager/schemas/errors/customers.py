@@ -17,6 +17,23 @@ ErrorCustomerNotFoundSchema = OpenApiExample(
     response_only=True,
 )
 
+ErrorCustomerImportJobNotFoundSchema = OpenApiExample(
+    name="404(customer_import_job_not_found)",
+    summary="[Not Found]: Customer Import Job Not Found",
+    description="""
+    해당 고객 일괄 등록 작업을 찾을 수 없을 때 반환되는 응답입니다.
+    """,
+    value={
+        "success": False,
+        "statusCode": 404,
+        "code": "not_found_customer_import_job",
+        "message": "Customer import job does not exist.",
+        "data": {},
+    },
+    status_codes=["404"],
+    response_only=True,
+)
+
 ErrorCustomerAlreadyExistsSchema = OpenApiExample(
     name="400(customer_already_exists)",
     summary="[Already Exists]: Customer Already Exists",
@@ -0,0 +1,4 @@
+# Django가 시작될 때 Celery 앱을 로드하여 shared_task가 이 앱의 설정(브로커, 결과 백엔드)을 사용하도록 함
+from mung_manager.tasks.celery import app as celery_app
+
+__all__ = ("celery_app",)
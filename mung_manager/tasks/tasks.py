@@ -1,6 +1,67 @@
 from celery import shared_task
 
+from mung_manager.customers.containers import CustomerContainer
+from mung_manager.customers.imports import CustomerCsvImportResult
+from mung_manager.customers.selectors.customer_import_jobs import (
+    CustomerImportJobSelector,
+)
+from mung_manager.files.containers import FileContainer
+from mung_manager.reservations.containers import ReservationContainer
+
 
 @shared_task
 def debug_task(self):
     print("Request: {0!r}".format(self.request))
+
+
+@shared_task
+def refresh_korea_special_days():
+    """한국 특별일 버전을 올려 모든 워커의 메모리 공휴일 인덱스를 다시 적재하도록 합니다."""
+    return ReservationContainer.korea_special_day_cache().refresh()
+
+
+# 대량 CSV(5만 행 이상)는 기본 제한 시간(20초)을 넘으므로 작업별 제한 시간을 사용
+@shared_task(bind=True, soft_time_limit=60 * 10, time_limit=60 * 11)
+def import_customers_by_csv(self, customer_import_job_id: int) -> dict:
+    """고객 일괄 등록 작업의 CSV 파일을 청크 단위로 처리하며 청크마다 진행 상황을 결과 백엔드에 저장합니다."""
+
+    def update_progress(import_result: CustomerCsvImportResult) -> None:
+        self.update_state(state=CustomerImportJobSelector.PROGRESS_STATE, meta=import_result.to_progress())
+
+    import_result = CustomerContainer.customer_service().import_customers_by_job(
+        customer_import_job_id=customer_import_job_id,
+        progress_callback=update_progress,
+    )
+    return import_result.to_dict()
+
+
+# AWS S3 오류는 지수 백오프(최대 10분 간격, 지터 포함)로 재시도하며 상태는 결과 백엔드에 저장
+@shared_task(
+    autoretry_for=(Exception,),
+    dont_autoretry_for=(FileNotFoundError,),
+    retry_backoff=True,
+    retry_backoff_max=60 * 10,
+    retry_jitter=True,
+    max_retries=8,
+)
+def push_spooled_file(spool_name: str, upload_path: str) -> str:
+    """스풀 저장소에 저장된 업로드 파일을 AWS S3에 업로드합니다."""
+    return FileContainer.file_storage_service().push_spooled_file(spool_name=spool_name, upload_path=upload_path)
+
+
+# 원본 이미지 업로드가 끝난 뒤 실행되며, 이미 생성된 파생 이미지는 건너뛰므로 재시도해도 안전
+@shared_task(
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=60 * 10,
+    retry_jitter=True,
+    max_retries=3,
+    soft_time_limit=60 * 2,
+    time_limit=60 * 3,
+)
+def create_image_variants(upload_path: str, content_hash: str) -> list[str]:
+    """AWS S3에 업로드된 원본 이미지로 파생 이미지(썸네일)를 생성하여 업로드합니다."""
+    return FileContainer.file_storage_service().create_image_variants(
+        upload_path=upload_path,
+        content_hash=content_hash,
+    )
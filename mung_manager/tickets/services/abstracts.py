@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from mung_manager.errors.exceptions import NotImplementedException
+from mung_manager.pet_kindergardens.tenants import PetKindergardenTenant
 from mung_manager.tickets.models import Ticket
 
 
@@ -8,8 +9,7 @@ class AbstractTicketService(ABC):
     @abstractmethod
     def create_ticket(
         self,
-        pet_kindergarden_id: int,
-        user,
+        tenant: PetKindergardenTenant,
         usage_time: int,
         usage_count: int,
         usage_period_in_days_count: int,
@@ -19,5 +19,5 @@ class AbstractTicketService(ABC):
         raise NotImplementedException()
 
     @abstractmethod
-    def delete_ticket(self, ticket_id: int, pet_kindergarden_id: int, user) -> Ticket:
+    def delete_ticket(self, ticket_id: int, tenant: PetKindergardenTenant) -> Ticket:
         raise NotImplementedException()
@@ -0,0 +1,94 @@
+from typing import Callable, NamedTuple, Optional
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from mung_manager.users.models import User
+
+
+class UserPrincipal(NamedTuple):
+    """이 클래스는 인증과 인가에 필요한 유저 정보를 캐시하기 위한 객체입니다.
+
+    비밀번호 해시는 저장하지 않고 토큰 폐기 검증에 필요한 다이제스트만 저장합니다.
+
+    Attributes:
+        field_values (tuple): 비밀번호를 제외한 유저 필드 값 (모델 필드 순서)
+        password_digest (str): 비밀번호 해시의 md5 다이제스트
+        group_ids (frozenset[int]): 유저가 속한 그룹 아이디 집합
+    """
+
+    field_values: tuple
+    password_digest: str
+    group_ids: frozenset[int]
+
+    @classmethod
+    def from_user(cls, user: User, group_ids: list[int]) -> "UserPrincipal":
+        return cls(
+            field_values=tuple(getattr(user, field.attname) for field in cls.get_fields()),
+            password_digest=get_md5_hash_password(user.password),
+            group_ids=frozenset(group_ids),
+        )
+
+    @classmethod
+    def get_fields(cls) -> list:
+        return [field for field in User._meta.concrete_fields if field.attname != "password"]
+
+    def to_user(self) -> User:
+        """이 함수는 캐시된 필드 값으로 DB에서 조회한 것과 같은 유저 객체를 생성합니다.
+
+        비밀번호 필드는 지연 로딩되므로 접근하는 경우에만 조회합니다.
+
+        Returns:
+            User: 유저 객체
+        """
+        field_names = [field.attname for field in self.get_fields()]
+        user = User.from_db(DEFAULT_DB_ALIAS, field_names, self.field_values)
+        user.group_ids = self.group_ids  # type: ignore
+        return user
+
+
+class UserPrincipalCache:
+    """이 클래스는 JWT 인증 유저의 인증/인가 정보를 짧은 시간 동안 캐시합니다.
+
+    유저 정보나 그룹이 변경되면 delete로 명시적으로 무효화해야 하며,
+    관리자 페이지 등 서비스를 거치지 않은 변경은 TIMEOUT 이후 반영됩니다.
+    """
+
+    KEY_PREFIX = "user-principal"
+    TIMEOUT = 60
+
+    def get_or_set(self, user_id: int, default: Callable[[], Optional[UserPrincipal]]) -> Optional[UserPrincipal]:
+        """이 함수는 유저 인증 정보 캐시를 조회하며, 없으면 default로 생성하여 저장합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+            default (Callable[[], Optional[UserPrincipal]]): 캐시가 없을 경우 인증 정보를 조회하는 함수
+
+        Returns:
+            Optional[UserPrincipal]: 유저 인증 정보이며 유저가 없으면 None을 반환
+        """
+        key = self._get_key(user_id)
+        principal = cache.get(key)
+        if principal is not None:
+            return principal
+
+        principal = default()
+        if principal is not None:
+            cache.set(key, principal, timeout=self.TIMEOUT)
+        return principal
+
+    def delete(self, user_id: int) -> None:
+        """이 함수는 트랜잭션 커밋 후 유저 인증 정보 캐시를 삭제합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+
+        Returns:
+            None
+        """
+        key = self._get_key(user_id)
+        transaction.on_commit(lambda: cache.delete(key))
+
+    def _get_key(self, user_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{user_id}"
@@ -1,5 +1,6 @@
 from dependency_injector import containers, providers
 
+from mung_manager.users.caches import UserPrincipalCache
 from mung_manager.users.selectors.groups import GroupSelector
 from mung_manager.users.selectors.users import UserSelector
 from mung_manager.users.services.users import UserService
@@ -11,13 +12,16 @@ class UserContainer(containers.DeclarativeContainer):
     Attributes:
         user_selector: 유저 셀렉터
         group_selector: 그룹 셀렉터
+        user_principal_cache: 유저 인증 정보 캐시
         user_service: 유저 서비스
     """
 
     user_selector = providers.Factory(UserSelector)
     group_selector = providers.Factory(GroupSelector)
+    user_principal_cache = providers.Factory(UserPrincipalCache)
     user_service = providers.Factory(
         UserService,
         user_selector=user_selector,
         group_selector=group_selector,
+        user_principal_cache=user_principal_cache,
     )
@@ -6,6 +6,10 @@ from mung_manager.users.models import User
 
 
 class AbstractUserSelector(ABC):
+    @abstractmethod
+    def get_by_id_with_group_ids(self, user_id: int) -> Optional[User]:
+        raise NotImplementedException()
+
     @abstractmethod
     def get_by_social_id(self, social_id: str) -> Optional[User]:
         raise NotImplementedException()
@@ -1,5 +1,8 @@
 from typing import Optional
 
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Q
+
 from mung_manager.users.models import User
 from mung_manager.users.selectors.abstracts import AbstractUserSelector
 
@@ -7,6 +10,24 @@ from mung_manager.users.selectors.abstracts import AbstractUserSelector
 class UserSelector(AbstractUserSelector):
     """이 클래스는 유저를 DB에 PULL하는 비즈니스 로직을 담당합니다."""
 
+    def get_by_id_with_group_ids(self, user_id: int) -> Optional[User]:
+        """이 함수는 유저 아이디로 유저와 유저가 속한 그룹 아이디 리스트를 한 번에 조회합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+
+        Returns:
+            Optional[User]: group_ids 가 추가된 유저 객체이며 존재하지 않으면 None을 반환
+        """
+        try:
+            return (
+                User.objects.filter(id=user_id)
+                .annotate(group_ids=ArrayAgg("groups__id", filter=Q(groups__isnull=False), default=[]))
+                .get()
+            )
+        except User.DoesNotExist:
+            return None
+
     def get_by_social_id(self, social_id: str) -> Optional[User]:
         """이 함수는 소셜 아이디로 유저를 조회합니다.
 
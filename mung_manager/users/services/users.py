@@ -8,6 +8,7 @@ from mung_manager.errors.exceptions import (
     AlreadyExistsException,
     AuthenticationFailedException,
 )
+from mung_manager.users.caches import UserPrincipalCache
 from mung_manager.users.enums import AuthGroup
 from mung_manager.users.models import User
 from mung_manager.users.selectors.groups import GroupSelector
@@ -18,9 +19,15 @@ from mung_manager.users.services.abstracts import AbstractUserService
 class UserService(AbstractUserService):
     """이 클래스는 유저를 DB에 PUSH하는 비즈니스 로직을 담당합니다."""
 
-    def __init__(self, user_selector: UserSelector, group_selector: GroupSelector):
+    def __init__(
+        self,
+        user_selector: UserSelector,
+        group_selector: GroupSelector,
+        user_principal_cache: UserPrincipalCache,
+    ):
         self._user_selector = user_selector
         self._group_selector = group_selector
+        self._user_principal_cache = user_principal_cache
 
     @transaction.atomic
     def create_kakao_user(
@@ -68,6 +75,8 @@ class UserService(AbstractUserService):
             if self._group_selector.exists_by_id_and_user(group_id=AuthGroup.PARTNER.value, user=user) is False:
                 user.groups.add(AuthGroup.PARTNER.value)
 
+            self._user_principal_cache.delete(user.id)
+
         # 유저가 없을 경우 생성
         if user is None:
             user = User.objects.create_kakao_user(
@@ -101,4 +110,7 @@ class UserService(AbstractUserService):
 
         fields = ["name", "email"]
         user, has_updated = update_model(instance=user, fields=fields, data=data)
+
+        if has_updated:
+            self._user_principal_cache.delete(user.id)
         return user
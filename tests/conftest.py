@@ -0,0 +1,45 @@
+import datetime
+
+import pytest
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from mung_manager.pet_kindergardens.models import PetKindergarden
+from mung_manager.users.enums import AuthGroup, UserProvider
+from mung_manager.users.models import User, UserSocialProvider
+from tests.factories import create_pet_kindergarden
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def user(db) -> User:
+    Group.objects.get_or_create(id=AuthGroup.PARTNER.value, defaults={"name": "partner"})
+    UserSocialProvider.objects.get_or_create(id=UserProvider.KAKAO.value, defaults={"name": "kakao"})
+    return User.objects.create_kakao_user(
+        email="partner@mung-manager.com",
+        social_id="partner-social-id",
+        social_provider=UserProvider.KAKAO.value,
+        name="사장님",
+        phone_number="010-1234-5678",
+        gender="M",
+        birth=datetime.date(1990, 1, 1),
+    )
+
+
+@pytest.fixture
+def pet_kindergarden(user) -> PetKindergarden:
+    return create_pet_kindergarden(user=user)
+
+
+@pytest.fixture
+def api_client(user) -> APIClient:
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
@@ -0,0 +1,79 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from kombu.exceptions import OperationalError
+
+from mung_manager.customers.models import Customer, CustomerImportJob, CustomerPet
+
+pytestmark = pytest.mark.django_db
+
+# 양식의 안내 문구(CustomerCsvReader.HEADER_ROW_COUNT개 행) 다음 행부터 고객으로 등록
+CSV_CONTENT = (
+    "고객 일괄 등록 양식\n"
+    "이름, 전화번호, 반려동물 이름(쉼표로 구분)을 입력해주세요.\n"
+    "이름,전화번호,반려동물 이름\n"
+    '김고객,010-1111-1111,"초코,바닐라"\n'
+    "이고객,010-2222-2222,콩이\n"
+    "박고객,01033333333,보리\n"
+)
+
+
+def create_csv_file() -> SimpleUploadedFile:
+    return SimpleUploadedFile("customers.csv", CSV_CONTENT.encode("utf-8"), content_type="text/csv")
+
+
+def test_imports_customers_by_csv_and_reports_job_result(api_client, pet_kindergarden):
+    response = api_client.post(
+        reverse(
+            "api-pet-kindergardens:pet-kindergarden-customers-batch-register",
+            kwargs={"pet_kindergarden_id": pet_kindergarden.id},
+        ),
+        {"csv_file": create_csv_file()},
+        format="multipart",
+    )
+    assert response.status_code == 202
+    customer_import_job_id = response.json()["data"]["id"]
+
+    job_url = reverse(
+        "api-pet-kindergardens:pet-kindergarden-customers-import-jobs-detail",
+        kwargs={"pet_kindergarden_id": pet_kindergarden.id, "customer_import_job_id": customer_import_job_id},
+    )
+    # eager 모드에서는 요청 안에서 작업이 끝나지만 실제 클라이언트와 같이 완료될 때까지 조회
+    for _ in range(10):
+        response = api_client.get(job_url)
+        assert response.status_code == 200
+        customer_import_job = response.json()["data"]
+        if customer_import_job["status"] in ("SUCCESS", "FAILURE"):
+            break
+
+    assert customer_import_job["status"] == "SUCCESS"
+    assert customer_import_job["progress"] is None
+    assert customer_import_job["result"]["createdCount"] == 2
+    assert customer_import_job["result"]["errorCount"] == 1
+    assert [error["rowNumber"] for error in customer_import_job["result"]["errors"]] == [6]
+    assert set(Customer.objects.filter(pet_kindergarden=pet_kindergarden).values_list("name", flat=True)) == {
+        "김고객",
+        "이고객",
+    }
+    assert CustomerPet.objects.filter(customer__pet_kindergarden=pet_kindergarden).count() == 3
+
+
+def test_returns_service_unavailable_when_import_task_cannot_be_enqueued(api_client, pet_kindergarden, mocker):
+    mocker.patch(
+        "mung_manager.pet_kindergardens.apis.customers.apis.import_customers_by_csv.apply_async",
+        side_effect=OperationalError("Error 111 connecting to redis:6379."),
+    )
+
+    response = api_client.post(
+        reverse(
+            "api-pet-kindergardens:pet-kindergarden-customers-batch-register",
+            kwargs={"pet_kindergarden_id": pet_kindergarden.id},
+        ),
+        {"csv_file": create_csv_file()},
+        format="multipart",
+    )
+
+    assert response.status_code == 503
+    assert response.json()["code"] == "service_unavailable"
+    # 처리되지 않을 작업은 남기지 않음
+    assert CustomerImportJob.objects.filter(pet_kindergarden=pet_kindergarden).exists() is False
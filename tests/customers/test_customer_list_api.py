@@ -0,0 +1,24 @@
+import pytest
+from django.urls import reverse
+
+from mung_manager.customers.models import Customer
+from tests.factories import create_customer
+
+pytestmark = pytest.mark.django_db
+
+
+def test_counts_filtered_customers_exactly(api_client, pet_kindergarden):
+    for index in range(15):
+        create_customer(pet_kindergarden=pet_kindergarden, name=f"고객{index}", phone_number=f"010-0000-{index:04d}")
+    Customer.objects.filter(name__in=["고객0", "고객1", "고객2"]).update(is_active=False)
+
+    url = reverse(
+        "api-pet-kindergardens:pet-kindergarden-customers-list",
+        kwargs={"pet_kindergarden_id": pet_kindergarden.id},
+    )
+    response = api_client.get(url, {"is_active": True, "page_size": 10})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["count"] == 12
+    assert len(data["results"]) == 10
@@ -0,0 +1,67 @@
+import datetime
+from decimal import Decimal
+
+from django.contrib.gis.geos import Point
+from django.utils import timezone
+
+from mung_manager.customers.models import Customer, CustomerPet, CustomerTicket
+from mung_manager.pet_kindergardens.enums import (
+    ReservationAvailabilityOption,
+    ReservationChangeOption,
+)
+from mung_manager.pet_kindergardens.models import PetKindergarden
+from mung_manager.tickets.enums import TicketType
+from mung_manager.tickets.models import Ticket
+from mung_manager.users.models import User
+
+
+def create_pet_kindergarden(user: User, daily_pet_limit: int = -1) -> PetKindergarden:
+    return PetKindergarden.objects.create(
+        name="멍매니저 유치원",
+        main_thumbnail_url="https://mung-manager.com/main.png",
+        profile_thumbnail_url="https://mung-manager.com/profile.png",
+        visible_phone_number=["010-1234-5678", ""],
+        business_start_hour=datetime.time(9, 0),
+        business_end_hour=datetime.time(21, 0),
+        road_address="서울특별시 강남구 테헤란로 1",
+        abbr_address="서울특별시 강남구 역삼동 1",
+        short_address=["서울특별시", "강남구", "역삼동"],
+        latitude=Decimal("37.500000"),
+        longitude=Decimal("127.036000"),
+        point=Point(127.036, 37.5, srid=4326),
+        reservation_availability_option=ReservationAvailabilityOption.SAME_DAY_AVAILABILITY.value,
+        reservation_change_option=ReservationChangeOption.SAME_DAY_CHANGE.value,
+        daily_pet_limit=daily_pet_limit,
+        user=user,
+    )
+
+
+def create_customer(pet_kindergarden: PetKindergarden, name: str, phone_number: str) -> Customer:
+    return Customer.objects.create(
+        name=name,
+        phone_number=phone_number,
+        pet_kindergarden=pet_kindergarden,
+    )
+
+
+def create_customer_pet(customer: Customer, name: str) -> CustomerPet:
+    return CustomerPet.objects.create(name=name, customer=customer)
+
+
+def create_customer_ticket(customer: Customer, ticket_type: TicketType, usage_count: int) -> CustomerTicket:
+    ticket = Ticket.objects.create(
+        usage_time=24 if ticket_type == TicketType.HOTEL else 8,
+        usage_count=usage_count,
+        usage_period_in_days_count=365,
+        price=10000,
+        ticket_type=ticket_type.value,
+        pet_kindergarden=customer.pet_kindergarden,
+    )
+    return CustomerTicket.objects.create(
+        expired_at=timezone.now() + datetime.timedelta(days=365),
+        total_count=usage_count,
+        used_count=0,
+        unused_count=usage_count,
+        ticket=ticket,
+        customer=customer,
+    )
@@ -0,0 +1,38 @@
+import io
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from kombu.exceptions import OperationalError
+from PIL import Image
+
+from mung_manager.files.images import get_content_hash
+from mung_manager.files.storages import get_spool_storage
+
+pytestmark = pytest.mark.django_db
+
+
+def create_png_file() -> SimpleUploadedFile:
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), color=(255, 0, 0)).save(buffer, format="PNG")
+    return SimpleUploadedFile("image.png", buffer.getvalue(), content_type="image/png")
+
+
+def test_returns_service_unavailable_when_upload_task_cannot_be_enqueued(api_client, mocker):
+    upload_chain = mocker.patch("mung_manager.files.apis.apis.chain")
+    upload_chain.return_value.delay.side_effect = OperationalError("Error 111 connecting to redis:6379.")
+    png_file = create_png_file()
+    content_hash = get_content_hash(png_file)
+    png_file.seek(0)
+
+    response = api_client.post(
+        reverse("api-files:file-upload"),
+        {"file": png_file, "resource_type": "pet_kindergarden"},
+        format="multipart",
+    )
+
+    assert response.status_code == 503
+    assert response.json()["code"] == "service_unavailable"
+    # 업로드되지 않을 스풀 파일은 남기지 않음
+    spool_name = f"images/pet-kindergarden/{content_hash[:2]}/{content_hash}.png"
+    assert get_spool_storage().exists(spool_name) is False
@@ -0,0 +1,89 @@
+import io
+import json
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from django.core.files import File
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from mung_manager.pet_kindergardens.containers import PetKindergardenContainer
+from mung_manager.pet_kindergardens.models import RawPetKindergarden
+
+pytestmark = pytest.mark.django_db
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def import_raw_pet_kindergardens(path: Path, file_format: str):
+    raw_pet_kindergarden_service = PetKindergardenContainer.raw_pet_kindergarden_service()
+    with path.open("rb") as file_obj:
+        return raw_pet_kindergarden_service.import_raw_pet_kindergardens(
+            file=File(file_obj, name=path.name),
+            file_format=file_format,
+            batch_size=2,
+        )
+
+
+@pytest.mark.parametrize("file_format", ["json", "jsonl", "csv"])
+def test_imports_raw_pet_kindergardens_idempotently(file_format):
+    path = FIXTURES_DIR / f"raw_pet_kindergardens.{file_format}"
+
+    # 레코드 5건 중 도로명 주소가 없는 1건은 건너뛰고, 전화번호와 주소가 같은 2건은 마지막 레코드만 추가
+    first_result = import_raw_pet_kindergardens(path, file_format)
+    assert (first_result.read_count, first_result.skipped_count) == (5, 1)
+    assert (first_result.created_count, first_result.updated_count) == (3, 0)
+
+    # 같은 파일을 다시 적재하면 바뀐 값이 없으므로 추가, 갱신하지 않음
+    second_result = import_raw_pet_kindergardens(path, file_format)
+    assert (second_result.read_count, second_result.skipped_count) == (5, 1)
+    assert (second_result.created_count, second_result.updated_count) == (0, 0)
+
+    raw_pet_kindergardens = RawPetKindergarden.objects.order_by("tel")
+    assert [raw_pet_kindergarden.name for raw_pet_kindergarden in raw_pet_kindergardens] == [
+        "멍멍 유치원 역삼점",
+        "왈왈 호텔",
+        "바다 유치원",
+    ]
+    assert raw_pet_kindergardens[0].short_address == ["서울특별시", "강남구", "역삼동"]
+    for raw_pet_kindergarden in raw_pet_kindergardens:
+        assert raw_pet_kindergarden.point is not None
+        assert Decimal(str(raw_pet_kindergarden.point.x)).quantize(Decimal("0.000001")) == raw_pet_kindergarden.x
+        assert Decimal(str(raw_pet_kindergarden.point.y)).quantize(Decimal("0.000001")) == raw_pet_kindergarden.y
+
+
+def test_updates_only_changed_raw_pet_kindergardens():
+    path = FIXTURES_DIR / "raw_pet_kindergardens.json"
+    import_raw_pet_kindergardens(path, "json")
+
+    records = json.loads(path.read_text(encoding="utf-8"))
+    records[1]["name"] = "왈왈 호텔 시청점"
+    records[3]["x"], records[3]["y"] = "129.170000", "35.170000"
+    changed_file = File(io.BytesIO(json.dumps(records, ensure_ascii=False).encode("utf-8")), name="changed.json")
+
+    result = PetKindergardenContainer.raw_pet_kindergarden_service().import_raw_pet_kindergardens(
+        file=changed_file,
+        file_format="json",
+    )
+
+    assert (result.created_count, result.updated_count, result.skipped_count) == (0, 2, 1)
+    assert RawPetKindergarden.objects.filter(name="왈왈 호텔 시청점").exists()
+    moved_raw_pet_kindergarden = RawPetKindergarden.objects.get(tel="051-444-4444")
+    assert (moved_raw_pet_kindergarden.point.x, moved_raw_pet_kindergarden.point.y) == pytest.approx((129.17, 35.17))
+
+
+def test_rebuilds_only_gin_and_gist_indexes():
+    path = FIXTURES_DIR / "raw_pet_kindergardens.jsonl"
+
+    with CaptureQueriesContext(connection) as context:
+        import_raw_pet_kindergardens(path, "jsonl")
+
+    reindex_queries = [query["sql"] for query in context.captured_queries if query["sql"].startswith("REINDEX")]
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, RawPetKindergarden._meta.db_table)
+    expected_index_names = {name for name, constraint in constraints.items() if constraint["type"] in ("gin", "gist")}
+
+    assert {"raw_pet_kg_name_trgm_idx", "raw_pet_kg_road_addr_trgm_idx"} < expected_index_names
+    assert len(expected_index_names) == 3
+    assert sorted(reindex_queries) == sorted(f'REINDEX INDEX "{name}"' for name in expected_index_names)
@@ -0,0 +1,55 @@
+import datetime as dt
+
+import pytest
+from django.contrib.gis.geos import Point
+from django.urls import reverse
+
+from mung_manager.pet_kindergardens.containers import PetKindergardenContainer
+from mung_manager.pet_kindergardens.models import RawPetKindergarden
+
+pytestmark = pytest.mark.django_db
+
+
+def create_raw_pet_kindergarden(name: str) -> RawPetKindergarden:
+    return RawPetKindergarden.objects.create(
+        thum_url="https://mung-manager.com/raw/1.png",
+        tel="02-111-1111",
+        name=name,
+        x="127.036000",
+        y="37.500000",
+        business_start_hour=dt.time(9, 0),
+        business_end_hour=dt.time(21, 0),
+        address="서울특별시 강남구 역삼동 1",
+        road_address="서울특별시 강남구 테헤란로 1",
+        abbr_address="역삼동 1",
+        short_address=["서울특별시", "강남구", "역삼동"],
+        point=Point(127.036, 37.5, srid=4326),
+    )
+
+
+@pytest.mark.parametrize(
+    "keyword",
+    ["멍멍유치원abc", "멍멍 유치원 ABC", "멍멍　유치원\tＡＢＣ", "유치원ａｂ", "멍머"],
+)
+def test_searches_raw_pet_kindergardens_with_the_same_normalization(keyword):
+    # 전각 공백(U+3000)과 전각 영문은 NFKD 정규화로 일반 공백과 영문이 됨
+    raw_pet_kindergarden = create_raw_pet_kindergarden(name="멍멍　유치원 ＡＢＣ")
+
+    raw_pet_kindergardens = PetKindergardenContainer.raw_pet_kindergarden_selector().get_queryset_by_name(keyword)
+
+    assert [raw_pet_kindergarden.id for raw_pet_kindergarden in raw_pet_kindergardens] == [raw_pet_kindergarden.id]
+
+
+def test_includes_distance_only_when_searching_by_location(api_client):
+    create_raw_pet_kindergarden(name="멍멍 유치원")
+    url = reverse("api-pet-kindergardens:pet-kindergarden-search")
+
+    name_response = api_client.get(url, {"name": "멍멍"})
+    location_response = api_client.get(url, {"latitude": 37.5, "longitude": 127.037})
+
+    assert name_response.status_code == 200
+    [name_result] = name_response.json()["data"]["results"]
+    assert "distance" not in name_result
+    assert location_response.status_code == 200
+    [location_result] = location_response.json()["data"]["results"]
+    assert location_result["distance"] == pytest.approx(88.4, abs=1)
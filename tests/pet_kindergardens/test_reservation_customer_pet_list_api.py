@@ -0,0 +1,62 @@
+import pytest
+from django.urls import reverse
+
+from tests.factories import create_customer, create_customer_pet
+
+pytestmark = pytest.mark.django_db
+
+
+def test_paginates_customer_pets_with_tied_ranks(api_client, pet_kindergarden):
+    # "초코" 와 "초코바" 의 트라이그램 유사도는 real 로 정확히 표현되지 않는 값이며 모든 반려동물이 같은 값을 가짐
+    customer_pet_ids = []
+    for index in range(25):
+        customer = create_customer(
+            pet_kindergarden=pet_kindergarden,
+            name="김고객",
+            phone_number=f"010-0000-{index:04d}",
+        )
+        customer_pet_ids.append(create_customer_pet(customer=customer, name="초코바").id)
+
+    url = reverse(
+        "api-pet-kindergardens:pet-kindergarden-reservations-customers-pets-list",
+        kwargs={"pet_kindergarden_id": pet_kindergarden.id},
+    )
+    response = api_client.get(url, {"keyword": "초코", "page_size": 10})
+
+    paginated_ids = []
+    page_count = 0
+    while True:
+        assert response.status_code == 200
+        data = response.json()["data"]
+        paginated_ids.extend(customer_pet["id"] for customer_pet in data["results"])
+        page_count += 1
+        if data["next"] is None:
+            break
+        assert page_count < 5, "다음 페이지 커서가 같은 행을 반복해서 반환합니다."
+        response = api_client.get(data["next"])
+
+    assert page_count == 3
+    assert paginated_ids == sorted(customer_pet_ids, reverse=True)
+
+
+def test_paginates_customer_pets_backwards_with_tied_ranks(api_client, pet_kindergarden):
+    customer_pet_ids = []
+    for index in range(15):
+        customer = create_customer(
+            pet_kindergarden=pet_kindergarden,
+            name="김고객",
+            phone_number=f"010-0000-{index:04d}",
+        )
+        customer_pet_ids.append(create_customer_pet(customer=customer, name="초코바").id)
+
+    url = reverse(
+        "api-pet-kindergardens:pet-kindergarden-reservations-customers-pets-list",
+        kwargs={"pet_kindergarden_id": pet_kindergarden.id},
+    )
+    first_page = api_client.get(url, {"keyword": "초코", "page_size": 10}).json()["data"]
+    second_page = api_client.get(first_page["next"]).json()["data"]
+    previous_page = api_client.get(second_page["previous"]).json()["data"]
+
+    expected_ids = sorted(customer_pet_ids, reverse=True)
+    assert [customer_pet["id"] for customer_pet in second_page["results"]] == expected_ids[10:]
+    assert [customer_pet["id"] for customer_pet in previous_page["results"]] == expected_ids[:10]
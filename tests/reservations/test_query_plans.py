@@ -0,0 +1,105 @@
+import datetime as dt
+from typing import Iterator
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from mung_manager.reservations.containers import ReservationContainer
+
+pytestmark = pytest.mark.django_db
+
+
+def explain(sql: str) -> dict:
+    """순차 탐색을 비활성화한 뒤 쿼리의 실행 계획을 조회합니다.
+
+    순차 탐색 외에 사용할 수 있는 경로가 없을 때만 Seq Scan이 선택되므로
+    테이블 크기와 관계없이 인덱스를 사용할 수 있는 쿼리인지 확인할 수 있습니다.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+        return cursor.fetchone()[0][0]["Plan"]
+
+
+def iter_plan_nodes(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child_plan in plan.get("Plans", []):
+        yield from iter_plan_nodes(child_plan)
+
+
+def capture_query_sql(table: str, func) -> str:
+    with CaptureQueriesContext(connection) as context:
+        func()
+    queries = [query["sql"] for query in context.captured_queries if f'FROM "{table}"' in query["sql"]]
+    assert len(queries) == 1, queries
+    return queries[0]
+
+
+def assert_uses_indexes(sql: str, index_names: set[str]) -> None:
+    plan_nodes = list(iter_plan_nodes(explain(sql)))
+    seq_scans = [node["Relation Name"] for node in plan_nodes if node["Node Type"] == "Seq Scan"]
+    assert seq_scans == [], f"Seq Scan on {seq_scans}"
+    used_index_names = {node["Index Name"] for node in plan_nodes if "Index Name" in node}
+    assert index_names <= used_index_names, used_index_names
+
+
+def test_daily_reservation_list_uses_reserved_at_index(pet_kindergarden):
+    reservation_selector = ReservationContainer.reservation_selector()
+    sql = capture_query_sql(
+        "reservation",
+        lambda: reservation_selector.get_queryset_for_ticket_type_uncanceld_reservations(
+            pet_kindergarden_id=pet_kindergarden.id,
+            reserved_at=dt.date(2024, 5, 1),
+        ),
+    )
+
+    assert_uses_indexes(sql, {"reservation_pk_reserved_idx"})
+
+
+def test_duplicated_reservation_check_uses_customer_pet_index(pet_kindergarden):
+    pet_kindergarden_selector = ReservationContainer.pet_kindergarden_selector()
+    sql = capture_query_sql(
+        "pet_kindergarden",
+        lambda: pet_kindergarden_selector.get_by_id_for_reservation(
+            pet_kindergarden_id=pet_kindergarden.id,
+            customer_id=1,
+            customer_pet_id=1,
+            reserved_at=dt.datetime(2024, 5, 1, 10, 0, 0),
+            end_at=dt.datetime(2024, 5, 3, 10, 0, 0),
+        ),
+    )
+
+    assert_uses_indexes(sql, {"reservation_pet_reserved_idx", "day_off_pk_day_off_at_idx"})
+
+
+def test_day_off_month_list_uses_day_off_at_index(pet_kindergarden):
+    day_off_selector = ReservationContainer.day_off_selector()
+    sql = capture_query_sql(
+        "day_off",
+        lambda: list(
+            day_off_selector.get_queryset_by_pet_kindergarden_id_and_day_off_at(
+                pet_kindergarden_id=pet_kindergarden.id,
+                year=2024,
+                month=5,
+            )
+        ),
+    )
+
+    assert_uses_indexes(sql, {"day_off_pk_day_off_at_idx"})
+
+
+def test_daily_reservation_month_list_uses_pet_kindergarden_reserved_at_constraint(pet_kindergarden):
+    daily_reservation_selector = ReservationContainer.daily_reservation_selector()
+    sql = capture_query_sql(
+        "daily_reservation",
+        lambda: list(
+            daily_reservation_selector.get_queryset_by_year_and_month_and_pet_kindergarden_id(
+                year=2024,
+                month=5,
+                pet_kindergarden_id=pet_kindergarden.id,
+            )
+        ),
+    )
+
+    assert_uses_indexes(sql, {"unique_daily_reservation_pet_kindergarden_reserved_at"})
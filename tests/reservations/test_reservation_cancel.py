@@ -0,0 +1,73 @@
+import datetime as dt
+
+import pytest
+
+from mung_manager.customers.models import CustomerTicket
+from mung_manager.pet_kindergardens.tenants import PetKindergardenTenant
+from mung_manager.reservations.containers import ReservationContainer
+from mung_manager.reservations.models import DailyReservation
+from mung_manager.tickets.enums import TicketType
+from tests.reservations.test_reservation_concurrency import create_reservation_request
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def tenant(user, pet_kindergarden) -> PetKindergardenTenant:
+    return PetKindergardenTenant(pet_kindergarden_id=pet_kindergarden.id, user=user)
+
+
+def test_cancels_all_day_reservation_and_refunds_customer_ticket(tenant, pet_kindergarden):
+    reservation_service = ReservationContainer.reservation_service()
+    reserved_date = dt.date.today() + dt.timedelta(days=7)
+    requests = [
+        create_reservation_request(
+            pet_kindergarden,
+            index=index,
+            ticket_type=TicketType.ALL_DAY,
+            reserved_at=dt.datetime.combine(reserved_date, dt.time(0, 0, 0)),
+            end_at=dt.datetime.combine(reserved_date, dt.time(23, 59, 59)),
+        )
+        for index in range(2)
+    ]
+    reservations = [reservation_service.register_reservation(tenant=tenant, **request) for request in requests]
+
+    reservation_service.cancel_reservation(tenant=tenant, reservation_id=reservations[0].id)
+
+    daily_reservation = DailyReservation.objects.get(pet_kindergarden=pet_kindergarden, reserved_at=reserved_date)
+    assert (daily_reservation.total_pet_count, daily_reservation.all_day_pet_count) == (1, 1)
+    refunded_customer_ticket = CustomerTicket.objects.get(id=requests[0]["customer_ticket_ids"][0])
+    assert (refunded_customer_ticket.used_count, refunded_customer_ticket.unused_count) == (0, 10)
+    used_customer_ticket = CustomerTicket.objects.get(id=requests[1]["customer_ticket_ids"][0])
+    assert (used_customer_ticket.used_count, used_customer_ticket.unused_count) == (1, 9)
+
+
+def test_cancels_hotel_reservation_without_negative_pet_counts(tenant, pet_kindergarden):
+    reservation_service = ReservationContainer.reservation_service()
+    check_in_date = dt.date.today() + dt.timedelta(days=7)
+    request = create_reservation_request(
+        pet_kindergarden,
+        index=0,
+        ticket_type=TicketType.HOTEL,
+        reserved_at=dt.datetime.combine(check_in_date, dt.time(10, 0, 0)),
+        end_at=dt.datetime.combine(check_in_date + dt.timedelta(days=2), dt.time(10, 0, 0)),
+    )
+    reservation = reservation_service.register_reservation(tenant=tenant, **request)
+    # 입실일의 반려동물 수가 이미 0인 경우에도 음수로 감소하지 않아야 함
+    DailyReservation.objects.filter(pet_kindergarden=pet_kindergarden, reserved_at=check_in_date).update(
+        total_pet_count=0,
+        hotel_pet_count=0,
+    )
+
+    reservation_service.cancel_reservation(tenant=tenant, reservation_id=reservation.id)
+
+    daily_reservations = DailyReservation.objects.filter(pet_kindergarden=pet_kindergarden).order_by("reserved_at")
+    assert [daily_reservation.reserved_at for daily_reservation in daily_reservations] == [
+        check_in_date + dt.timedelta(days=day) for day in range(3)
+    ]
+    assert all(
+        (daily_reservation.total_pet_count, daily_reservation.hotel_pet_count) == (0, 0)
+        for daily_reservation in daily_reservations
+    )
+    customer_ticket = CustomerTicket.objects.get(id=request["customer_ticket_ids"][0])
+    assert (customer_ticket.used_count, customer_ticket.unused_count) == (0, 10)
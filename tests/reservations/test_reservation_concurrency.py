@@ -0,0 +1,128 @@
+import datetime as dt
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.db import connection
+
+from mung_manager.errors.exceptions import ValidationException
+from mung_manager.pet_kindergardens.tenants import PetKindergardenTenant
+from mung_manager.reservations.containers import ReservationContainer
+from mung_manager.reservations.models import DailyReservation, Reservation
+from mung_manager.tickets.enums import TicketType
+from tests.factories import (
+    create_customer,
+    create_customer_pet,
+    create_customer_ticket,
+    create_pet_kindergarden,
+)
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+# 예약 요청 하나가 다른 요청의 행 잠금을 기다리다 멈추면 교착 상태로 판단
+REGISTER_TIMEOUT_SECONDS = 30
+
+
+def register_reservations_concurrently(tenant: PetKindergardenTenant, requests: list[dict]) -> list:
+    """모든 스레드가 준비된 뒤 동시에 예약을 등록하고 요청 순서대로 예약 또는 발생한 예외를 반환합니다."""
+    barrier = threading.Barrier(len(requests))
+
+    def register(request: dict):
+        try:
+            barrier.wait()
+            return ReservationContainer.reservation_service().register_reservation(tenant=tenant, **request)
+        except Exception as e:
+            return e
+        finally:
+            # 스레드마다 생성된 DB 연결을 닫아야 테스트 DB를 삭제할 수 있음
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+        futures = [executor.submit(register, request) for request in requests]
+        return [future.result(timeout=REGISTER_TIMEOUT_SECONDS) for future in futures]
+
+
+def create_reservation_request(pet_kindergarden, index: int, ticket_type: TicketType, reserved_at, end_at) -> dict:
+    customer = create_customer(
+        pet_kindergarden=pet_kindergarden,
+        name=f"고객{index}",
+        phone_number=f"010-0000-{index:04d}",
+    )
+    customer_pet = create_customer_pet(customer=customer, name=f"반려동물{index}")
+    customer_ticket = create_customer_ticket(customer=customer, ticket_type=ticket_type, usage_count=10)
+    return {
+        "customer_ticket_ids": [customer_ticket.id],
+        "customer_id": customer.id,
+        "customer_pet_id": customer_pet.id,
+        "reserved_at": reserved_at,
+        "end_at": end_at,
+    }
+
+
+def test_registers_only_daily_pet_limit_reservations_on_the_same_day(user):
+    daily_pet_limit = 5
+    pet_kindergarden = create_pet_kindergarden(user=user, daily_pet_limit=daily_pet_limit)
+    tenant = PetKindergardenTenant(pet_kindergarden_id=pet_kindergarden.id, user=user)
+    reserved_date = dt.date.today() + dt.timedelta(days=7)
+    requests = [
+        create_reservation_request(
+            pet_kindergarden,
+            index=index,
+            ticket_type=TicketType.ALL_DAY,
+            reserved_at=dt.datetime.combine(reserved_date, dt.time(0, 0, 0)),
+            end_at=dt.datetime.combine(reserved_date, dt.time(23, 59, 59)),
+        )
+        for index in range(daily_pet_limit * 3)
+    ]
+
+    results = register_reservations_concurrently(tenant, requests)
+
+    reservations = [result for result in results if isinstance(result, Reservation)]
+    errors = [result for result in results if not isinstance(result, Reservation)]
+    assert len(reservations) == daily_pet_limit
+    assert all(isinstance(error, ValidationException) for error in errors), errors
+    assert {error.get_codes() for error in errors} == {"over_daily_pet_limit"}
+
+    daily_reservation = DailyReservation.objects.get(pet_kindergarden=pet_kindergarden, reserved_at=reserved_date)
+    assert daily_reservation.total_pet_count == daily_pet_limit
+    assert daily_reservation.all_day_pet_count == daily_pet_limit
+    assert Reservation.objects.filter(pet_kindergarden=pet_kindergarden).count() == daily_pet_limit
+
+
+def test_registers_overlapping_hotel_reservations_without_deadlock(user):
+    pet_kindergarden = create_pet_kindergarden(user=user, daily_pet_limit=-1)
+    tenant = PetKindergardenTenant(pet_kindergarden_id=pet_kindergarden.id, user=user)
+    first_date = dt.date.today() + dt.timedelta(days=7)
+    # 시작일과 박수가 서로 다른 연박 예약이 날짜 범위를 겹쳐서 잠그도록 구성
+    stays = [(index % 4, 1 + index % 3) for index in range(12)]
+    requests = [
+        create_reservation_request(
+            pet_kindergarden,
+            index=index,
+            ticket_type=TicketType.HOTEL,
+            reserved_at=dt.datetime.combine(first_date + dt.timedelta(days=start), dt.time(10, 0, 0)),
+            end_at=dt.datetime.combine(first_date + dt.timedelta(days=start + nights), dt.time(10, 0, 0)),
+        )
+        for index, (start, nights) in enumerate(stays)
+    ]
+
+    results = register_reservations_concurrently(tenant, requests)
+
+    errors = [result for result in results if not isinstance(result, Reservation)]
+    assert errors == []
+
+    # 입실일부터 퇴실일까지의 날짜마다 호텔 반려동물 수를 증가
+    expected_pet_counts: dict[dt.date, int] = {}
+    for start, nights in stays:
+        for day in range(start, start + nights + 1):
+            reserved_date = first_date + dt.timedelta(days=day)
+            expected_pet_counts[reserved_date] = expected_pet_counts.get(reserved_date, 0) + 1
+
+    daily_reservations = DailyReservation.objects.filter(pet_kindergarden=pet_kindergarden)
+    assert {
+        daily_reservation.reserved_at: daily_reservation.hotel_pet_count for daily_reservation in daily_reservations
+    } == expected_pet_counts
+    assert all(
+        daily_reservation.total_pet_count == daily_reservation.hotel_pet_count
+        for daily_reservation in daily_reservations
+    )